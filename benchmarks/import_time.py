@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Import time benchmark for werpy.
+
+This script measures how long `import werpy` takes in a fresh interpreter, next to
+`import numpy` as the baseline that werpy cannot avoid, and checks that pandas is
+only imported once `summary` is called. It exits with a non-zero status if pandas is
+imported with the package or if werpy adds more than MAX_OVERHEAD seconds on top
+of NumPy, so it can be used as a regression guard.
+"""
+
+import subprocess
+import sys
+
+n_repeats = 10  # Number of fresh interpreters per measurement
+MAX_OVERHEAD = 0.05  # Seconds werpy may add on top of NumPy
+
+
+def import_time(statement):
+    """Best time in seconds of running statement in a fresh interpreter."""
+    code = f"import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+    return min(
+        float(subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout)
+        for _ in range(n_repeats)
+    )
+
+
+numpy_time = import_time("import numpy")
+werpy_time = import_time("import werpy")
+summary_time = import_time("import werpy; werpy.summary('a', 'a')")
+pandas_loaded = subprocess.run(
+    [sys.executable, "-c", "import sys, werpy; print('pandas' in sys.modules)"],
+    check=True, capture_output=True, text=True,
+).stdout.strip() == "True"
+
+# --- Print CLI-friendly table ---
+print("\n Import Time Benchmark:\n")
+print(f"{'Statement':<30} {'Time (s)':<12}")
+print("-" * 42)
+print(f"{'import numpy':<30} {numpy_time:.6f}")
+print(f"{'import werpy':<30} {werpy_time:.6f}")
+print(f"{'first werpy.summary() call':<30} {summary_time:.6f}")
+print(f"\npandas imported with werpy: {pandas_loaded}")
+
+if pandas_loaded or werpy_time - numpy_time > MAX_OVERHEAD:
+    sys.exit("Import time regression: werpy should import in close to the time of NumPy, without pandas.")
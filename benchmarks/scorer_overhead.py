@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Per-call overhead benchmark for single-pair scoring.
+
+This script compares the time per call of werpy.wer() and of a reusable
+werpy.Scorer on one short reference and hypothesis pair, the workload of an
+online evaluation service that scores one pair per request.
+"""
+
+import timeit
+
+import werpy
+
+reference = "the quick brown fox jumps over the lazy dog"
+hypothesis = "the quick brown fox jumped over a lazy dog"
+
+score = werpy.Scorer()
+score_normalized = werpy.Scorer(normalize=True)
+
+tools = {
+    "wer()": lambda: werpy.wer(reference, hypothesis),
+    "Scorer()": lambda: score(reference, hypothesis),
+    "Scorer(normalize=True)": lambda: score_normalized(reference, hypothesis),
+}
+
+# --- Run + time each call using timeit ---
+n_calls = 100_000  # Calls per repeat
+n_repeats = 5  # Best of n_repeats
+
+print("\n Single Pair Scoring Overhead:\n")
+print(f"{'Call':<25} {'WER':<8} {'Time per call (us)':<20}")
+print("-" * 55)
+for name, func in tools.items():
+    best = min(timeit.repeat(func, number=n_calls, repeat=n_repeats))
+    print(f"{name:<25} {func():.4f}   {best / n_calls * 1e6:.2f}")
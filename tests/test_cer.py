@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+test_cer.py
+
+This module contains a set of unit tests for the 'cer' function in the 'werpy' package.
+The 'cer' function is responsible for calculating the Character Error Rate (CER) between
+reference and hypothesis text sequences.
+
+The module defines the 'TestCer' class, which includes multiple test methods to ensure
+the correctness and reliability of the 'cer' function. These tests cover single strings,
+multiple reference and hypothesis strings, and text in scripts that are not written with
+spaces between words.
+
+To run the tests, execute this module as the main program.
+
+For more details on the 'cer' function and how to use it, please refer to the 'werpy' package documentation.
+
+Note: If the 'cer' module is not imported successfully, an ImportError is raised
+to ensure that the required module is available for testing.
+"""
+
+import unittest
+from werpy.cer import cer
+
+
+class TestCer(unittest.TestCase):
+    """
+    This class contains unit tests for the 'cer' function, which calculates the Character Error Rate (CER)
+    between reference and hypothesis text sequences.
+    """
+
+    def test_cer_example_1(self):
+        """
+        Test the cer function with a single pair of strings.
+
+        'kitten' becomes 'sitting' with two substitutions and one insertion, giving a CER of 3 / 6.
+        """
+        self.assertEqual(cer("kitten", "sitting"), 0.5)
+
+    def test_cer_example_2(self):
+        """
+        Test the cer function with lists of strings in different scripts.
+
+        The CER is the total number of character edits divided by the total number of reference characters. Inner
+        spaces count as characters, while leading and trailing whitespace is ignored.
+        """
+        ref = ["我爱冷披萨", "ฉันรักพิซซ่า", "  the cat  "]
+        hyp = ["我爱披萨", "ฉันรักพิซซา", "the hat"]
+
+        self.assertEqual(cer(ref, hyp), 3 / 24)
+
+    def test_cer_blank_reference(self):
+        """
+        Test the cer function with a blank reference, which is reported and returns None.
+        """
+        self.assertEqual(cer("   ", "abc"), None)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+test_cer_summary.py
+
+This module contains a set of unit tests for the 'cer_summary' function in the 'werpy' package.
+
+The 'cer_summary' function provides a breakdown of the Character Error Rate (CER) of each reference and hypothesis
+text pair, with the Levenshtein distance and the character insertions, deletions and substitutions.
+
+To run the tests, execute this module as the main program.
+
+For more details on the 'cer_summary' function and how to use it, please refer to the 'werpy' package documentation.
+
+Note: If the 'cer_summary' module is not imported successfully, an ImportError is raised
+to ensure that the required module is available for testing.
+"""
+
+import random
+import unittest
+import numpy as np
+from werpy.cer_summary import cer_summary
+from werpy.cers import cers
+
+
+class TestCerSummary(unittest.TestCase):
+    """
+    This class contains unit tests for the 'cer_summary' function, which provides a breakdown of the Character Error
+    Rate of each reference and hypothesis text pair.
+    """
+
+    def test_cer_summary_example_1(self):
+        """
+        Test the cer_summary function with a single pair of strings.
+
+        This test verifies the CER, Levenshtein distance, reference length and character error counts of one row.
+        """
+        actual_result = cer_summary("kitten", "sitting")
+
+        self.assertEqual(actual_result.columns.tolist(), ["cer", "ld", "m", "insertions", "deletions", "substitutions"])
+        self.assertEqual(actual_result.iloc[0].tolist(), [0.5, 3.0, 6.0, 1.0, 0.0, 2.0])
+
+    def test_cer_summary_example_2(self):
+        """
+        Test the cer_summary function with lists of strings.
+
+        This test verifies that the CER column matches cers, that every Levenshtein distance is the sum of the error
+        counts, and that the result is the same across several threads.
+        """
+        rng = random.Random(3)
+        ref = ["".join(rng.choice("ab 猫👍") for _ in range(rng.randint(1, 30))) + "x" for _ in range(200)]
+        hyp = ["".join(rng.choice("ab 猫👍") for _ in range(rng.randint(0, 30))) for _ in range(200)]
+        actual_result = cer_summary(ref, hyp)
+
+        self.assertEqual(actual_result["cer"].tolist(), cers(ref, hyp))
+        counts = actual_result[["insertions", "deletions", "substitutions"]]
+        self.assertEqual(actual_result["ld"].tolist(), counts.sum(axis=1).tolist())
+        self.assertTrue(cer_summary(ref, hyp, n_jobs=4).equals(actual_result))
+
+    def test_cer_summary_return_type_numpy(self):
+        """
+        Test the cer_summary function with return_type="numpy", and that an invalid return_type returns None.
+        """
+        ref = ["我爱冷披萨", "the cat"]
+        hyp = ["我爱披萨", "the hat"]
+        actual_result = cer_summary(ref, hyp, return_type="numpy")
+
+        self.assertIsInstance(actual_result, np.ndarray)
+        self.assertEqual(actual_result["cer"].tolist(), cers(ref, hyp))
+        self.assertEqual(actual_result["deletions"].tolist(), [1.0, 0.0])
+        self.assertEqual(cer_summary(ref, hyp, return_type="list"), None)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+test_cers.py
+
+This module contains a set of unit tests for the 'cers' function in the 'werpy' package.
+
+The 'cers' function calculates the Character Error Rate (CER) for each reference and hypothesis
+text pair, rather than aggregated across a corpus. Characters are Unicode code points, so the
+tests include characters from the one, two and four byte ranges of the Python string storage.
+
+To run the tests, execute this module as the main program.
+
+For more details on the 'cers' function and how to use it, please refer to the 'werpy' package documentation.
+
+Note: If the 'cers' module is not imported successfully, an ImportError is raised
+to ensure that the required module is available for testing.
+"""
+
+import unittest
+import numpy as np
+from werpy.cers import cers
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+
+class TestCers(unittest.TestCase):
+    """
+    This class contains unit tests for the 'cers' function, which calculates a list of Character Error Rates (CER)
+    between reference and hypothesis text sequences.
+    """
+
+    def test_cers_example_1(self):
+        """
+        Test the cers function with a single pair of strings.
+        """
+        self.assertEqual(cers("café", "cafe"), 0.25)
+
+    def test_cers_example_2(self):
+        """
+        Test the cers function with lists of strings.
+
+        This test verifies the per-pair CER for Latin-1, CJK and emoji characters, and for identical texts.
+        """
+        ref = ["naïve", "我爱冷披萨", "good 👍", "same text"]
+        hyp = ["naive", "我爱披萨", "good 👎", "same text"]
+
+        self.assertEqual(cers(ref, hyp), [0.2, 0.2, 1 / 6, 0.0])
+
+    def test_cers_n_jobs(self):
+        """
+        Test the cers function with multiple threads.
+        """
+        ref = ["我爱冷披萨", "the cat sat"] * 50
+        hyp = ["我爱披萨", "the hat sat"] * 50
+
+        self.assertEqual(cers(ref, hyp, n_jobs=4), cers(ref, hyp))
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_cers_pyarrow_invalid_utf8(self):
+        """
+        Test the cers function with pyarrow string columns, including columns built from unvalidated buffers.
+
+        This test verifies that valid columns give the same result as lists, and that malformed UTF-8 (a lead byte
+        above 0xF4, a sequence cut off by the end of the row, an overlong form and a surrogate) returns None.
+        """
+        ref = ["我爱冷披萨", "good 👍"]
+        hyp = ["我爱披萨", "good 👎"]
+        self.assertEqual(cers(pa.array(ref), pa.array(hyp)), cers(ref, hyp))
+
+        for data in [b"\xf8\x88\x80\x80\x80", b"ab\xe6\x97", b"\xc0\xaf", b"\xed\xa0\x80"]:
+            offsets = np.array([0, len(data)], dtype=np.int32)
+            column = pa.Array.from_buffers(pa.string(), 1, [None, pa.py_buffer(offsets.tobytes()), pa.py_buffer(data)])
+            self.assertEqual(cers(column, ["x"]), None)
+
+    def test_cers_return_type_numpy(self):
+        """
+        Test the cers function with return_type="numpy".
+        """
+        ref = ["我爱冷披萨", "the cat"]
+        hyp = ["我爱披萨", "the hat"]
+        actual_result = cers(ref, hyp, return_type="numpy")
+
+        self.assertIsInstance(actual_result, np.ndarray)
+        self.assertEqual(actual_result.tolist(), cers(ref, hyp))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
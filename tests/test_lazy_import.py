@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+test_lazy_import.py
+
+This module contains unit tests for the lazy loading of pandas by the 'summary', 'summaryp' and 'cer_summary'
+functions of the 'werpy' package.
+
+pandas is slow to import, so these functions only import it when they are first called. Each test runs in a fresh
+interpreter, since the test suite itself imports pandas.
+
+To run the tests, execute this module as the main program.
+"""
+
+import subprocess
+import sys
+import unittest
+import werpy
+
+
+def run_fresh(code):
+    """Run code in a fresh interpreter and return its standard output."""
+    return subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout.split()
+
+
+class TestLazyImport(unittest.TestCase):
+    """
+    This class contains unit tests for the lazy loading of the pandas based functions of the 'werpy' package.
+    """
+
+    def test_import_does_not_load_pandas(self):
+        """
+        Test that importing werpy and calculating a WER does not import pandas.
+        """
+        self.assertEqual(
+            run_fresh("import sys, werpy; werpy.wer('a b', 'a c'); print('pandas' in sys.modules)"), ["False"]
+        )
+
+    def test_summary_loads_pandas_on_first_call(self):
+        """
+        Test that summary, summaryp and cer_summary are functions of the package, and load pandas when first called.
+        """
+        self.assertEqual(
+            run_fresh(
+                "import sys, types, werpy; from werpy import summaryp; "
+                "print(isinstance(werpy.summary, types.FunctionType), werpy.summaryp is summaryp, "
+                "'pandas' in sys.modules, werpy.cer_summary('a b', 'a c').loc[0, 'ld'], 'pandas' in sys.modules)"
+            ),
+            ["True", "True", "False", "1.0", "True"],
+        )
+
+    def test_summary_after_submodule_import(self):
+        """
+        Test that summary and summaryp are still callable after their submodules are imported directly.
+        """
+        self.assertEqual(
+            run_fresh(
+                "import werpy.summary, werpy.summaryp; from werpy.summary import summary; "
+                "print(werpy.summary is summary, werpy.summary('a b', 'a c').loc[0, 'ld'], "
+                "werpy.summaryp('a b', 'a c').loc[0, 'ld'])"
+            ),
+            ["True", "1", "1"],
+        )
+
+    def test_unknown_attribute(self):
+        """
+        Test that an unknown attribute still raises an AttributeError.
+        """
+        with self.assertRaises(AttributeError):
+            getattr(werpy, "not_a_function")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -53,6 +53,9 @@ class TestNormalize(unittest.TestCase):
         - 'test_normalize_hypothesis_translation': Test the normalization of hypothesis translations.
         - 'test_normalize_string': Test the normalization of a single string.
         - 'test_normalize_invalid_types': Test the normalize function with various invalid input types.
+        - 'test_normalize_unicode_and_whitespace': Test the normalize function on non-ASCII text and whitespace.
+        - 'test_normalize_unicode_mode': Test the normalize function with unicode=True and nfkc=True.
+        - 'test_normalize_n_jobs': Test that a batch normalized across threads matches the serial result.
 
     To run the tests, execute this class as part of the test suite in the main program.
 
@@ -179,6 +182,76 @@ class TestNormalize(unittest.TestCase):
             with self.assertRaises(TypeError):
                 normalize(invalid_input)
 
+    def test_normalize_unicode_and_whitespace(self):
+        """
+        Test the normalize function on non-ASCII text, NUL characters and Unicode whitespace.
+
+        Only the ASCII punctuation is removed and words are not split around it. Letters get the full Unicode
+        lowercase mapping, including a final sigma in front of removed punctuation, and every kind of whitespace
+        that str.split() recognizes is collapsed to a single space.
+        """
+        text = [
+            "  Café\u00a0CRÈME,\tbrûlée\u3000 ",
+            "ΟΔΟΣ,ΚΑΙ ΟΔΟΣ.",
+            "İstanbul's\x00 NUL\x1c\x1dsep",
+            "“Curly” quotes — and dashes",
+        ]
+        expected_result = [
+            "café crème brûlée",
+            "οδοςκαι οδος",
+            "i̇stanbuls nul sep",
+            "“curly” quotes — and dashes",
+        ]
+
+        self.assertEqual(normalize(text), expected_result)
+        self.assertEqual(normalize(text[1]), expected_result[1])
+
+    def test_normalize_unicode_mode(self):
+        """
+        Test the normalize function with unicode=True and nfkc=True.
+
+        Unicode punctuation such as curly quotes, dashes and CJK punctuation is removed along with the ASCII
+        punctuation and the text is case folded. With nfkc=True, compatibility characters such as full-width
+        letters and ligatures are replaced first.
+        """
+        text = [
+            "“Curly” quotes — and dashes…",
+            "你好，世界。「引用」",
+            "ΟΔΟΣ,ΚΑΙ Straße!",
+            "Ｆｕｌｌ-width ﬁne",
+            "plain ASCII, text.",
+        ]
+
+        self.assertEqual(
+            normalize(text, unicode=True),
+            [
+                "curly quotes and dashes",
+                "你好世界引用",
+                "οδοσκαι strasse",
+                "ｆｕｌｌwidth fine",
+                "plain ascii text",
+            ],
+        )
+        self.assertEqual(normalize(text[3], unicode=True, nfkc=True), "fullwidth fine")
+        self.assertEqual(normalize(text[4], unicode=True), normalize(text[4]))
+
+    def test_normalize_n_jobs(self):
+        """
+        Test that a batch normalized across threads matches the serial result.
+
+        The output keeps the input order for ASCII and non-ASCII texts alike, and an invalid n_jobs raises a
+        ValueError.
+        """
+        text = ["It's Consumed Domestically!", "ΟΔΟΣ,ΚΑΙ “Straße”", "  The Sugar\tBear  "] * 500
+
+        for unicode in (False, True):
+            expected_result = normalize(text, unicode=unicode)
+            self.assertEqual(normalize(text, unicode=unicode, n_jobs=3), expected_result)
+            self.assertEqual(normalize(tuple(text), unicode=unicode, n_jobs=-1), expected_result)
+
+        with self.assertRaises(ValueError):
+            normalize(text, n_jobs=0)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+test_scorer.py
+
+This module contains a set of unit tests for the 'Scorer' class in the 'werpy' package.
+
+A 'Scorer' is a reusable, preconfigured object that returns the Word Error Rate of a single reference and hypothesis
+pair as a float, keeping its buffers between calls.
+
+To run the tests, execute this module as the main program.
+
+For more details on the 'Scorer' class and how to use it, please refer to the 'werpy' package documentation.
+
+Note: If the 'scorer' module is not imported successfully, an ImportError is raised
+to ensure that the required module is available for testing.
+"""
+
+import unittest
+from werpy.scorer import Scorer
+from werpy.wer import wer
+from werpy.wers import wers
+
+
+class TestScorer(unittest.TestCase):
+    """
+    This class contains unit tests for the 'Scorer' class, which scores one reference and hypothesis pair per call.
+    """
+
+    ref = [
+        "it blocked sight lines of central park",
+        "her father was an alderman in the city government",
+        "Taxes are a tool in the adjustment of the economy.",
+        " ".join(["word"] * 100),
+    ]
+    hyp = [
+        "it blocked sightlines of central park",
+        "her father was an elder man in the city government",
+        "taxes are a tool in the adjustment of the economy",
+        " ".join(["word"] * 90 + ["other"] * 20),
+    ]
+
+    def test_scorer_matches_wer(self):
+        """
+        Test that a scorer, reused across pairs of different lengths, returns the same float as wer().
+        """
+        score = Scorer()
+        score_normalized = Scorer(normalize=True)
+        for reference, hypothesis in zip(self.ref, self.hyp):
+            result = score(reference, hypothesis)
+            self.assertIsInstance(result, float)
+            self.assertEqual(result, wer(reference, hypothesis))
+            self.assertEqual(score_normalized(reference, hypothesis), wer(reference, hypothesis, normalize=True))
+
+    def test_scorer_max_wer(self):
+        """
+        Test that a scorer with a max_wer cutoff returns the same values as wers() with that cutoff.
+        """
+        score = Scorer(max_wer=0.25)
+        self.assertEqual(score.max_wer, 0.25)
+        self.assertEqual([score(r, h) for r, h in zip(self.ref, self.hyp)], wers(self.ref, self.hyp, max_wer=0.25))
+
+    def test_scorer_invalid_input(self):
+        """
+        Test that a scorer raises for a blank reference, non-string input and an invalid max_wer.
+        """
+        score = Scorer()
+        with self.assertRaises(ZeroDivisionError):
+            score("  ", "hello")
+        with self.assertRaises(ZeroDivisionError):
+            Scorer(normalize=True)("!!!", "hello world")
+        with self.assertRaises(AttributeError):
+            score(["hello"], ["hello"])
+        with self.assertRaises(ValueError):
+            Scorer(max_wer=-1)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
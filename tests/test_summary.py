@@ -23,6 +23,7 @@ to ensure that the required module is available for testing.
 """
 
 import unittest
+import numpy as np
 import pandas as pd
 from werpy.summary import summary
 
@@ -127,6 +128,171 @@ class TestSummary(unittest.TestCase):
 
         pd.testing.assert_frame_equal(expected_result, actual_result)
 
+    def test_summary_n_jobs(self):
+        """
+        Test the summary function with multiple threads.
+
+        This test verifies that the word lists and counts are identical whether the batch is aligned serially or
+        across several threads.
+        """
+        ref = ["its estuary is considered to have abnormally low rates of dissolved oxygen", "no one else"] * 20
+        hyp = ["its estiary is considered to have a normally low rates of dissolved oxygen", "no one"] * 20
+
+        pd.testing.assert_frame_equal(summary(ref, hyp), summary(ref, hyp, n_jobs=4))
+
+    def test_summary_long_sequences(self):
+        """
+        Test the summary function with sequences too long for a full DP matrix.
+
+        Pairs of this size are aligned in linear memory. This test verifies that the counts and word lists are the
+        same as for the full matrix alignment.
+        """
+        words = [f"w{i % 97}" for i in range(2500)]
+        hyp_words = list(words)
+        hyp_words[10] = "x"
+        del hyp_words[1200]
+        hyp_words.append("y")
+        ref = " ".join(words)
+        hyp = " ".join(hyp_words)
+
+        actual_result = summary(ref, hyp)
+
+        expected_result = pd.DataFrame(
+            {
+                "wer": [3 / 2500],
+                "ld": [3],
+                "m": [2500],
+                "insertions": [1],
+                "deletions": [1],
+                "substitutions": [1],
+                "inserted_words": [["y"]],
+                "deleted_words": [["w36"]],
+                "substituted_words": [[("w10", "x")]],
+            }
+        )
+
+        pd.testing.assert_frame_equal(expected_result, actual_result)
+        pd.testing.assert_frame_equal(summary([ref, hyp], [hyp, ref]).iloc[[0]], actual_result)
+
+    def test_summary_common_prefix_suffix(self):
+        """
+        Test the summary function with pairs that share leading and trailing words.
+
+        This test verifies that skipping the common prefix and suffix does not change which words are reported, e.g.
+        the shared leading "the" is still reported as deleted when the alignment matches the trailing "the" instead.
+        """
+        ref = ["the cat sat on the mat", "the cat sat on the mat", "hello world"]
+        hyp = ["the cat the cat sat on the mat", "the mat", "hello world"]
+
+        actual_result = summary(ref, hyp)
+
+        expected_result = pd.DataFrame(
+            {
+                "wer": [2 / 6, 4 / 6, 0.0],
+                "ld": [2, 4, 0],
+                "m": [6, 6, 2],
+                "insertions": [2, 0, 0],
+                "deletions": [0, 4, 0],
+                "substitutions": [0, 0, 0],
+                "inserted_words": [["the", "cat"], [], []],
+                "deleted_words": [[], ["the", "cat", "sat", "on"], []],
+                "substituted_words": [[], [], []],
+            }
+        )
+
+        pd.testing.assert_frame_equal(expected_result, actual_result)
+
+    def test_summary_repeated_pairs(self):
+        """
+        Test the summary function on single pairs of very different sizes, one after the other.
+
+        Single pairs share a scratch buffer between calls. This test verifies that the result of a short pair does not
+        depend on the longer pairs scored before it.
+        """
+        expected_result = summary("i love cold pizza", "i love pizza")
+
+        summary(" ".join(["a"] * 900), " ".join(["a", "b"] * 300))
+        actual_result = summary("i love cold pizza", "i love pizza")
+
+        pd.testing.assert_frame_equal(actual_result, expected_result)
+
+    def test_summary_columnar(self):
+        """
+        Test the summary function with columnar output.
+
+        This test verifies that the numeric columns and the flattened word arrays hold the same results as the
+        DataFrame output.
+        """
+        ref = ["its estuary is considered to have abnormally low rates of dissolved oxygen", "no one else", "a b"]
+        hyp = ["its estiary is considered to have a normally low rates of dissolved oxygen", "no one", "a b c d"]
+
+        actual_result = summary(ref, hyp, columnar=True)
+        expected_result = summary(ref, hyp)
+
+        self.assertEqual(actual_result["wer"].dtype, np.float64)
+        self.assertEqual(actual_result["ld"].dtype, np.int32)
+        for column in ["wer", "ld", "m", "insertions", "deletions", "substitutions"]:
+            np.testing.assert_array_equal(actual_result[column], expected_result[column].to_numpy())
+
+        vocabulary = actual_result["vocabulary"]
+        for i in range(len(ref)):
+            inserted = actual_result["inserted_offsets"][i : i + 2]
+            deleted = actual_result["deleted_offsets"][i : i + 2]
+            substituted = actual_result["substituted_offsets"][i : i + 2]
+            self.assertEqual(
+                list(vocabulary[actual_result["inserted_ids"][inserted[0] : inserted[1]]]),
+                expected_result["inserted_words"][i],
+            )
+            self.assertEqual(
+                list(vocabulary[actual_result["deleted_ids"][deleted[0] : deleted[1]]]),
+                expected_result["deleted_words"][i],
+            )
+            self.assertEqual(
+                list(
+                    zip(
+                        vocabulary[actual_result["substituted_ref_ids"][substituted[0] : substituted[1]]],
+                        vocabulary[actual_result["substituted_hyp_ids"][substituted[0] : substituted[1]]],
+                    )
+                ),
+                expected_result["substituted_words"][i],
+            )
+
+    def test_summary_normalize(self):
+        """
+        Test that the summary function reports normalized words with normalize=True.
+        """
+        df = summary(
+            "It's Consumed Domestically, and EXPORTED.", "its consumed domestically and imported", normalize=True
+        )
+
+        self.assertEqual(df["ld"][0], 1)
+        self.assertEqual(df["substituted_words"][0], [("exported", "imported")])
+
+    def test_summary_normalize_punctuation_reference(self):
+        """
+        Test that the summary function rejects a reference made only of punctuation with normalize=True.
+        """
+        self.assertEqual(summary("!!!", "hello world", normalize=True), None)
+        self.assertEqual(summary("!!!", "hello world", normalize=True, columnar=True), None)
+        self.assertEqual(summary("...", "hello", normalize=True, return_type="numpy"), None)
+
+    def test_summary_return_type_numpy(self):
+        """
+        Test the summary function with return_type="numpy".
+
+        This test verifies that the structured array holds the same counts as the DataFrame, one record per sequence,
+        as a view of the computed results, and that it cannot be combined with columnar.
+        """
+        ref = ["it is consumed domestically and exported to other countries", "the sugar bear character"]
+        hyp = ["it is consumed domestically and exported to other countries", "the sugar bare character was popular"]
+        actual_result = summary(ref, hyp, return_type="numpy")
+        df = summary(ref, hyp)
+
+        self.assertEqual(actual_result.shape, (2,))
+        self.assertIsNotNone(actual_result.base)
+        for column in ("wer", "ld", "m", "insertions", "deletions", "substitutions"):
+            self.assertEqual(actual_result[column].tolist(), df[column].tolist())
+        self.assertEqual(summary(ref, hyp, columnar=True, return_type="numpy"), None)
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -147,6 +147,58 @@ class TestSummaryp(unittest.TestCase):
 
         self.assertEqual(summaryp(ref, hyp, 0.5, 0.5, 1), expected_result)
 
+    def test_summaryp_weighted_alignment(self):
+        """
+        Test the summaryp function with a weighted alignment.
+
+        With a substitution weight of 3, a substitution costs more than a deletion and an insertion. This test
+        verifies that the word lists then come from the minimum weighted cost alignment, which has no
+        substitutions, while the WER and Levenshtein distance stay those of the standard alignment.
+        """
+        ref = "it blocked sight lines of central park"
+        hyp = "it blocked sightlines of central park"
+        df = summaryp(ref, hyp, substitutions_weight=3, weighted_alignment=True)
+
+        self.assertEqual(df["werp"][0], 3 / 7)
+        self.assertEqual(df["ld"][0], 2)
+        self.assertEqual(df["wer"][0], 2 / 7)
+        self.assertEqual(df["inserted_words"][0], ["sightlines"])
+        self.assertEqual(df["deleted_words"][0], ["sight", "lines"])
+        self.assertEqual(df["substituted_words"][0], [])
+
+
+    def test_summaryp_weighted_alignment_levenshtein_distance(self):
+        """
+        Test that the ld and wer columns of a weighted alignment hold the Levenshtein distance.
+
+        A substitution weight of 5 replaces every substitution by a deletion and an insertion, so the weighted
+        alignment has 7 operations while the Levenshtein distance is 4.
+        """
+        df = summaryp("a b c d", "x y z", 1, 1, 5, weighted_alignment=True)
+
+        self.assertEqual(df["ld"][0], 4)
+        self.assertEqual(df["wer"][0], 1.0)
+        self.assertEqual(df["werp"][0], 1.75)
+        self.assertEqual((df["insertions"][0], df["deletions"][0], df["substitutions"][0]), (3, 4, 0))
+
+    def test_summaryp_weighted_alignment_long_sequences(self):
+        """
+        Test the summaryp function with a weighted alignment of sequences too long for a full DP matrix.
+
+        Pairs of this size are aligned in linear memory. This test verifies that each substitution, weighted above an
+        insertion and a deletion, is still replaced by both.
+        """
+        words = [f"w{i % 97}" for i in range(2500)]
+        hyp_words = list(words)
+        hyp_words[10] = "x"
+        hyp_words[2400] = "z"
+        df = summaryp(" ".join(words), " ".join(hyp_words), substitutions_weight=3, weighted_alignment=True)
+
+        self.assertEqual(df["ld"][0], 2)
+        self.assertEqual(df["werp"][0], 4 / 2500)
+        self.assertEqual(df["inserted_words"][0], ["x", "z"])
+        self.assertEqual(df["deleted_words"][0], ["w10", "w72"])
+        self.assertEqual(df["substituted_words"][0], [])
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+test_tokenized_corpus.py
+
+This module contains a set of unit tests for the 'TokenizedCorpus' class in the 'werpy' package.
+
+A 'TokenizedCorpus' holds a batch of texts that have been split into words and interned to token ids once. The
+scoring functions must give the same results for a corpus as for the texts it was built from, whether it is used as
+the reference, the hypothesis or both, and a corpus must give the same results again after it has been saved and
+loaded back as memory-mapped arrays.
+
+To run the tests, execute this module as the main program.
+
+For more details on the 'TokenizedCorpus' class and how to use it, please refer to the 'werpy' package documentation.
+
+Note: If the 'corpus' module is not imported successfully, an ImportError is raised
+to ensure that the required module is available for testing.
+"""
+
+import tempfile
+import unittest
+import numpy as np
+from werpy.corpus import TokenizedCorpus
+from werpy.summary import summary
+from werpy.wer import wer
+from werpy.werps import werps
+from werpy.wers import wers
+
+
+class TestTokenizedCorpus(unittest.TestCase):
+    """
+    This class contains unit tests for the 'TokenizedCorpus' class, which stores a pre-tokenized batch of texts.
+    """
+
+    ref = [
+        "it was beautiful and sunny today",
+        "i love cold pizza",
+        "the sugar bear character was popular",
+        "naïve café 猫",
+    ]
+    hyp = [
+        "it was a beautiful and sunny day",
+        "i love pizza",
+        "the sugar bare character was popular",
+        "naive café 猫",
+    ]
+
+    def test_tokenized_corpus_arrays(self):
+        """
+        Test the arrays of a corpus.
+
+        This test verifies that the token ids of each text index its words in the vocabulary.
+        """
+        corpus = TokenizedCorpus(self.ref)
+        vocabulary = corpus.vocabulary
+
+        self.assertEqual(len(corpus), 4)
+        self.assertEqual(corpus.ids.dtype, np.int32)
+        for k, text in enumerate(self.ref):
+            ids = corpus.ids[corpus.offsets[k] : corpus.offsets[k + 1]]
+            self.assertEqual([vocabulary[j] for j in ids], text.split())
+
+    def test_tokenized_corpus_scoring(self):
+        """
+        Test the scoring functions with a corpus as the reference, the hypothesis or both.
+
+        This test verifies that the results are the same as for the original texts.
+        """
+        ref = TokenizedCorpus(self.ref)
+        hyp = TokenizedCorpus(self.hyp)
+
+        for reference, hypothesis in ((ref, self.hyp), (self.ref, hyp), (ref, hyp)):
+            self.assertEqual(wer(reference, hypothesis), wer(self.ref, self.hyp))
+            self.assertEqual(wers(reference, hypothesis), wers(self.ref, self.hyp))
+            self.assertEqual(werps(reference, hypothesis), werps(self.ref, self.hyp))
+            self.assertTrue(summary(reference, hypothesis).equals(summary(self.ref, self.hyp)))
+
+    def test_tokenized_corpus_save_load(self):
+        """
+        Test saving a corpus and loading it back as memory-mapped arrays.
+        """
+        corpus = TokenizedCorpus(self.ref)
+
+        with tempfile.TemporaryDirectory() as path:
+            corpus.save(path)
+            loaded = TokenizedCorpus.load(path)
+
+            self.assertIsInstance(loaded.ids, np.memmap)
+            self.assertEqual(loaded.vocabulary, corpus.vocabulary)
+            self.assertEqual(wers(loaded, self.hyp), wers(self.ref, self.hyp))
+            del loaded
+
+    def test_tokenized_corpus_validation(self):
+        """
+        Test that invalid corpus arrays are rejected, and that a loaded corpus is validated only once.
+
+        This test verifies that the read-only memory-mapped arrays of a loaded corpus are marked as validated after
+        the first call, and that replacing one of them with an invalid array is reported and returns None.
+        """
+        corpus = TokenizedCorpus(self.ref)
+
+        with tempfile.TemporaryDirectory() as path:
+            corpus.save(path)
+            loaded = TokenizedCorpus.load(path)
+
+            self.assertFalse(loaded._validated)  # pylint: disable=protected-access
+            self.assertEqual(wers(loaded, self.hyp), wers(self.ref, self.hyp))
+            self.assertTrue(loaded._validated)  # pylint: disable=protected-access
+            self.assertEqual(wers(loaded, self.hyp), wers(self.ref, self.hyp))
+
+            loaded.ids = np.full(len(loaded.ids), len(loaded.vocabulary), dtype=np.int32)
+            self.assertFalse(loaded._validated)  # pylint: disable=protected-access
+            self.assertEqual(wers(loaded, self.hyp), None)
+            del loaded
+
+    def test_tokenized_corpus_length_mismatch(self):
+        """
+        Test a corpus and a hypothesis list of different lengths, which is reported and returns None.
+        """
+        self.assertEqual(wer(TokenizedCorpus(self.ref), self.hyp[:2]), None)
+
+    def test_tokenized_corpus_normalize(self):
+        """
+        Test a corpus built from normalized texts, and that an already tokenized corpus cannot be normalized again.
+        """
+        ref = [text.upper() + "." for text in self.ref]
+        corpus = TokenizedCorpus(ref, normalize=True)
+
+        self.assertEqual(wers(corpus, self.hyp), wers(self.ref, self.hyp))
+        self.assertEqual(wers(corpus, self.hyp, normalize=True), None)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
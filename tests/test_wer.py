@@ -27,8 +27,14 @@ to ensure that the required module is available for testing.
 """
 
 import unittest
+from werpy.normalize import normalize
 from werpy.wer import wer
 
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
 
 class TestWer(unittest.TestCase):
     """
@@ -125,6 +131,69 @@ class TestWer(unittest.TestCase):
 
         self.assertEqual(wer(ref, hyp), expected_result)
 
+    def test_wer_n_jobs(self):
+        """
+        Test the wer function with multiple threads.
+
+        This test verifies that scoring a batch across several threads gives exactly the same result as scoring it
+        serially, and that an invalid thread count raises a ValueError which is reported and returns None.
+        """
+        ref = ["i love cold pizza", "the sugar bear character was popular"] * 50
+        hyp = ["i love pizza", "the sugar bare character was popular"] * 50
+
+        self.assertEqual(wer(ref, hyp, n_jobs=4), wer(ref, hyp))
+        self.assertEqual(wer(ref, hyp, n_jobs=-1), 0.2)
+        self.assertEqual(wer(ref, hyp, n_jobs=0), None)
+        self.assertEqual(wer(ref, hyp, n_jobs=2**40), None)
+        self.assertEqual(wer(ref, hyp, n_jobs=-(2**40)), 0.2)
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_wer_arrow_input(self):
+        """
+        Test the wer function with pyarrow string columns.
+
+        This test verifies that StringArray, LargeStringArray and ChunkedArray inputs, which are tokenized in place,
+        give the same result as the equivalent Python lists, including non-ASCII words and whitespace.
+        """
+        ref = ["i love cold pizza", "the sugar bear character was popular", "caf\u00e9\u3000au lait", ""]
+        hyp = ["i love pizza", "the sugar bare character was popular", "caf\u00e9 au\u00a0lait", "extra"]
+        expected_result = wer(ref, hyp)
+
+        self.assertEqual(wer(pa.array(ref), pa.array(hyp)), expected_result)
+        self.assertEqual(wer(pa.array(ref, pa.large_string()), hyp), expected_result)
+        self.assertEqual(
+            wer(pa.chunked_array([ref[:1], ref[1:]]), pa.chunked_array([hyp[:3], hyp[3:]])), expected_result
+        )
+        self.assertEqual(wer(pa.array(["i love pizza", None]), ["i love pizza", "hi"]), None)
+
+    def test_wer_normalize(self):
+        """
+        Test the wer function with normalization folded into tokenization.
+
+        This test verifies that normalize=True gives the same result as normalizing the texts first, for ASCII and
+        non-ASCII texts and for single strings and lists.
+        """
+        ref = ["It's very popular in Antarctica.", "Caf\u00e9 CR\u00c8ME, br\u00fbl\u00e9e!", "The Sugar Bear"]
+        hyp = ["its very  popular in antarctica", "caf\u00e9 cr\u00e8me brulee", "the sugar bare."]
+        expected_result = wer(normalize(ref), normalize(hyp))
+
+        self.assertEqual(wer(ref, hyp, normalize=True), expected_result)
+        self.assertEqual(wer(ref[0], hyp[0], normalize=True), 0.0)
+        self.assertNotEqual(wer(ref, hyp), expected_result)
+
+    def test_wer_normalize_punctuation_reference(self):
+        """
+        Test the wer function with normalize=True and a reference made only of punctuation.
+
+        The reference has no words once normalized. This test verifies that it is rejected as a blank reference, as
+        it is when the texts are normalized first.
+        """
+        ref = "!!!"
+        hyp = "hello world"
+
+        self.assertEqual(wer(normalize(ref), normalize(hyp)), None)
+        self.assertEqual(wer(ref, hyp, normalize=True), None)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+test_wer_accumulator.py
+
+This module contains a set of unit tests for the 'WerAccumulator' class in the 'werpy' package.
+
+The 'WerAccumulator' class keeps running totals of the Levenshtein distance, the number of reference words and the
+insertion, deletion and substitution counts over a stream of reference and hypothesis texts. Its result must match
+what 'wer' and 'werp' return for the same texts, regardless of how the stream is split into batches, and its state
+must survive pickling and merging.
+
+To run the tests, execute this module as the main program.
+
+For more details on the 'WerAccumulator' class and how to use it, please refer to the 'werpy' package documentation.
+
+Note: If the 'accumulator' module is not imported successfully, an ImportError is raised
+to ensure that the required module is available for testing.
+"""
+
+import pickle
+import unittest
+from werpy.accumulator import WerAccumulator
+from werpy.wer import wer
+from werpy.werp import werp
+
+
+class TestWerAccumulator(unittest.TestCase):
+    """
+    This class contains unit tests for the 'WerAccumulator' class, which accumulates the corpus Word Error Rate (WER)
+    over a stream of reference and hypothesis texts.
+    """
+
+    ref = [
+        "it was beautiful and sunny today",
+        "i love cold pizza",
+        "the sugar bear character was popular",
+        "no one else could claim that",
+    ]
+    hyp = [
+        "it was a beautiful and sunny day",
+        "i love pizza",
+        "the sugar bare character was popular",
+        "no one else could claim that",
+    ]
+
+    def test_wer_accumulator_matches_wer(self):
+        """
+        Test that the accumulated WER matches wer() and werp() however the stream is split.
+
+        Pairs are added one at a time, as batches and from generators.
+        """
+        acc_single = WerAccumulator()
+        for reference, hypothesis in zip(self.ref, self.hyp):
+            acc_single.update(reference, hypothesis)
+
+        acc_batches = WerAccumulator()
+        acc_batches.update_batch(self.ref[:3], self.hyp[:3])
+        acc_batches.update_batch((r for r in self.ref[3:]), (h for h in self.hyp[3:]))
+
+        self.assertEqual(acc_single, acc_batches)
+        self.assertEqual(acc_single.result(), wer(self.ref, self.hyp))
+        self.assertEqual(acc_single.result(0.5, 0.5, 1), werp(self.ref, self.hyp, 0.5, 0.5, 1))
+        self.assertEqual(acc_single.ld, 4)
+        self.assertEqual(acc_single.m, 22)
+        self.assertEqual((acc_single.insertions, acc_single.deletions, acc_single.substitutions), (1, 1, 2))
+
+    def test_wer_accumulator_merge_and_pickle(self):
+        """
+        Test merging accumulators and round-tripping them through pickle.
+        """
+        left = WerAccumulator()
+        left.update_batch(self.ref[:2], self.hyp[:2])
+        right = WerAccumulator()
+        right.update_batch(self.ref[2:], self.hyp[2:])
+
+        merged = pickle.loads(pickle.dumps(left)) + pickle.loads(pickle.dumps(right))
+
+        self.assertEqual(merged.result(), wer(self.ref, self.hyp))
+        self.assertEqual(left.merge(right), merged)
+        self.assertEqual(WerAccumulator().result(), 0.0)
+
+    def test_wer_accumulator_invalid_input(self):
+        """
+        Test that invalid input raises an exception and leaves the totals unchanged.
+        """
+        acc = WerAccumulator()
+
+        with self.assertRaises(AttributeError):
+            acc.update(["i love cold pizza"], ["i love pizza"])
+        with self.assertRaises(AttributeError):
+            acc.update_batch("i love cold pizza", "i love pizza")
+        with self.assertRaises(ValueError):
+            acc.update_batch(self.ref, self.hyp[:2])
+
+        self.assertEqual(acc, WerAccumulator())
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
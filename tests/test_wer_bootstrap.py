@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+test_wer_bootstrap.py
+
+This module contains a set of unit tests for the 'wer_bootstrap' function in the 'werpy' package.
+
+The 'wer_bootstrap' function calculates a bootstrap confidence interval for the corpus-level Word Error Rate by
+resampling the reference and hypothesis texts with replacement.
+
+To run the tests, execute this module as the main program.
+
+For more details on the 'wer_bootstrap' function and how to use it, please refer to the 'werpy' package documentation.
+
+Note: If the 'wer_bootstrap' module is not imported successfully, an ImportError is raised
+to ensure that the required module is available for testing.
+"""
+
+import importlib
+import random
+import unittest
+from unittest import mock
+import numpy as np
+from werpy.wer import wer
+from werpy.wer_bootstrap import wer_bootstrap
+
+
+class TestWerBootstrap(unittest.TestCase):
+    """
+    This class contains unit tests for the 'wer_bootstrap' function, which calculates bootstrap confidence intervals
+    for the Word Error Rate.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(7)
+        cls.ref = [" ".join(rng.choice("abcd") for _ in range(rng.randint(1, 25))) for _ in range(3000)]
+        cls.hyp = [" ".join(rng.choice("abcd") for _ in range(rng.randint(0, 25))) for _ in range(3000)]
+
+    def test_wer_bootstrap_interval(self):
+        """
+        Test that the interval contains the corpus WER and that the replicates match resampling the texts.
+
+        The replicates are compared with a direct bootstrap that resamples the Levenshtein distances and reference
+        lengths of the texts by index.
+        """
+        ref, hyp = self.ref[:5], self.hyp[:5]
+        result = wer_bootstrap(ref, hyp, n_resamples=20000, seed=1)
+        ld = np.array([wer(r, h) * len(r.split()) for r, h in zip(ref, hyp)])
+        m = np.array([len(r.split()) for r in ref], dtype=np.float64)
+        idx = np.random.default_rng(2).integers(0, 5, (20000, 5))
+        direct = ld[idx].sum(axis=1) / m[idx].sum(axis=1)
+
+        self.assertAlmostEqual(result["wer"], wer(ref, hyp))
+        self.assertTrue(result["low"] <= result["wer"] <= result["high"])
+        self.assertEqual(result["replicates"].shape, (20000,))
+        self.assertAlmostEqual(result["replicates"].mean(), direct.mean(), delta=0.01)
+        self.assertAlmostEqual(result["standard_error"], direct.std(), delta=0.01)
+
+    def test_wer_bootstrap_seed_and_n_jobs(self):
+        """
+        Test that a seed gives the same replicates for any n_jobs, split over several chunks of replicates.
+        """
+        # Shrink the chunks to a few dozen replicates each
+        with mock.patch.object(importlib.import_module("werpy.wer_bootstrap"), "_CHUNK_CELLS", 40000):
+            expected_result = wer_bootstrap(self.ref, self.hyp, n_resamples=3000, seed=5)["replicates"]
+
+            self.assertTrue(
+                np.array_equal(wer_bootstrap(self.ref, self.hyp, 3000, seed=5, n_jobs=3)["replicates"], expected_result)
+            )
+            self.assertFalse(
+                np.array_equal(wer_bootstrap(self.ref, self.hyp, 3000, seed=6)["replicates"], expected_result)
+            )
+
+    def test_wer_bootstrap_invalid_parameters(self):
+        """
+        Test that wer_bootstrap returns None for an invalid number of resamples or confidence level.
+        """
+        self.assertEqual(wer_bootstrap(self.ref, self.hyp, n_resamples=0), None)
+        self.assertEqual(wer_bootstrap(self.ref, self.hyp, confidence_level=1.5), None)
+
+    def test_wer_bootstrap_empty_input(self):
+        """
+        Test that wer_bootstrap returns None for an empty batch of texts.
+        """
+        self.assertEqual(wer_bootstrap([], []), None)
+        self.assertEqual(wer_bootstrap(np.array([], dtype=str), np.array([], dtype=str)), None)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+test_wer_grouped.py
+
+This module contains a set of unit tests for the 'wer_grouped' function in the 'werpy' package.
+
+The 'wer_grouped' function calculates the Word Error Rate and weighted Word Error Rate of each group of reference and
+hypothesis texts from a single scoring pass, where the group of each pair is given by a key.
+
+To run the tests, execute this module as the main program.
+
+For more details on the 'wer_grouped' function and how to use it, please refer to the 'werpy' package documentation.
+
+Note: If the 'wer_grouped' module is not imported successfully, an ImportError is raised
+to ensure that the required module is available for testing.
+"""
+
+import unittest
+import numpy as np
+from werpy.wer import wer
+from werpy.werp import werp
+from werpy.wer_grouped import wer_grouped
+
+
+class TestWerGrouped(unittest.TestCase):
+    """
+    This class contains unit tests for the 'wer_grouped' function, which calculates Word Error Rates per group.
+    """
+
+    ref = [
+        "it blocked sight lines of central park",
+        "her father was an alderman in the city government",
+        "taxes are a tool in the adjustment of the economy",
+        "i love cold pizza",
+        "the sugar bear character was popular",
+    ]
+    hyp = [
+        "it blocked sightlines of central park",
+        "our father was an elder man in the city government",
+        "taxes are a tool in the adjustment of the economy",
+        "i love pizza",
+        "the sugar bare character was popular",
+    ]
+
+    def assert_matches_per_group(self, result, keys):
+        """
+        Check every group of a wer_grouped result against wer and werp on the texts of that group.
+        """
+        for i, group in enumerate(result["groups"]):
+            ref = [r for r, k in zip(self.ref, keys) if k == group]
+            hyp = [h for h, k in zip(self.hyp, keys) if k == group]
+            self.assertAlmostEqual(result["wer"][i], wer(ref, hyp))
+            self.assertAlmostEqual(result["werp"][i], werp(ref, hyp, 0.5, 2, 1))
+            self.assertEqual(result["count"][i], len(ref))
+
+    def test_wer_grouped_labels(self):
+        """
+        Test the wer_grouped function with string labels as keys.
+        """
+        keys = ["spk_b", "spk_a", "spk_b", "spk_c", "spk_a"]
+        result = wer_grouped(self.ref, self.hyp, keys, 0.5, 2, 1)
+
+        self.assertEqual(result["groups"].tolist(), ["spk_a", "spk_b", "spk_c"])
+        self.assert_matches_per_group(result, keys)
+
+    def test_wer_grouped_integer_keys(self):
+        """
+        Test the wer_grouped function with integer keys, including keys that leave empty bins.
+        """
+        for keys in (np.array([4, 1, 4, 9, 1]), np.array([-2, 1, -2, 3, 1])):
+            result = wer_grouped(self.ref, self.hyp, keys, 0.5, 2, 1)
+
+            self.assertEqual(result["groups"].tolist(), sorted(set(keys.tolist())))
+            self.assertEqual(result["ld"].sum(), wer_grouped(self.ref, self.hyp, np.zeros(5, dtype=int))["ld"][0])
+            self.assert_matches_per_group(result, keys.tolist())
+
+    def test_wer_grouped_invalid_keys(self):
+        """
+        Test that wer_grouped returns None when group_by does not hold one key per text.
+        """
+        self.assertEqual(wer_grouped(self.ref, self.hyp, [0, 1]), None)
+        self.assertEqual(wer_grouped(self.ref, self.hyp, np.zeros((5, 2))), None)
+
+    def test_wer_grouped_unorderable_keys(self):
+        """
+        Test that wer_grouped returns None when the keys cannot be sorted, such as a mix of strings and None.
+        """
+        self.assertEqual(wer_grouped(self.ref, self.hyp, ["a", None, "a", "b", None]), None)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
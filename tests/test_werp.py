@@ -143,6 +143,21 @@ class TestWerp(unittest.TestCase):
 
         self.assertEqual(werp(ref, hyp, 0.5, 0.5, 1), expected_result)
 
+    def test_werp_weighted_alignment(self):
+        """
+        Test the werp function with a weighted alignment.
+
+        With a substitution weight of 3, replacing 'today' by 'day' costs more than deleting one and inserting the
+        other. This test verifies that the default weights the errors of the standard alignment, while
+        weighted_alignment=True finds the cheaper alignment, and that a negative weight is rejected.
+        """
+        ref = ["it was beautiful and sunny today"]
+        hyp = ["it was a beautiful and sunny day"]
+
+        self.assertEqual(werp(ref, hyp, substitutions_weight=3), 4 / 6)
+        self.assertEqual(werp(ref, hyp, substitutions_weight=3, weighted_alignment=True), 0.5)
+        self.assertEqual(werp(ref, hyp, 1, -1, 1, weighted_alignment=True), None)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
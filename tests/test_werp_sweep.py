@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+test_werp_sweep.py
+
+This module contains a set of unit tests for the 'werp_sweep' function in the 'werpy' package.
+
+The 'werp_sweep' function calculates the weighted Word Error Rate for every row of a (k, 3) matrix of insertion,
+deletion and substitution weights from a single alignment pass, either across the corpus or for each reference and
+hypothesis text.
+
+To run the tests, execute this module as the main program.
+
+For more details on the 'werp_sweep' function and how to use it, please refer to the 'werpy' package documentation.
+
+Note: If the 'werp_sweep' module is not imported successfully, an ImportError is raised
+to ensure that the required module is available for testing.
+"""
+
+import unittest
+import numpy as np
+from werpy.werp import werp
+from werpy.werps import werps
+from werpy.werp_sweep import werp_sweep
+
+
+class TestWerpSweep(unittest.TestCase):
+    """
+    This class contains unit tests for the 'werp_sweep' function, which calculates weighted Word Error Rates for many
+    weight configurations at once.
+    """
+
+    ref = [
+        "it blocked sight lines of central park",
+        "her father was an alderman in the city government",
+        "taxes are a tool in the adjustment of the economy",
+    ]
+    hyp = [
+        "it blocked sightlines of central park",
+        "our father was an elder man in the city government",
+        "taxes are tool in the adjustment of economy",
+    ]
+    weights = [[1, 1, 1], [0.5, 0.5, 1], [0.1, 2, 0.7], [0, 0, 0]]
+
+    def test_werp_sweep_matches_werp(self):
+        """
+        Test that each corpus-level result matches werp with the same weights.
+        """
+        expected_result = [werp(self.ref, self.hyp, *w) for w in self.weights]
+
+        np.testing.assert_allclose(werp_sweep(self.ref, self.hyp, self.weights), expected_result)
+
+    def test_werp_sweep_per_sequence(self):
+        """
+        Test that each column of the per-sequence results matches werps with the same weights, and that a single
+        pair of strings gives one row.
+        """
+        expected_result = np.array([werps(self.ref, self.hyp, *w) for w in self.weights]).T
+        result = werp_sweep(self.ref, self.hyp, self.weights, per_sequence=True)
+
+        self.assertEqual(result.shape, (3, 4))
+        np.testing.assert_allclose(result, expected_result)
+        np.testing.assert_allclose(
+            werp_sweep(self.ref[0], self.hyp[0], self.weights, per_sequence=True), expected_result[:1]
+        )
+
+    def test_werp_sweep_invalid_weights(self):
+        """
+        Test that weights which are not a (k, 3) matrix of numbers return None from the try/except block.
+        """
+        self.assertEqual(werp_sweep(self.ref, self.hyp, [1, 1, 1]), None)
+        self.assertEqual(werp_sweep(self.ref, self.hyp, [[1, 1]]), None)
+        self.assertEqual(werp_sweep(self.ref, self.hyp, [["a", 1, 1]]), None)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -23,7 +23,11 @@ Note: If the 'werps' module is not imported successfully, an ImportError is rais
 to ensure that the required module is available for testing.
 """
 
+import random
 import unittest
+import numpy as np
+from werpy.summary import summary
+from werpy.summaryp import summaryp
 from werpy.werps import werps
 
 
@@ -175,6 +179,64 @@ class TestWerps(unittest.TestCase):
 
         self.assertEqual(werps(ref, hyp, 0.5, 0.5, 1), expected_result)
 
+    def test_werps_n_jobs(self):
+        """
+        Test the werps function with multiple threads.
+
+        This test verifies that scoring a batch across several threads gives exactly the same per-sequence results
+        as scoring it serially.
+        """
+        ref = ["it blocked sight lines of central park", "her father was an alderman in the city government"] * 25
+        hyp = ["it blocked sightlines of central park", "our father was an elder man in the city government"] * 25
+        expected_result = [0.21428571428571427, 0.2777777777777778] * 25
+
+        self.assertEqual(werps(ref, hyp, 0.5, 0.5, 1, n_jobs=3), expected_result)
+
+    def test_werps_matches_alignment_counts(self):
+        """
+        Test the werps function against the counts of the full alignment reported by summary.
+
+        werps counts the insertions, deletions and substitutions without building the alignment. This test uses
+        pairs drawn from a three word vocabulary, which have many equally good alignments, and verifies that the
+        weighted WER always uses the counts of the alignment that summary reports.
+        """
+        rng = random.Random(0)
+        ref = [" ".join(rng.choice("abc") for _ in range(rng.randint(1, 40))) for _ in range(200)]
+        hyp = [" ".join(rng.choice("abc") for _ in range(rng.randint(0, 40))) for _ in range(200)]
+        counts = summary(ref, hyp)
+        weighted_errors = counts["insertions"] * 2 + counts["deletions"] * 3 + counts["substitutions"] * 5
+        expected_result = (weighted_errors / counts["m"]).tolist()
+
+        self.assertEqual(werps(ref, hyp, 2, 3, 5), expected_result)
+
+    def test_werps_weighted_alignment(self):
+        """
+        Test the werps function with a weighted alignment on randomly generated pairs.
+
+        This test verifies that the weighted alignment never costs more than weighting the standard alignment, and
+        that werps and summaryp report the same weighted WER, although only summaryp builds the alignment.
+        """
+        rng = random.Random(1)
+        ref = [" ".join(rng.choice("abc") for _ in range(rng.randint(1, 30))) for _ in range(200)]
+        hyp = [" ".join(rng.choice("abc") for _ in range(rng.randint(0, 30))) for _ in range(200)]
+        standard = werps(ref, hyp, 0.5, 2, 3)
+        weighted = werps(ref, hyp, 0.5, 2, 3, weighted_alignment=True)
+
+        self.assertTrue(all(w <= s for w, s in zip(weighted, standard)))
+        self.assertTrue(any(w < s for w, s in zip(weighted, standard)))
+        self.assertEqual(summaryp(ref, hyp, 0.5, 2, 3, weighted_alignment=True)["werp"].tolist(), weighted)
+
+    def test_werps_return_type_numpy(self):
+        """
+        Test the werps function with return_type="numpy".
+        """
+        ref = ["it was beautiful and sunny today", "tomorrow may not be as nice"]
+        hyp = ["it was a beautiful and sunny day", "tomorrow may not be as nice"]
+        actual_result = werps(ref, hyp, 2, 3, 5, return_type="numpy")
+
+        self.assertIsInstance(actual_result, np.ndarray)
+        self.assertEqual(actual_result.tolist(), werps(ref, hyp, 2, 3, 5))
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
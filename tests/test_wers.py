@@ -23,6 +23,7 @@ to ensure that the required module is available for testing.
 """
 
 import unittest
+import numpy as np
 from werpy.wers import wers
 
 
@@ -131,6 +132,80 @@ class TestWers(unittest.TestCase):
 
         self.assertEqual(wers(ref, hyp), expected_result)
 
+    def test_wers_long_sequences(self):
+        """
+        Test the wers function with sequences longer than 64 words.
+
+        This test exercises the multi-block bit-parallel kernel, which is used when the shorter side of a pair
+        spans more than one 64-bit word. It verifies that substitutions, deletions and insertions spread across
+        block boundaries are all counted.
+        """
+        ref_words = [f"word{k}" for k in range(150)]
+        hyp_words = list(ref_words)
+        hyp_words[10] = "wrong"
+        hyp_words[64] = "wrong"
+        del hyp_words[100]
+        hyp_words.insert(130, "extra")
+
+        ref = [" ".join(ref_words), " ".join(ref_words)]
+        hyp = [" ".join(hyp_words), " ".join(ref_words[:70])]
+        expected_result = [4 / 150, 80 / 150]
+
+        self.assertEqual(wers(ref, hyp), expected_result)
+
+    def test_wers_max_wer(self):
+        """
+        Test the wers function with a Word Error Rate cutoff.
+
+        This test verifies that pairs at or below the cutoff keep their exact WER, while pairs above it are
+        reported as inf. A pair exactly on the cutoff must be kept.
+        """
+        ref = ["no one else could claim that", "she cited multiple reasons why", "i love cold pizza"]
+        hyp = ["no one else could claim that", "she sighted multiple reasons why", "i hate pizza"]
+        expected_result = [0.0, 0.2, float("inf")]
+
+        self.assertEqual(wers(ref, hyp, max_wer=0.2), expected_result)
+        self.assertEqual(wers("i love cold pizza", "i hate pizza", max_wer=0.5), 0.5)
+        self.assertEqual(wers("i love cold pizza", "i hate pizza", max_wer=0.25), float("inf"))
+
+    def test_wers_max_wer_invalid(self):
+        """
+        Test the wers function with a negative Word Error Rate cutoff.
+
+        This test verifies that a negative cutoff raises a ValueError, which is reported and returns None.
+        """
+        self.assertEqual(wers(["i love cold pizza"], ["i love pizza"], max_wer=-0.5), None)
+
+    def test_wers_unicode_whitespace(self):
+        """
+        Test the wers function with non-ASCII words and Unicode whitespace.
+
+        This test verifies that words are split on the same whitespace characters as str.split(), and that a word
+        is matched whether its string is stored with one, two or four bytes per character.
+        """
+        ref = ["naïve café", "猫\u3000が 好き", "ok\u00a0then", "good 👍"]
+        hyp = ["naive café", "猫 が\u2003好き", "ok then", "good 👍"]
+        expected_result = [0.5, 0.0, 0.0, 0.0]
+
+        self.assertEqual(wers(ref, hyp), expected_result)
+
+    def test_wers_return_type_numpy(self):
+        """
+        Test the wers function with return_type="numpy".
+
+        This test verifies that a batch returns a float64 array with the same values as the list, that the array is
+        a view of the computed results, and that an invalid return_type returns None.
+        """
+        ref = ["no one else could claim that", "she cited multiple reasons why"]
+        hyp = ["no one else could claim that", "she sighted multiple reasons why"]
+        actual_result = wers(ref, hyp, return_type="numpy")
+
+        self.assertIsInstance(actual_result, np.ndarray)
+        self.assertEqual(actual_result.dtype, np.float64)
+        self.assertIsNotNone(actual_result.base)
+        self.assertEqual(actual_result.tolist(), wers(ref, hyp))
+        self.assertEqual(wers(ref, hyp, return_type="array"), None)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -3,6 +3,9 @@
 
 """
 The werpy package provides tools for calculating word error rates (WERs) and related metrics on text data.
+
+summary, summaryp and cer_summary return pandas DataFrames, but pandas is slow to import, so they only import it when
+they are first called. Importing the package only needs NumPy and the compiled metrics module.
 """
 
 __version__ = "3.3.0"
@@ -16,6 +19,15 @@ from .werp import werp
 from .werps import werps
 from .summary import summary
 from .summaryp import summaryp
+from .werp_sweep import werp_sweep
+from .wer_grouped import wer_grouped
+from .wer_bootstrap import wer_bootstrap
+from .cer import cer
+from .cers import cers
+from .cer_summary import cer_summary
+from .accumulator import WerAccumulator
+from .corpus import TokenizedCorpus
+from .scorer import Scorer
 
 __all__ = [
     "error_handler",
@@ -25,6 +37,15 @@ __all__ = [
     "wers",
     "werp",
     "werps",
+    "werp_sweep",
+    "wer_grouped",
+    "wer_bootstrap",
     "summary",
     "summaryp",
+    "cer",
+    "cers",
+    "cer_summary",
+    "WerAccumulator",
+    "TokenizedCorpus",
+    "Scorer",
 ]
@@ -0,0 +1,200 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This module provides a streaming accumulator for the corpus-level Word Error Rate (WER). Reference and hypothesis texts
+are scored as they arrive and only running totals are kept, so a corpus of any size can be evaluated in constant
+memory.
+
+This module defines the following class:
+    - WerAccumulator(): Accumulate edit counts over a stream of reference and hypothesis texts.
+"""
+
+import numpy as np
+from .errorhandler import error_handler, is_arrow_string_array
+from .metrics import metrics_fast
+
+
+class WerAccumulator:
+    """
+    This class accumulates the edit counts of a stream of reference and hypothesis texts and returns the same corpus
+    WER as wer() (or the same weighted WER as werp()) over everything seen so far.
+
+    Only five running totals are kept: the sum of the Levenshtein distances, the number of words in the references
+    and the counts of insertions, deletions and substitutions. Accumulators are small, can be pickled and can be
+    merged, e.g. to combine the results of several worker processes.
+
+    Attributes
+    ----------
+    ld : int
+        The sum of the Levenshtein distances of all pairs seen so far.
+    m : int
+        The total number of words in the references seen so far.
+    insertions : int
+        The total number of inserted words.
+    deletions : int
+        The total number of deleted words.
+    substitutions : int
+        The total number of substituted words.
+
+    Examples
+    --------
+    >>> acc = WerAccumulator()
+    >>> acc.update('i love cold pizza', 'i love pizza')
+    >>> acc.update_batch(['the sugar bear character was popular'], ['the sugar bare character was popular'])
+    >>> print(acc.result())
+    0.2
+    """
+
+    __slots__ = ("ld", "m", "insertions", "deletions", "substitutions")
+
+    def __init__(self):
+        self.ld = 0
+        self.m = 0
+        self.insertions = 0
+        self.deletions = 0
+        self.substitutions = 0
+
+    def update(self, reference, hypothesis):
+        """
+        Add a single reference and hypothesis pair to the running totals.
+
+        Parameters
+        ----------
+        reference : str
+            The ground truth transcription of a recorded speech or the expected output of a live speech.
+        hypothesis : str
+            The text generated by a speech-to-text algorithm/system which will be compared to the reference text.
+
+        Raises
+        ------
+        AttributeError
+            if the inputs are not strings.
+        ZeroDivisionError
+            if the reference is blank.
+        """
+        if not isinstance(reference, str) or not isinstance(hypothesis, str):
+            raise AttributeError(
+                "update() takes a single reference and hypothesis string. Use update_batch() for sequences."
+            )
+        error_handler(reference, hypothesis)
+        self._add(np.atleast_2d(metrics_fast(reference, hypothesis)))
+
+    def update_batch(self, references, hypotheses, n_jobs=1):
+        """
+        Add a batch of reference and hypothesis pairs to the running totals.
+
+        Parameters
+        ----------
+        references : list, numpy array, pyarrow string array or iterable of str
+            The ground truth transcriptions. Other iterables, such as generators, are consumed into a list first, so
+            very long streams should be passed in chunks.
+        hypotheses : list, numpy array, pyarrow string array or iterable of str
+            The texts generated by a speech-to-text algorithm/system, one per reference.
+        n_jobs : int or None, optional
+            The number of threads used to score the batch. The default of 1 runs serially, and -1 uses all
+            available CPUs.
+
+        Raises
+        ------
+        ValueError
+            if the two input parameters do not contain the same amount of elements, or if n_jobs is invalid.
+        AttributeError
+            if the inputs are single strings rather than sequences, or if input text is not a string.
+        """
+        references = _as_batch(references)
+        hypotheses = _as_batch(hypotheses)
+        error_handler(references, hypotheses)
+        self._add(metrics_fast(references, hypotheses, n_jobs=n_jobs))
+
+    def merge(self, other):
+        """
+        Add the running totals of another accumulator to this one.
+
+        Parameters
+        ----------
+        other : WerAccumulator
+            The accumulator to merge in. It is left unchanged.
+
+        Returns
+        -------
+        WerAccumulator
+            This accumulator, so that calls can be chained.
+        """
+        if not isinstance(other, WerAccumulator):
+            raise TypeError("Only another WerAccumulator can be merged.")
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        return self
+
+    def result(self, insertions_weight=1, deletions_weight=1, substitutions_weight=1):
+        """
+        Return the corpus WER over all pairs seen so far.
+
+        With the default weights this is the value wer() returns for the same pairs. Other weights give the weighted
+        WER of werp().
+
+        Parameters
+        ----------
+        insertions_weight : int or float, optional
+            Numeric value representing the weight of insertions. The default is 1.
+        deletions_weight : int or float, optional
+            Numeric value representing the weight of deletions. The default is 1.
+        substitutions_weight : int or float, optional
+            Numeric value representing the weight of substitutions. The default is 1.
+
+        Returns
+        -------
+        float
+            The accumulated WER, or 0.0 if no reference words have been seen.
+        """
+        if not self.m:
+            return 0.0
+        weighted_errors = (
+            self.insertions * insertions_weight
+            + self.deletions * deletions_weight
+            + self.substitutions * substitutions_weight
+        )
+        return float(weighted_errors / self.m)
+
+    def _add(self, result):
+        # result is an (n, 6) float64 array: [wer, ld, m, insertions, deletions, substitutions]
+        totals = result[:, 1:].sum(axis=0)
+        self.ld += int(totals[0])
+        self.m += int(totals[1])
+        self.insertions += int(totals[2])
+        self.deletions += int(totals[3])
+        self.substitutions += int(totals[4])
+
+    def _totals(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __add__(self, other):
+        if not isinstance(other, WerAccumulator):
+            return NotImplemented
+        return WerAccumulator().merge(self).merge(other)
+
+    def __iadd__(self, other):
+        if not isinstance(other, WerAccumulator):
+            return NotImplemented
+        return self.merge(other)
+
+    def __eq__(self, other):
+        if not isinstance(other, WerAccumulator):
+            return NotImplemented
+        return self._totals() == other._totals()
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)}" for name in self.__slots__)
+        return f"WerAccumulator({fields})"
+
+
+def _as_batch(texts):
+    """
+    Pass lists, numpy arrays and pyarrow string columns through and consume any other iterable into a list.
+    """
+    if isinstance(texts, str):
+        raise AttributeError("update_batch() takes sequences of texts. Use update() for a single pair.")
+    if isinstance(texts, (list, np.ndarray)) or is_arrow_string_array(texts):
+        return texts
+    return list(texts)
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This module provides a function for calculating the Character Error Rate (CER) between a reference text and a
+hypothesis text. The CER is calculated as the number of character edits (insertions, deletions, and substitutions)
+needed to transform the hypothesis text into the reference text, divided by the number of characters in the reference
+text.
+
+This module defines the following function:
+    - cer(reference, hypothesis, n_jobs=1): Calculate the CER between a reference text and a hypothesis text.
+"""
+
+import numpy as np
+from .errorhandler import error_handler
+from .metrics import metrics_cer
+
+
+def cer(reference, hypothesis, n_jobs=1) -> float | None:
+    """
+    This function will calculate the overall Character Error Rate for the entire reference and hypothesis texts
+    (i.e., the full corpus).
+
+    Characters are Unicode code points, so the CER also works for languages that are not written with spaces
+    between words, such as Chinese, Japanese or Thai. Leading and trailing whitespace is ignored, while spaces
+    inside a text count as characters.
+
+    Parameters
+    ----------
+    reference : str, list, numpy array or pyarrow string array
+        The ground truth transcription of a recorded speech or the expected output of a live speech.
+    hypothesis : str, list, numpy array or pyarrow string array
+        The text generated by a speech-to-text algorithm/system which will be compared to the reference text.
+    n_jobs : int or None, optional
+        The number of threads used to score a batch of reference and hypothesis texts. The default of 1 runs
+        serially, and -1 uses all available CPUs. Single strings are always scored on the calling thread.
+
+    Raises
+    ------
+    ValueError
+        if the two input parameters do not contain the same amount of elements, or if n_jobs is invalid.
+    AttributeError
+        if input text is not a string, list or np.ndarray data type.
+    ZeroDivisionError
+        if input in reference is blank or both reference and hypothesis are empty.
+
+    Returns
+    -------
+    float or None
+        This function will return a single Character Error Rate as a float, which is calculated as the number of
+        character edits divided by the number of characters in the reference text. If an exception occurs
+        (e.g., invalid input), the function will return None.
+
+    Examples
+    --------
+    >>> cer_example_1 = cer('kitten', 'sitting')
+    >>> print(cer_example_1)
+    0.5
+
+    >>> ref = ['我爱冷披萨', 'the cat']
+    >>> hyp = ['我爱披萨', 'the hat']
+    >>> cer_example_2 = cer(ref, hyp)
+    >>> print(cer_example_2)
+    0.16666666666666666
+    """
+    try:
+        error_handler(reference, hypothesis)
+        result = metrics_cer(reference, hypothesis, n_jobs=n_jobs)
+    except (ValueError, AttributeError, ZeroDivisionError) as err:
+        print(f"{type(err).__name__}: {str(err)}")
+        return None
+
+    # Batch: (n, 3) float64, columns [cer, ld, m]
+    if isinstance(result, np.ndarray) and result.ndim == 2:
+        den = np.sum(result[:, 2])  # m column
+        return float(np.sum(result[:, 1]) / den) if den else 0.0  # ld column
+
+    # Single: (3,) float64, CER is at index 0
+    return float(result[0])
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This module provides a summary function to display a breakdown of the Character Error Rate results, returned in a
+DataFrame.
+
+This module defines the following function:
+    - cer_summary(reference, hypothesis, n_jobs=1, return_type="dataframe")
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+import numpy as np
+from .errorhandler import check_return_type, error_handler
+from .metrics import metrics_cer
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# One record per sequence over the (n, 6) float64 rows of metrics_cer with counts
+_COUNTS_DTYPE = np.dtype(
+    [(name, np.float64) for name in ("cer", "ld", "m", "insertions", "deletions", "substitutions")]
+)
+
+
+def cer_summary(reference, hypothesis, n_jobs=1, return_type="dataframe") -> "pd.DataFrame | np.ndarray | None":
+    """
+    This function provides a breakdown of the Character Error Rate results including the CER, Levenshtein Distance
+    and the number of character insertions, deletions and substitutions.
+
+    Characters are Unicode code points. Leading and trailing whitespace is ignored, while spaces inside a text count
+    as characters.
+
+    Parameters
+    ----------
+    reference : str, list, numpy array or pyarrow string array
+        The ground truth transcription of a recorded speech or the expected output of a live speech.
+    hypothesis : str, list, numpy array or pyarrow string array
+        The text generated by a speech-to-text algorithm/system which will be compared to the reference text.
+    n_jobs : int or None, optional
+        The number of threads used to score a batch of reference and hypothesis texts. The default of 1 runs
+        serially, and -1 uses all available CPUs. Single strings are always scored on the calling thread.
+    return_type : {"dataframe", "numpy"}, optional
+        The type of the result. The default "dataframe" returns a DataFrame. "numpy" returns a NumPy structured array
+        with one record per sequence, which is a view of the computed results rather than a copy.
+
+    Raises
+    ------
+    ValueError
+        if the two input parameters do not contain the same amount of elements, if n_jobs is invalid, or if
+        return_type is not "dataframe" or "numpy".
+    AttributeError
+        if input text is not a string, list or np.ndarray data type.
+    ZeroDivisionError
+        if input in reference is blank or both reference and hypothesis are empty.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        Returns a dataframe containing the following six columns:
+            cer - The Character Error Rate
+            ld - The Levenshtein distance between the characters of the reference and hypothesis
+            m - The number of characters in the reference sequence
+            insertions - count of characters that are present in the hypothesis sequence but not in the reference
+            deletions - count of characters that are present in the reference sequence but not in the hypothesis
+            substitutions - count of characters needing to be transformed so the hypothesis matches the reference
+    numpy.ndarray
+        If return_type is "numpy", returns a structured array with one record per sequence and the float64 fields
+        cer, ld, m, insertions, deletions and substitutions, as above.
+
+    Example
+    --------
+    >>> ref = ['我爱冷披萨', 'the cat']
+    >>> hyp = ['我爱披萨', 'the hat']
+    >>> cer_summary_example_1 = cer_summary(ref, hyp)
+    >>> print(cer_summary_example_1)
+            cer   ld    m  insertions  deletions  substitutions
+    0  0.200000  1.0  5.0         0.0        1.0            0.0
+    1  0.142857  1.0  7.0         0.0        0.0            1.0
+    """
+    try:
+        check_return_type(return_type, ("dataframe", "numpy"))
+        error_handler(reference, hypothesis)
+        result = metrics_cer(reference, hypothesis, n_jobs=n_jobs, counts=True)
+    except (ValueError, AttributeError, ZeroDivisionError) as err:
+        print(f"{type(err).__name__}: {str(err)}")
+        return None
+
+    records = np.atleast_2d(result).view(_COUNTS_DTYPE)[:, 0]
+    if return_type == "numpy":
+        return records
+    # pandas is slow to import, so it is only loaded when the first DataFrame is built
+    return importlib.import_module("pandas").DataFrame(records)
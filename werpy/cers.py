@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This module provides a function for calculating a list of the Character Error Rates for each of the reference and
+hypothesis texts.
+
+This module defines the following function:
+    - cers(reference, hypothesis, n_jobs=1, return_type="list")
+"""
+
+import numpy as np
+from .errorhandler import check_return_type, error_handler
+from .metrics import metrics_cer
+
+
+def cers(reference, hypothesis, n_jobs=1, return_type="list"):
+    """
+    This function calculates a list of the Character Error Rates for each of the reference and hypothesis texts.
+
+    Characters are Unicode code points. Leading and trailing whitespace is ignored, while spaces inside a text count
+    as characters.
+
+    Parameters
+    ----------
+    reference : str, list, numpy array or pyarrow string array
+        The ground truth transcription of a recorded speech or the expected output of a live speech.
+    hypothesis : str, list, numpy array or pyarrow string array
+        The text generated by a speech-to-text algorithm/system which will be compared to the reference text.
+    n_jobs : int or None, optional
+        The number of threads used to score a batch of reference and hypothesis texts. The default of 1 runs
+        serially, and -1 uses all available CPUs. Single strings are always scored on the calling thread.
+    return_type : {"list", "numpy"}, optional
+        The type of the result for a batch. The default "list" returns a list of floats. "numpy" returns a float64
+        NumPy array instead, which holds the character error rates as a view of the results rather than a copy.
+
+    Raises
+    ------
+    ValueError
+        if the two input parameters do not contain the same amount of elements, if n_jobs is invalid, or if
+        return_type is not "list" or "numpy".
+    AttributeError
+        if input text is not a string, list or np.ndarray data type.
+    ZeroDivisionError
+        if input in reference is blank or both reference and hypothesis are empty.
+
+    Returns
+    -------
+    float, list or numpy array
+        This function will return either a single Character Error Rate (if the input is a pair of strings) or a list
+        of Character Error Rates (if the input is a pair of lists) for each of the reference and hypothesis texts, or
+        a NumPy array of them if return_type is "numpy".
+
+    Example
+    --------
+    >>> ref = ['我爱冷披萨', 'the cat']
+    >>> hyp = ['我爱披萨', 'the hat']
+    >>> cers_example_1 = cers(ref, hyp)
+    >>> print(cers_example_1)
+    [0.2, 0.14285714285714285]
+    """
+    try:
+        check_return_type(return_type)
+        error_handler(reference, hypothesis)
+        result = metrics_cer(reference, hypothesis, n_jobs=n_jobs)
+    except (ValueError, AttributeError, ZeroDivisionError) as err:
+        print(f"{type(err).__name__}: {str(err)}")
+        return None
+
+    # Batch: (n, 3) float64, columns [cer, ld, m]
+    if isinstance(result, np.ndarray) and result.ndim == 2:
+        # Return cer column, as a strided view of the results for numpy
+        return result[:, 0] if return_type == "numpy" else result[:, 0].tolist()
+
+    # Single: (3,) float64, CER is at index 0
+    return float(result[0])
@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This module provides a pre-tokenized corpus of texts. A reference set that is scored against many hypotheses can be
+split into words and interned once, saved to disk and loaded back as memory-mapped arrays, instead of being tokenized
+again on every call.
+
+This module defines the following class:
+    - TokenizedCorpus(): A batch of texts stored as interned int32 token ids.
+"""
+
+import os
+
+import numpy as np
+from .metrics import tokenize_corpus
+
+_ARRAYS = ("ids", "offsets", "vocabulary_bytes", "vocabulary_offsets")
+
+
+class TokenizedCorpus:
+    """
+    This class holds a batch of texts that have been split into words and interned to int32 token ids. It can be
+    passed to wer(), wers(), werp(), werps(), summary() and summaryp() anywhere a list of texts is accepted, as the
+    reference, the hypothesis or both, and gives the same results as the texts it was built from.
+
+    The texts are split on whitespace exactly like str.split(). The words of text k are the token ids
+    ids[offsets[k]:offsets[k + 1]], and token id j is the UTF-8 encoded word
+    vocabulary_bytes[vocabulary_offsets[j]:vocabulary_offsets[j + 1]].
+
+    Parameters
+    ----------
+    texts : list, numpy array or pyarrow string array
+        The texts to tokenize.
+    normalize : bool, optional
+        If True, the texts are normalized while they are split into words, with the same result as calling normalize
+        on them first. The default is False.
+
+    Attributes
+    ----------
+    ids : numpy array
+        The int32 token ids of all texts, one after the other.
+    offsets : numpy array
+        The start of each text in ids, followed by the total number of tokens.
+    vocabulary_bytes : numpy array
+        The uint8 UTF-8 bytes of the distinct words, one after the other, in token id order.
+    vocabulary_offsets : numpy array
+        The start of each word in vocabulary_bytes, followed by its total length.
+
+    Raises
+    ------
+    AttributeError
+        if texts is a single string or if any text is not a string.
+
+    Examples
+    --------
+    >>> ref = TokenizedCorpus(['i love cold pizza','the sugar bear character was popular'])
+    >>> hyp = ['i love pizza','the sugar bare character was popular']
+    >>> print(wer(ref, hyp))
+    0.2
+    >>> ref.save('references')
+    >>> ref = TokenizedCorpus.load('references')
+    """
+
+    __slots__ = _ARRAYS + ("_validated",)
+
+    def __init__(self, texts, normalize=False):
+        if isinstance(texts, str):
+            raise AttributeError("TokenizedCorpus() takes a sequence of texts, not a single string.")
+        self.ids, self.offsets, self.vocabulary_bytes, self.vocabulary_offsets = tokenize_corpus(texts, normalize)
+
+    def __setattr__(self, name, value):
+        # Replacing an array discards the result of validating the previous one
+        object.__setattr__(self, name, value)
+        if name in _ARRAYS:
+            self._validated = False
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __repr__(self):
+        return (
+            f"TokenizedCorpus(texts={len(self)}, tokens={len(self.ids)}, "
+            f"vocabulary={len(self.vocabulary_offsets) - 1})"
+        )
+
+    @property
+    def vocabulary(self):
+        """
+        The distinct words of the corpus as a list of str, indexed by token id.
+        """
+        words = self.vocabulary_bytes.tobytes()
+        bounds = self.vocabulary_offsets.tolist()
+        return [words[bounds[j] : bounds[j + 1]].decode("utf-8", "surrogatepass") for j in range(len(bounds) - 1)]
+
+    def save(self, path):
+        """
+        Save the corpus to a directory of .npy files, one per array.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The directory to write. It is created if it does not exist and existing corpus files are overwritten.
+        """
+        os.makedirs(path, exist_ok=True)
+        for name in _ARRAYS:
+            value = getattr(self, name)
+            np.save(os.path.join(path, name + ".npy"), value.astype(np.int64) if "offsets" in name else value)
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """
+        Load a corpus written by save().
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The directory written by save().
+        mmap_mode : {None, 'r', 'r+', 'c'}, optional
+            Passed to np.load(). The default of 'r' memory-maps the arrays read-only, so loading is immediate and
+            the operating system shares the pages between processes scoring the same corpus. Use None to read the
+            arrays into memory.
+
+        Returns
+        -------
+        TokenizedCorpus
+            The loaded corpus. Its arrays are validated when it is first scored. Read-only arrays, as memory-mapped by
+            the default mmap_mode, are not checked again when the corpus is scored later.
+        """
+        corpus = cls.__new__(cls)
+        for name in _ARRAYS:
+            setattr(corpus, name, np.load(os.path.join(path, name + ".npy"), mmap_mode=mmap_mode))
+        return corpus
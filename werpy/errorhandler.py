@@ -8,6 +8,108 @@ Input validation and consistent exceptions for werpy public functions.
 import numpy as np
 
 
+def is_arrow_string_array(obj):
+    """
+    Check whether obj is a pyarrow string column.
+
+    pyarrow is an optional dependency and is never imported here; the check only looks at the type of obj.
+
+    Parameters
+    ----------
+    obj : object
+        The object to check.
+
+    Returns
+    -------
+    bool
+        True if obj is a pyarrow StringArray, LargeStringArray or a ChunkedArray of either.
+    """
+    cls = type(obj)
+    if not cls.__module__.startswith("pyarrow") or cls.__name__ not in (
+        "StringArray",
+        "LargeStringArray",
+        "ChunkedArray",
+    ):
+        return False
+    return str(obj.type) in ("string", "large_string")
+
+
+def is_tokenized_corpus(obj):
+    """
+    Check whether obj is a werpy TokenizedCorpus.
+
+    The corpus module is not imported here, as it depends on the compiled metrics module that imports this one; the
+    check only looks at the class names of obj.
+
+    Parameters
+    ----------
+    obj : object
+        The object to check.
+
+    Returns
+    -------
+    bool
+        True if obj is a TokenizedCorpus or an instance of a subclass of it.
+    """
+    return any(
+        cls.__name__ == "TokenizedCorpus" and cls.__module__ == "werpy.corpus" for cls in type(obj).__mro__
+    )
+
+
+def check_return_type(return_type, allowed=("list", "numpy")):
+    """
+    Validate the return_type option of the per-sequence functions.
+
+    Parameters
+    ----------
+    return_type : str
+        The requested result type.
+    allowed : tuple of str, optional
+        The result types the function supports, the default first.
+
+    Raises
+    ------
+    ValueError
+        if return_type is not one of allowed.
+    """
+    if return_type not in allowed:
+        raise ValueError(f"return_type must be {' or '.join(repr(t) for t in allowed)}.")
+
+
+def check_reference_words(reference, result):
+    """
+    Raise the blank reference error of error_handler for a single reference text that has no words.
+
+    error_handler checks the texts as given. With normalize=True, a reference made only of punctuation, such as "!!!",
+    has no words once normalized, so the scoring functions call this for normalized texts to check a single pair
+    again from the number of reference words in its result. Batches are left as they are, as error_handler does not
+    check the texts of a batch.
+
+    Parameters
+    ----------
+    reference : str, list, numpy array, pyarrow string array or TokenizedCorpus
+        The reference text or texts that were scored.
+    result : numpy array or dict
+        The scoring result of the metrics functions: a single row, an (n, k) array, or a columnar dict, with the
+        number of reference words in the m column.
+
+    Raises
+    ------
+    ZeroDivisionError
+        if reference is a single string with no words.
+    """
+    if not isinstance(reference, str):
+        return
+    if isinstance(result, dict):
+        m = result["m"][0]
+    else:
+        m = result[0][2] if np.ndim(result) == 2 else result[2]
+    if m == 0:
+        raise ZeroDivisionError(
+            "Invalid input: reference must not be blank, and reference and hypothesis cannot both be empty."
+        )
+
+
 def error_handler(reference, hypothesis):
     """
     Validate inputs and raise consistent exceptions.
@@ -18,9 +120,9 @@ def error_handler(reference, hypothesis):
 
     Parameters
     ----------
-    reference : str, list or numpy array
+    reference : str, list, numpy array, pyarrow string array or TokenizedCorpus
         The ground truth transcription of a recorded speech or the expected output of a live speech.
-    hypothesis : str, list or numpy array
+    hypothesis : str, list, numpy array, pyarrow string array or TokenizedCorpus
         The text generated by a speech-to-text algorithm/system which will be compared to the reference text.
 
     Raises
@@ -38,15 +140,20 @@ def error_handler(reference, hypothesis):
         True if validation passes.
     """
     valid_types = (str, list, np.ndarray)
+    ref_is_valid = isinstance(reference, valid_types)
+    hyp_is_valid = isinstance(hypothesis, valid_types)
+    # The columnar checks inspect the class of the input, so they only run for inputs that are not already valid
+    ref_is_columnar = not ref_is_valid and (is_arrow_string_array(reference) or is_tokenized_corpus(reference))
+    hyp_is_columnar = not hyp_is_valid and (is_arrow_string_array(hypothesis) or is_tokenized_corpus(hypothesis))
 
-    if not isinstance(reference, valid_types) or not isinstance(hypothesis, valid_types):
+    if not (ref_is_valid or ref_is_columnar) or not (hyp_is_valid or hyp_is_columnar):
         raise AttributeError(
             "All text should be in a string format. Please check your input does not include any "
             "Numeric data types."
         )
 
-    ref_is_seq = isinstance(reference, (list, np.ndarray))
-    hyp_is_seq = isinstance(hypothesis, (list, np.ndarray))
+    ref_is_seq = isinstance(reference, (list, np.ndarray)) or ref_is_columnar
+    hyp_is_seq = isinstance(hypothesis, (list, np.ndarray)) or hyp_is_columnar
 
     if ref_is_seq != hyp_is_seq:
         raise AttributeError(
@@ -2,78 +2,695 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 """
-This Cython module provides functions for calculating string matching metrics between 
+This Cython module provides functions for calculating string matching metrics between
 reference and hypothesis strings. It contains two functions: calculations and metrics.
-The calculations function takes two input sequences (reference and hypothesis) and 
-returns a ragged array containing the word error rate (WER), Levenshtein distance (LD), 
-number of words in the reference sequence, counts of insertions, deletions and 
-substitutions, as well as lists of inserted, deleted and substituted words. The metrics 
-function applies vectorization to the calculations function, enabling it to take in 
+The calculations function takes two input sequences (reference and hypothesis) and
+returns a ragged array containing the word error rate (WER), Levenshtein distance (LD),
+number of words in the reference sequence, counts of insertions, deletions and
+substitutions, as well as lists of inserted, deleted and substituted words. The metrics
+function applies vectorization to the calculations function, enabling it to take in
 multiple values for reference and hypothesis in the form of lists or numpy arrays.
 
-This Cython module provides efficient implementations of word error rate (WER) and 
+This Cython module provides efficient implementations of word error rate (WER) and
 Levenshtein distance (LD) calculations by utilizing C data types.
 
+Before any dynamic programming takes place, every token is interned to an int32 id
+using a vocabulary shared across the whole batch. The DP kernels therefore compare C
+integers only and never touch Python objects inside the O(m*n) loops.
+
+Pairs whose (m+1) x (n+1) DP matrix would exceed _LINEAR_MEMORY_CELLS are aligned
+with a linear-memory divide and conquer that reports the same alignment.
+
 Functions:
-- calculations(reference, hypothesis) -> np.ndarray: Calculates WER and related metrics 
+- calculations(reference, hypothesis) -> np.ndarray: Calculates WER and related metrics
 for two input sequences and returns a ragged array containing the metrics.
-- metrics(reference, hypothesis) -> np.ndarray: Applies vectorization to the 
-calculations function to calculate WER and related metrics for multiple pairs of input 
+- metrics(reference, hypothesis) -> np.ndarray: Applies vectorization to the
+calculations function to calculate WER and related metrics for multiple pairs of input
 sequences.
 """
 
+import os
+import string
+import unicodedata
+
 import numpy as np
 cimport numpy as cnp
 
 cnp.import_array()
 
 cimport cython
+from cython.parallel cimport prange, threadid
+from cpython.ref cimport PyObject, Py_INCREF, Py_XDECREF
+from cpython.unicode cimport (
+    PyUnicode_1BYTE_KIND,
+    PyUnicode_2BYTE_KIND,
+    PyUnicode_4BYTE_KIND,
+    PyUnicode_DATA,
+    PyUnicode_DecodeUTF8,
+    PyUnicode_GET_LENGTH,
+    PyUnicode_KIND,
+    PyUnicode_READ,
+    Py_UNICODE_ISSPACE,
+)
+from libc.limits cimport INT_MAX
+from libc.stdint cimport uint64_t
+from libc.stdlib cimport malloc, realloc, free
+from libc.string cimport memcmp, memcpy, memmove, memset
+from libc.math cimport INFINITY
+
+from .errorhandler import is_arrow_string_array, is_tokenized_corpus
+
+
+cdef extern from "Python.h":
+    bint PyUnicode_IS_ASCII(object text)
+    # The same macros as PyUnicode_READ and Py_UNICODE_ISSPACE, usable without
+    # the GIL: they only read the immutable string data and the Unicode tables
+    Py_UCS4 _read_code_point "PyUnicode_READ"(int kind, const void* data, Py_ssize_t index) nogil
+    bint _is_space_code_point "Py_UNICODE_ISSPACE"(Py_UCS4 ch) nogil
+
+
+# ---------------------------------------------------------------------------
+# Tokenization: whitespace splitting straight from the string buffers
+# ---------------------------------------------------------------------------
+
+cdef inline uint64_t _hash_span(const unsigned char* p, Py_ssize_t n) noexcept nogil:
+    """
+    64-bit hash of a byte span, mixed 8 bytes at a time.
+    """
+    cdef uint64_t h = 0x9E3779B97F4A7C15ULL ^ <uint64_t>n
+    cdef uint64_t chunk
+
+    while n >= 8:
+        memcpy(&chunk, p, 8)
+        h = (h ^ chunk) * 0xFF51AFD7ED558CCDULL
+        h ^= h >> 32
+        p += 8
+        n -= 8
+    chunk = 0
+    if n > 0:
+        memcpy(&chunk, p, n)
+    h = (h ^ chunk) * 0xC4CEB9FE1A85EC53ULL
+    h ^= h >> 29
+    return h
+
+
+cdef inline Py_ssize_t _utf8_space(const unsigned char* p, Py_ssize_t avail) noexcept nogil:
+    """
+    Byte length of the whitespace character at p, or 0 if it is not whitespace.
+
+    Matches the characters str.split() splits on: ASCII whitespace, U+001C-U+001F,
+    U+0085, U+00A0, U+1680, U+2000-U+200A, U+2028, U+2029, U+202F, U+205F and U+3000.
+    """
+    cdef unsigned char c = p[0]
+
+    if c < 0x80:
+        return 1 if c == 32 or 9 <= c <= 13 or 28 <= c <= 31 else 0
+    if c == 0xC2:
+        return 2 if avail >= 2 and (p[1] == 0x85 or p[1] == 0xA0) else 0
+    if avail < 3:
+        return 0
+    if c == 0xE1:
+        return 3 if p[1] == 0x9A and p[2] == 0x80 else 0
+    if c == 0xE2:
+        if p[1] == 0x80:
+            return 3 if 0x80 <= p[2] <= 0x8A or p[2] == 0xA8 or p[2] == 0xA9 or p[2] == 0xAF else 0
+        return 3 if p[1] == 0x81 and p[2] == 0x9F else 0
+    if c == 0xE3:
+        return 3 if p[1] == 0x80 and p[2] == 0x80 else 0
+    return 0
+
+
+cdef class _SpanVocab:
+    """
+    Interns tokens to dense int32 ids without creating a str per token.
+
+    Tokens are keyed by their UTF-8 bytes in an open-addressing hash table and
+    numbered in the order they are first seen. The bytes of each distinct token
+    are copied once into an arena, so the word strings are only decoded when
+    words() is called; the WER-only and counts-only paths never call it.
+
+    With normalize=True, the tokenizers normalize every text like normalize()
+    before splitting it (see _intern_str).
+    """
+    cdef bint normalize
+    cdef Py_ssize_t size
+    cdef Py_ssize_t capacity
+    cdef cnp.int32_t* slots
+    cdef uint64_t* hashes
+    cdef Py_ssize_t* starts
+    cdef Py_ssize_t* lengths
+    cdef unsigned char* keys
+    cdef Py_ssize_t keys_used
+    cdef Py_ssize_t keys_capacity
+    cdef unsigned char* scratch
+    cdef Py_ssize_t scratch_capacity
+
+    def __cinit__(self, bint normalize=False):
+        self.normalize = normalize
+        self.size = 0
+        self.capacity = 0
+        self.keys_used = 0
+        self.keys_capacity = 0
+        self.scratch_capacity = 0
+        self._grow()
+
+    def __dealloc__(self):
+        free(self.slots)
+        free(self.hashes)
+        free(self.starts)
+        free(self.lengths)
+        free(self.keys)
+        free(self.scratch)
+
+    cdef int _grow(self) except -1:
+        """
+        Double the entry capacity and rebuild the slot table at twice that size.
+        """
+        cdef Py_ssize_t capacity = 2 * self.capacity if self.capacity else 64
+        cdef Py_ssize_t mask = 2 * capacity - 1
+        cdef Py_ssize_t e, slot
+        cdef cnp.int32_t* slots = <cnp.int32_t*>malloc(2 * capacity * sizeof(cnp.int32_t))
+        cdef uint64_t* hashes = <uint64_t*>malloc(capacity * sizeof(uint64_t))
+        cdef Py_ssize_t* starts = <Py_ssize_t*>malloc(capacity * sizeof(Py_ssize_t))
+        cdef Py_ssize_t* lengths = <Py_ssize_t*>malloc(capacity * sizeof(Py_ssize_t))
+
+        if slots == NULL or hashes == NULL or starts == NULL or lengths == NULL:
+            free(slots)
+            free(hashes)
+            free(starts)
+            free(lengths)
+            raise MemoryError()
+
+        memset(slots, 0xFF, 2 * capacity * sizeof(cnp.int32_t))
+        if self.size:
+            memcpy(hashes, self.hashes, self.size * sizeof(uint64_t))
+            memcpy(starts, self.starts, self.size * sizeof(Py_ssize_t))
+            memcpy(lengths, self.lengths, self.size * sizeof(Py_ssize_t))
+        for e in range(self.size):
+            slot = <Py_ssize_t>(hashes[e] & <uint64_t>mask)
+            while slots[slot] >= 0:
+                slot = (slot + 1) & mask
+            slots[slot] = <cnp.int32_t>e
+
+        free(self.slots)
+        free(self.hashes)
+        free(self.starts)
+        free(self.lengths)
+        self.slots = slots
+        self.hashes = hashes
+        self.starts = starts
+        self.lengths = lengths
+        self.capacity = capacity
+        return 0
+
+    cdef unsigned char* _reserve(self, unsigned char** buffer, Py_ssize_t* capacity, Py_ssize_t needed) except NULL:
+        """
+        Grow a malloc'd byte buffer geometrically to hold at least needed bytes.
+        """
+        cdef Py_ssize_t grown_capacity
+        cdef unsigned char* grown
+
+        if needed > capacity[0] or buffer[0] == NULL:
+            grown_capacity = max(2 * capacity[0], needed, 4096)
+            grown = <unsigned char*>realloc(buffer[0], grown_capacity)
+            if grown == NULL:
+                raise MemoryError()
+            buffer[0] = grown
+            capacity[0] = grown_capacity
+        return buffer[0]
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void clear(self) noexcept:
+        """
+        Remove every token but keep the allocated capacity, so the table can be
+        reused. Only the slots of the stored tokens are reset, found by probing
+        from their hashes until the slot holding each entry.
+        """
+        cdef Py_ssize_t mask = 2 * self.capacity - 1
+        cdef Py_ssize_t e, slot
+
+        for e in range(self.size):
+            slot = <Py_ssize_t>(self.hashes[e] & <uint64_t>mask)
+            while self.slots[slot] != e:
+                slot = (slot + 1) & mask
+            self.slots[slot] = -1
+        self.size = 0
+        self.keys_used = 0
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef cnp.int32_t intern(self, const unsigned char* span, Py_ssize_t length) except -1:
+        """
+        Return the token id of a UTF-8 span, adding it to the vocabulary if unseen.
+        """
+        cdef uint64_t h = _hash_span(span, length)
+        cdef Py_ssize_t mask = 2 * self.capacity - 1
+        cdef Py_ssize_t slot = <Py_ssize_t>(h & <uint64_t>mask)
+        cdef cnp.int32_t e
+
+        while True:
+            e = self.slots[slot]
+            if e < 0:
+                break
+            if (
+                self.hashes[e] == h
+                and self.lengths[e] == length
+                and memcmp(self.keys + self.starts[e], span, length) == 0
+            ):
+                return e
+            slot = (slot + 1) & mask
+
+        self._reserve(&self.keys, &self.keys_capacity, self.keys_used + length)
+        memcpy(self.keys + self.keys_used, span, length)
+        if self.size == self.capacity:
+            self._grow()
+            mask = 2 * self.capacity - 1
+            slot = <Py_ssize_t>(h & <uint64_t>mask)
+            while self.slots[slot] >= 0:
+                slot = (slot + 1) & mask
+        e = <cnp.int32_t>self.size
+        self.slots[slot] = e
+        self.hashes[e] = h
+        self.starts[e] = self.keys_used
+        self.lengths[e] = length
+        self.keys_used += length
+        self.size += 1
+        return e
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef cnp.int32_t intern_code_points(self, int kind, const void* data, Py_ssize_t start, Py_ssize_t end) except -1:
+        """
+        Return the token id of text[start:end] of a UCS1/UCS2/UCS4 buffer. The
+        code points are encoded to UTF-8 in a scratch buffer, so a word gets the
+        same id whichever storage its string uses.
+        """
+        cdef unsigned char* out = self._reserve(&self.scratch, &self.scratch_capacity, 4 * (end - start))
+        cdef Py_ssize_t k = 0
+        cdef Py_ssize_t pos
+        cdef unsigned int cp
+
+        for pos in range(start, end):
+            cp = <unsigned int>PyUnicode_READ(kind, data, pos)
+            if cp < 0x80:
+                out[k] = <unsigned char>cp
+                k += 1
+            elif cp < 0x800:
+                out[k] = <unsigned char>(0xC0 | (cp >> 6))
+                out[k + 1] = <unsigned char>(0x80 | (cp & 0x3F))
+                k += 2
+            elif cp < 0x10000:
+                out[k] = <unsigned char>(0xE0 | (cp >> 12))
+                out[k + 1] = <unsigned char>(0x80 | ((cp >> 6) & 0x3F))
+                out[k + 2] = <unsigned char>(0x80 | (cp & 0x3F))
+                k += 3
+            else:
+                out[k] = <unsigned char>(0xF0 | (cp >> 18))
+                out[k + 1] = <unsigned char>(0x80 | ((cp >> 12) & 0x3F))
+                out[k + 2] = <unsigned char>(0x80 | ((cp >> 6) & 0x3F))
+                out[k + 3] = <unsigned char>(0x80 | (cp & 0x3F))
+                k += 4
+        return self.intern(out, k)
+
+    cdef list words(self):
+        """
+        Decode the vocabulary, so that words()[token_id] is the word of token_id.
+        """
+        cdef Py_ssize_t e
+        cdef list vocab_words = []
+
+        for e in range(self.size):
+            vocab_words.append(
+                PyUnicode_DecodeUTF8(<const char*>self.keys + self.starts[e], self.lengths[e], "surrogatepass")
+            )
+        return vocab_words
+
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cpdef cnp.ndarray calculations(object reference, object hypothesis):
-    cdef list reference_word = reference.split()
-    cdef list hypothesis_word = hypothesis.split()
+cdef Py_ssize_t _intern_utf8(
+    _SpanVocab table,
+    const unsigned char* text,
+    Py_ssize_t length,
+    cnp.int32_t* out,
+) except -1:
+    """
+    Split one UTF-8 text on whitespace, exactly like str.split(), and write the
+    token ids into out (room for (length + 1) // 2 ids). Returns the number of ids.
+    """
+    cdef Py_ssize_t pos = 0
+    cdef Py_ssize_t start, space
+    cdef Py_ssize_t k = 0
+
+    while pos < length:
+        space = _utf8_space(text + pos, length - pos)
+        if space:
+            pos += space
+            continue
+        start = pos
+        while pos < length:
+            space = _utf8_space(text + pos, length - pos)
+            if space:
+                break
+            pos += 1
+        out[k] = table.intern(text + start, pos - start)
+        k += 1
+    return k
 
-    # Use Py_ssize_t for indices and sizes
-    # Py_ssize_t matches Python's internal index type and avoids unnecessary
-    # casts or overflow risks when working with Python lists and memoryviews.
-    cdef Py_ssize_t m = len(reference_word)
-    cdef Py_ssize_t n = len(hypothesis_word)
-    cdef Py_ssize_t i, j
 
-    # Metrics and outputs
-    cdef int ld, insertions, deletions, substitutions
-    cdef double wer
-    cdef list inserted_words, deleted_words, substituted_words
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _intern_str(_SpanVocab table, object text, cnp.int32_t* out) except -1:
+    """
+    Split one str on whitespace, exactly like str.split(), reading its PyUnicode
+    buffer in place, and write the token ids into out (room for
+    (len(text) + 1) // 2 ids). Returns the number of ids.
+
+    ASCII strings are already UTF-8 and are handed to _intern_utf8 as they are.
+
+    If the table normalizes, the text is first normalized like normalize(),
+    which never adds tokens: an ASCII string into the table's scratch buffer,
+    without creating a str, and any other string by _normalize_unicode.
+    """
+    if not isinstance(text, str):
+        raise AttributeError(
+            "All text should be in a string format. Please check your input does not include any "
+            "Numeric data types."
+        )
+
+    cdef Py_ssize_t length = PyUnicode_GET_LENGTH(text)
+    cdef unsigned char* normalized
+    cdef Py_ssize_t pos = 0
+    cdef Py_ssize_t start
+    cdef Py_ssize_t k = 0
+
+    if table.normalize:
+        normalized = table._reserve(&table.scratch, &table.scratch_capacity, 4 * length)
+        if PyUnicode_IS_ASCII(text):
+            length = _normalize_ascii(<const unsigned char*>PyUnicode_DATA(text), length, normalized)
+            return _intern_utf8(table, normalized, length, out)
+        text = _normalize_unicode(text, <Py_UCS4*>normalized)
+        length = PyUnicode_GET_LENGTH(text)
+
+    cdef int kind = PyUnicode_KIND(text)
+    cdef const void* data = PyUnicode_DATA(text)
+
+    if PyUnicode_IS_ASCII(text):
+        return _intern_utf8(table, <const unsigned char*>data, length, out)
+
+    while pos < length:
+        if Py_UNICODE_ISSPACE(PyUnicode_READ(kind, data, pos)):
+            pos += 1
+            continue
+        start = pos
+        while pos < length and not Py_UNICODE_ISSPACE(PyUnicode_READ(kind, data, pos)):
+            pos += 1
+        out[k] = table.intern_code_points(kind, data, start, pos)
+        k += 1
+    return k
+
+
+cdef Py_ssize_t _intern_utf8_text(
+    _SpanVocab table,
+    const unsigned char* text,
+    Py_ssize_t length,
+    cnp.int32_t* out,
+) except -1:
+    """
+    _intern_utf8 for a text that is normalized first if the table normalizes.
+    ASCII texts are normalized into the table's scratch buffer; others are
+    decoded and go through _intern_str.
+    """
+    cdef Py_ssize_t pos
+    cdef unsigned char* normalized
+
+    if not table.normalize:
+        return _intern_utf8(table, text, length, out)
+    for pos in range(length):
+        if text[pos] >= 0x80:
+            return _intern_str(table, PyUnicode_DecodeUTF8(<const char*>text, length, "surrogatepass"), out)
+    normalized = table._reserve(&table.scratch, &table.scratch_capacity, length)
+    return _intern_utf8(table, normalized, _normalize_ascii(text, length, normalized), out)
 
-    # Variables for optimized DP loop
-    cdef int cost, del_cost, ins_cost, sub_cost, best
 
-    # Initialize the Levenshtein distance matrix
-    # Use empty instead of zeros to avoid redundant initialization.
-    # SAFETY: All cells are explicitly initialized below (row 0, col 0, then DP loop).
-    # Allocate the (m+1) x (n+1) DP matrix without zero-initialization to avoid
-    # redundant memory writes. Boundary conditions are initialized explicitly.
-    cdef cnp.int32_t[:, :] ldm = np.empty((m + 1, n + 1), dtype=np.int32)
+cdef cnp.ndarray _encode_text(object text, _SpanVocab table):
+    """
+    Tokenize a single string and return its int32 token ids.
+    """
+    cdef cnp.ndarray ids = np.empty((len(text) + 1) // 2, dtype=np.int32)
+    return ids[:_intern_str(table, text, <cnp.int32_t*>cnp.PyArray_DATA(ids))]
 
-    # Initialize first column and first row (boundary conditions)
-    for i in range(m + 1):
-        ldm[i, 0] = <cnp.int32_t>i
-    for j in range(n + 1):
-        ldm[0, j] = <cnp.int32_t>j
 
-    # Fill the Levenshtein distance matrix
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef tuple _encode_batch(object texts, _SpanVocab table):
+    """
+    Tokenize a batch of strings into a flat int32 id array with CSR-style offsets.
+
+    The ids of text k are ids[offsets[k]:offsets[k + 1]]. Each string is scanned
+    once in place and no per-token str is created. A pyarrow string column is
+    tokenized from its UTF-8 buffers by _encode_arrow_batch instead, and a
+    TokenizedCorpus is not tokenized again at all (see _encode_corpus).
+
+    Returns (ids, offsets) where ids is int32 and offsets is intp of length len(texts) + 1.
+    """
+    if not isinstance(texts, list):
+        if is_tokenized_corpus(texts):
+            return _encode_corpus(texts, table)
+        return _encode_arrow_batch(texts, table)
+
+    cdef Py_ssize_t n_texts = len(texts)
+    cdef Py_ssize_t idx
+    cdef Py_ssize_t total = 0
+    cdef Py_ssize_t capacity = 0
+    cdef object text
+
+    # A text of length L holds at most (L + 1) // 2 tokens
+    for text in <list>texts:
+        capacity += (len(text) + 1) // 2 if isinstance(text, str) else 0
+
+    cdef cnp.ndarray offsets = np.empty(n_texts + 1, dtype=np.intp)
+    cdef cnp.ndarray ids = np.empty(capacity, dtype=np.int32)
+    cdef cnp.npy_intp* off = <cnp.npy_intp*>cnp.PyArray_DATA(offsets)
+    cdef cnp.int32_t* base = <cnp.int32_t*>cnp.PyArray_DATA(ids)
+
+    off[0] = 0
+    for idx in range(n_texts):
+        total += _intern_str(table, (<list>texts)[idx], base + total)
+        off[idx + 1] = total
+
+    return ids[:total], offsets
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef tuple _encode_arrow_batch(object texts, _SpanVocab table):
+    """
+    Tokenize a pyarrow StringArray, LargeStringArray or ChunkedArray of either
+    in place, reading the UTF-8 data and offsets buffers of each chunk directly.
+    No str is created per row or per token. Returns (ids, offsets) in the same
+    layout as _encode_batch.
+    """
+    cdef Py_ssize_t n_texts = len(texts)
+    cdef Py_ssize_t idx = 0
+    cdef Py_ssize_t k, n_rows, first, start, end, bound
+    cdef Py_ssize_t total = 0
+    cdef Py_ssize_t capacity = 16
+    cdef bint large
+    cdef const unsigned char* data
+    cdef const char* text_off
+    cdef list chunks = list(texts.chunks) if hasattr(texts, "chunks") else [texts]
+    cdef object buffers
+    cdef cnp.ndarray data_view, offsets_view
+
+    cdef cnp.ndarray offsets = np.empty(n_texts + 1, dtype=np.intp)
+    cdef cnp.npy_intp* off = <cnp.npy_intp*>cnp.PyArray_DATA(offsets)
+    cdef cnp.ndarray ids
+    cdef cnp.ndarray grown
+
+    for chunk in chunks:
+        if chunk.null_count:
+            raise AttributeError(
+                "All text should be in a string format. Please check your input does not include any "
+                "missing values."
+            )
+        capacity += chunk.nbytes // 4
+    ids = np.empty(capacity, dtype=np.int32)
+
+    off[0] = 0
+    for chunk in chunks:
+        n_rows = len(chunk)
+        if n_rows == 0:
+            continue
+        large = str(chunk.type) == "large_string"
+        buffers = chunk.buffers()
+        # Views over the Arrow buffers, no copy
+        offsets_view = np.frombuffer(buffers[1], dtype=np.uint8)
+        data_view = np.frombuffer(buffers[2], dtype=np.uint8) if buffers[2] is not None else np.empty(0, np.uint8)
+        text_off = <const char*>cnp.PyArray_DATA(offsets_view)
+        data = <const unsigned char*>cnp.PyArray_DATA(data_view)
+        first = chunk.offset
+
+        for k in range(n_rows):
+            if large:
+                start = (<const long long*>text_off)[first + k]
+                end = (<const long long*>text_off)[first + k + 1]
+            else:
+                start = (<const cnp.int32_t*>text_off)[first + k]
+                end = (<const cnp.int32_t*>text_off)[first + k + 1]
+            bound = (end - start + 1) // 2
+            if total + bound > capacity:
+                capacity = max(2 * capacity, total + bound)
+                grown = np.empty(capacity, dtype=np.int32)
+                grown[:total] = ids[:total]
+                ids = grown
+            total += _intern_utf8_text(
+                table, data + start, end - start, <cnp.int32_t*>cnp.PyArray_DATA(ids) + total
+            )
+            off[idx + 1] = total
+            idx += 1
+
+    return ids[:total], offsets
+
+
+# ---------------------------------------------------------------------------
+# Pre-tokenized corpora
+# ---------------------------------------------------------------------------
+
+cpdef tuple tokenize_corpus(object texts, bint normalize=False):
+    """
+    Tokenize a batch of texts once for a TokenizedCorpus, normalizing them
+    first with normalize=True.
+
+    Returns (ids, offsets, vocabulary_bytes, vocabulary_offsets): the int32 token
+    ids and intp CSR offsets of the texts, and the UTF-8 bytes of the vocabulary
+    with the intp offsets of each word, so that token id k is the word
+    vocabulary_bytes[vocabulary_offsets[k]:vocabulary_offsets[k + 1]].
+    """
+    cdef _SpanVocab table = _SpanVocab(normalize)
+    cdef cnp.ndarray ids, offsets
+    ids, offsets = _encode_batch(_batch_texts(texts), table)
+
+    cdef cnp.ndarray vocabulary_bytes = np.empty(table.keys_used, dtype=np.uint8)
+    cdef cnp.ndarray vocabulary_offsets = np.empty(table.size + 1, dtype=np.intp)
+    cdef cnp.npy_intp* voc_off = <cnp.npy_intp*>cnp.PyArray_DATA(vocabulary_offsets)
+    cdef Py_ssize_t e
+
+    # Distinct words are appended to the arena in id order
+    if table.keys_used:
+        memcpy(cnp.PyArray_DATA(vocabulary_bytes), table.keys, table.keys_used)
+    for e in range(table.size):
+        voc_off[e] = table.starts[e]
+    voc_off[table.size] = table.keys_used
+    return ids.copy(), offsets, vocabulary_bytes, vocabulary_offsets
+
+
+_CORPUS_ARRAYS = ("ids", "offsets", "vocabulary_bytes", "vocabulary_offsets")
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef tuple _encode_corpus(object corpus, _SpanVocab table):
+    """
+    Return the (ids, offsets) of a TokenizedCorpus in the id space of table.
+
+    The corpus vocabulary is interned into table, which costs one hash lookup
+    per distinct word rather than a scan of every text. When the corpus comes
+    first its ids are already table ids and its arrays, possibly memory-mapped,
+    are used as they are; otherwise they are remapped through the vocabulary.
+    """
+    cdef cnp.ndarray ids = np.ascontiguousarray(corpus.ids, dtype=np.int32)
+    cdef cnp.ndarray offsets = np.ascontiguousarray(corpus.offsets, dtype=np.intp)
+    cdef cnp.ndarray vocabulary_bytes = np.ascontiguousarray(corpus.vocabulary_bytes, dtype=np.uint8)
+    cdef cnp.ndarray vocabulary_offsets = np.ascontiguousarray(corpus.vocabulary_offsets, dtype=np.intp)
+    cdef Py_ssize_t n_words = cnp.PyArray_DIMS(vocabulary_offsets)[0] - 1
+    cdef Py_ssize_t n_ids = cnp.PyArray_DIMS(ids)[0]
+    cdef Py_ssize_t first = table.size
+    cdef Py_ssize_t k
+    cdef cnp.npy_intp* voc_off = <cnp.npy_intp*>cnp.PyArray_DATA(vocabulary_offsets)
+    cdef const unsigned char* words = <const unsigned char*>cnp.PyArray_DATA(vocabulary_bytes)
+    cdef const cnp.int32_t* src = <const cnp.int32_t*>cnp.PyArray_DATA(ids)
+
+    cdef Py_ssize_t n_texts = cnp.PyArray_DIMS(offsets)[0] - 1
+    cdef const cnp.npy_intp* off = <const cnp.npy_intp*>cnp.PyArray_DATA(offsets)
+
+    if table.normalize:
+        raise ValueError(
+            "A TokenizedCorpus is already tokenized and cannot be normalized. "
+            "Build it with TokenizedCorpus(texts, normalize=True) instead."
+        )
+
+    # The kernels index the arrays without bounds checks, so validate them. Only
+    # read-only arrays, such as the memory maps of TokenizedCorpus.load(), cannot
+    # change afterwards, so only for those is the check cached on the corpus.
+    cdef bint read_only = not any(getattr(corpus, name).flags.writeable for name in _CORPUS_ARRAYS)
+    if not (read_only and corpus._validated):
+        for k in range(n_words):
+            if voc_off[k] < 0 or voc_off[k] > voc_off[k + 1] or voc_off[k + 1] > cnp.PyArray_DIMS(vocabulary_bytes)[0]:
+                raise ValueError("The TokenizedCorpus vocabulary offsets are invalid.")
+        for k in range(n_texts):
+            if off[k] < 0 or off[k] > off[k + 1] or off[k + 1] > n_ids:
+                raise ValueError("The TokenizedCorpus offsets are invalid.")
+        for k in range(n_ids):
+            if src[k] < 0 or src[k] >= n_words:
+                raise ValueError("The TokenizedCorpus contains token ids outside of its vocabulary.")
+        if read_only:
+            corpus._validated = True
+
+    cdef cnp.ndarray mapping = np.empty(n_words, dtype=np.int32)
+    cdef cnp.int32_t* to_table = <cnp.int32_t*>cnp.PyArray_DATA(mapping)
+    for k in range(n_words):
+        to_table[k] = table.intern(words + voc_off[k], voc_off[k + 1] - voc_off[k])
+
+    if first == 0 and table.size == n_words:
+        return ids, offsets
+    return mapping[ids], offsets
+
+
+# ---------------------------------------------------------------------------
+# DP kernels (int32 token ids, no Python objects)
+# ---------------------------------------------------------------------------
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _fill_ld_matrix(
+    const cnp.int32_t* ref_ids,
+    Py_ssize_t m,
+    const cnp.int32_t* hyp_ids,
+    Py_ssize_t n,
+    cnp.int32_t* ldm,
+) noexcept nogil:
+    """
+    Fill a row-major (m+1) x (n+1) Levenshtein distance matrix.
+
+    SAFETY: All cells are explicitly initialized (row 0, col 0, then DP loop), so
+    the caller may pass uninitialized memory.
+    """
+    cdef Py_ssize_t width = n + 1
+    cdef Py_ssize_t i, j
+    cdef cnp.int32_t ref_id
+    cdef cnp.int32_t* row
+    cdef cnp.int32_t* above
+    cdef cnp.int32_t cost, del_cost, ins_cost, sub_cost, best
+
+    # Initialize first row (boundary condition)
+    for j in range(width):
+        ldm[j] = <cnp.int32_t>j
+
     # Compute edit distances using a branch-free inner loop and manual minimum
     # selection to keep all operations at C level and minimize per-cell overhead.
-    # No boundary condition branches in the hot loop, manual min selection.
     for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            cost = 0 if reference_word[i - 1] == hypothesis_word[j - 1] else 1
+        row = ldm + i * width
+        above = row - width
+        row[0] = <cnp.int32_t>i
+        ref_id = ref_ids[i - 1]
+        for j in range(1, width):
+            cost = 0 if ref_id == hyp_ids[j - 1] else 1
 
-            del_cost = ldm[i - 1, j] + 1
-            ins_cost = ldm[i, j - 1] + 1
-            sub_cost = ldm[i - 1, j - 1] + cost
+            del_cost = above[j] + 1
+            ins_cost = row[j - 1] + 1
+            sub_cost = above[j - 1] + cost
 
             best = del_cost
             if ins_cost < best:
@@ -81,285 +698,1193 @@ cpdef cnp.ndarray calculations(object reference, object hypothesis):
             if sub_cost < best:
                 best = sub_cost
 
-            ldm[i, j] = best
+            row[j] = best
+
+
+# Full matrices above this many cells are aligned with the linear-memory
+# divide-and-conquer instead (4M int32 cells = 16 MiB per pair, or 32 MiB for
+# the float64 matrix of a weighted alignment).
+cdef Py_ssize_t _LINEAR_MEMORY_CELLS = 1 << 22
+# Blocks at or below this many cells are aligned directly inside the
+# divide-and-conquer recursion.
+cdef Py_ssize_t _LINEAR_LEAF_CELLS = 1 << 18
+
+
+cdef struct _AlignWalk:
+    # State of one backtrace. Operations are emitted from the end of the alignment
+    # backwards. A substitution stores both token ids, an insertion stores -1 as the
+    # reference id and a deletion stores -1 as the hypothesis id. op_ref/op_hyp may
+    # be NULL when only the counts are needed.
+    const cnp.int32_t* ref_ids
+    const cnp.int32_t* hyp_ids
+    cnp.int32_t* op_ref
+    cnp.int32_t* op_hyp
+    Py_ssize_t n_ops
+    int insertions
+    int deletions
+    int substitutions
+    # Levenshtein distance of the pair. Equal to n_ops except for a weighted
+    # alignment, which can take more operations than the minimum.
+    int distance
+    # Row at which the last _walk_block or _walk_linear call stopped
+    Py_ssize_t exit_row
+
+
+cdef inline void _walk_init(
+    _AlignWalk* walk,
+    const cnp.int32_t* ref_ids,
+    const cnp.int32_t* hyp_ids,
+    cnp.int32_t* op_ref,
+    cnp.int32_t* op_hyp,
+) noexcept nogil:
+    walk.ref_ids = ref_ids
+    walk.hyp_ids = hyp_ids
+    walk.op_ref = op_ref
+    walk.op_hyp = op_hyp
+    walk.n_ops = 0
+    walk.insertions = 0
+    walk.deletions = 0
+    walk.substitutions = 0
+    walk.distance = 0
+    walk.exit_row = 0
+
+
+cdef inline void _walk_emit(_AlignWalk* walk, cnp.int32_t ref_id, cnp.int32_t hyp_id) noexcept nogil:
+    if walk.op_ref != NULL:
+        walk.op_ref[walk.n_ops] = ref_id
+        walk.op_hyp[walk.n_ops] = hyp_id
+    walk.n_ops += 1
+    if ref_id < 0:
+        walk.insertions += 1
+    elif hyp_id < 0:
+        walk.deletions += 1
+    else:
+        walk.substitutions += 1
 
-    ld = ldm[m, n]
-    wer = (<double>ld) / m if m > 0 else 0.0
 
-    insertions, deletions, substitutions = 0, 0, 0
-    inserted_words, deleted_words, substituted_words = [], [], []
-    i, j = m, n
-    while i > 0 or j > 0:
-        if i > 0 and j > 0 and reference_word[i - 1] == hypothesis_word[j - 1]:
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _walk_block(
+    _AlignWalk* walk,
+    const cnp.int32_t* block,
+    Py_ssize_t top,
+    Py_ssize_t i,
+    Py_ssize_t j,
+) noexcept nogil:
+    """
+    Greedy backtrace from cell (i, j) over a row-major block holding rows top..i
+    and columns 0..j of the Levenshtein matrix, until the walk reaches row top or
+    column 0.
+
+    At every cell a match is taken first, then a substitution, an insertion and
+    finally a deletion. Returns the column at which the walk stopped and stores
+    the row in walk.exit_row.
+    """
+    cdef Py_ssize_t width = j + 1
+    cdef const cnp.int32_t* ref_ids = walk.ref_ids
+    cdef const cnp.int32_t* hyp_ids = walk.hyp_ids
+    cdef cnp.int32_t cell
+
+    while i > top and j > 0:
+        cell = block[(i - top) * width + j]
+        if ref_ids[i - 1] == hyp_ids[j - 1]:
+            i -= 1
+            j -= 1
+        elif cell == block[(i - 1 - top) * width + j - 1] + 1:
+            _walk_emit(walk, ref_ids[i - 1], hyp_ids[j - 1])
             i -= 1
             j -= 1
+        elif cell == block[(i - top) * width + j - 1] + 1:
+            _walk_emit(walk, -1, hyp_ids[j - 1])
+            j -= 1
         else:
-            if i > 0 and j > 0 and ldm[i, j] == ldm[i - 1, j - 1] + 1:
-                substitutions += 1
-                substituted_words.append((reference_word[i - 1], hypothesis_word[j - 1]))
-                i -= 1
-                j -= 1
-            elif j > 0 and ldm[i, j] == ldm[i, j - 1] + 1:
-                insertions += 1
-                inserted_words.append(hypothesis_word[j - 1])
-                j -= 1
-            elif i > 0 and ldm[i, j] == ldm[i - 1, j] + 1:
-                deletions += 1
-                deleted_words.append(reference_word[i - 1])
-                i -= 1
+            _walk_emit(walk, ref_ids[i - 1], -1)
+            i -= 1
 
-    inserted_words.reverse(), deleted_words.reverse(), substituted_words.reverse()
+    walk.exit_row = i
+    return j
 
-    return np.array(
-        [wer, ld, m, insertions, deletions, substitutions, inserted_words, deleted_words, substituted_words],
-        dtype=object)
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef cnp.ndarray _metrics_batch(list references, list hypotheses):
+cdef void _advance_row(
+    const cnp.int32_t* ref_ids,
+    const cnp.int32_t* hyp_ids,
+    Py_ssize_t i,
+    Py_ssize_t c,
+    const cnp.int32_t* above,
+    cnp.int32_t* row,
+) noexcept nogil:
     """
-    Private batch processing function. Processes multiple reference-hypothesis
-    pairs at C speed, eliminating np.vectorize overhead.
-
-    Returns (n, 9) object array where each row contains:
-    [wer, ld, m, insertions, deletions, substitutions, inserted_words, deleted_words, substituted_words]
+    Compute row i (columns 0..c) of the Levenshtein matrix from row i - 1.
     """
-    cdef Py_ssize_t n = len(references)
-    cdef Py_ssize_t idx
+    cdef Py_ssize_t j
+    cdef cnp.int32_t ref_id = ref_ids[i - 1]
+    cdef cnp.int32_t cost, del_cost, ins_cost, sub_cost, best
 
-    # Rows output, dtype=object because cols 6-8 are lists
-    cdef cnp.ndarray out = np.empty((n, 9), dtype=object)
+    row[0] = <cnp.int32_t>i
+    for j in range(1, c + 1):
+        cost = 0 if ref_id == hyp_ids[j - 1] else 1
 
-    cdef object r
-    for idx in range(n):
-        r = calculations(references[idx], hypotheses[idx])
+        del_cost = above[j] + 1
+        ins_cost = row[j - 1] + 1
+        sub_cost = above[j - 1] + cost
 
-        # Safety: unwrap 0-D wrappers if they ever occur
-        if isinstance(r, np.ndarray) and r.ndim == 0:
-            r = r.item()
+        best = del_cost
+        if ins_cost < best:
+            best = ins_cost
+        if sub_cost < best:
+            best = sub_cost
 
-        out[idx, :] = r
+        row[j] = best
 
-    return out
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _walk_linear(
+    _AlignWalk* walk,
+    Py_ssize_t top,
+    Py_ssize_t bottom,
+    Py_ssize_t c,
+    const cnp.int32_t* top_row,
+    cnp.int32_t* level_rows,
+    cnp.int32_t* spare,
+    cnp.int32_t* block,
+    Py_ssize_t width,
+) noexcept nogil:
+    """
+    Hirschberg-style divide and conquer backtrace in linear memory.
+
+    Walks greedily from cell (bottom, c) to row top or column 0, given only the
+    matrix row top_row = D[top][0..c]. The middle row is computed in a forward sweep, the
+    lower half is walked first (the walk runs backwards) and the upper half is
+    then walked from the column where the lower half left off. Every step looks
+    at the same forward DP values as a backtrace over the full matrix, so the
+    walk takes exactly the same path.
+
+    level_rows holds one width-sized row per remaining recursion level, spare is
+    one more row and block is the leaf block. Returns the column at which the walk
+    stopped and stores the row in walk.exit_row.
+    """
+    cdef Py_ssize_t rows = bottom - top + 1
+    cdef Py_ssize_t mid, i, c_mid
+    cdef cnp.int32_t* mid_row = level_rows
+    cdef cnp.int32_t* dst
+    cdef const cnp.int32_t* src
+
+    if bottom == top or c == 0:
+        walk.exit_row = bottom
+        return c
+
+    if rows * (c + 1) <= _LINEAR_LEAF_CELLS or rows == 2:
+        # Small enough: fill rows top..bottom and walk the block directly
+        memcpy(block, top_row, (c + 1) * sizeof(cnp.int32_t))
+        for i in range(top + 1, bottom + 1):
+            _advance_row(
+                walk.ref_ids, walk.hyp_ids, i, c,
+                block + (i - 1 - top) * (c + 1), block + (i - top) * (c + 1),
+            )
+        return _walk_block(walk, block, top, bottom, c)
+
+    # Sweep forward to the middle row, alternating between the two buffers so
+    # that the last row lands in mid_row
+    mid = top + (bottom - top) // 2
+    src = top_row
+    dst = mid_row if (mid - top) % 2 == 1 else spare
+    for i in range(top + 1, mid + 1):
+        _advance_row(walk.ref_ids, walk.hyp_ids, i, c, src, dst)
+        src = dst
+        dst = spare if dst == mid_row else mid_row
+
+    c_mid = _walk_linear(walk, mid, bottom, c, mid_row, level_rows + width, spare, block, width)
+    if c_mid == 0:
+        return 0
+    return _walk_linear(walk, top, mid, c_mid, top_row, level_rows + width, spare, block, width)
+
+
+cdef inline Py_ssize_t _trim_common(
+    const cnp.int32_t* ref_ids,
+    Py_ssize_t* m,
+    const cnp.int32_t* hyp_ids,
+    Py_ssize_t* n,
+) noexcept nogil:
+    """
+    Strip the common token suffix and then the common token prefix of a pair.
 
-cpdef object metrics(object reference, object hypothesis):
+    m and n are reduced to the lengths of the differing middle sections and the
+    prefix length is returned, so the middles start at ref_ids + prefix and
+    hyp_ids + prefix. Identical sequences end up with m = n = 0.
     """
-    Unified fast metrics entry point (Option A, rows contract).
+    cdef Py_ssize_t rm = m[0]
+    cdef Py_ssize_t rn = n[0]
+    cdef Py_ssize_t prefix = 0
 
-    Returns:
-    - strings: a single row (len 9)
-    - sequences: an (n, 9) object ndarray, one row per pair
+    while rm > 0 and rn > 0 and ref_ids[rm - 1] == hyp_ids[rn - 1]:
+        rm -= 1
+        rn -= 1
+    while prefix < rm and prefix < rn and ref_ids[prefix] == hyp_ids[prefix]:
+        prefix += 1
+
+    m[0] = rm - prefix
+    n[0] = rn - prefix
+    return prefix
+
+
+cdef inline Py_ssize_t _dp_buffer_cells(Py_ssize_t m, Py_ssize_t n) noexcept nogil:
+    """
+    Number of int32 cells needed to align an m x n middle section: the full matrix,
+    or for pairs aligned in linear memory the first row, the leaf block, a spare row
+    and one row per recursion level.
+    """
+    cdef Py_ssize_t levels = 1
+    cdef Py_ssize_t rows = m + 1
+    cdef Py_ssize_t leaf = _LINEAR_LEAF_CELLS
+
+    if (m + 1) * (n + 1) <= _LINEAR_MEMORY_CELLS:
+        return (m + 1) * (n + 1)
+    while rows > 2:
+        rows = rows // 2 + 1
+        levels += 1
+    if leaf < 2 * (n + 1):
+        leaf = 2 * (n + 1)
+    return leaf + (levels + 2) * (n + 1)
+
+
+cdef inline Py_ssize_t _align_buffer_cells(
+    const cnp.int32_t* ref_ids,
+    Py_ssize_t m,
+    const cnp.int32_t* hyp_ids,
+    Py_ssize_t n,
+) noexcept nogil:
     """
-    if isinstance(reference, (list, np.ndarray)) and isinstance(hypothesis, (list, np.ndarray)):
-        return _metrics_batch(list(reference), list(hypothesis))
-    return calculations(reference, hypothesis)
+    Number of int32 cells _align_ops needs for a pair.
+    """
+    _trim_common(ref_ids, &m, hyp_ids, &n)
+    return _dp_buffer_cells(m, n)
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cpdef cnp.ndarray calculations_fast(object reference, object hypothesis):
+cdef void _walk_edge(_AlignWalk* walk, Py_ssize_t i, Py_ssize_t j) noexcept nogil:
     """
-    Fast path for WER/LD calculations without word tracking.
-    Returns only numeric metrics (WER, LD, m, insertions, deletions, substitutions).
+    Finish a walk from cell (i, j) to (0, 0), where min(i, j) is within the common
+    prefix. There ref[:min(i, j)] equals hyp[:min(i, j)] and D[i][j] = |i - j|, so
+    the backtrace takes a match wherever the tokens agree and otherwise steps
+    towards the diagonal with an insertion or a deletion.
+    """
+    cdef const cnp.int32_t* ref_ids = walk.ref_ids
+    cdef const cnp.int32_t* hyp_ids = walk.hyp_ids
 
-    This function is optimized for use cases that only need counts and metrics,
-    not the actual lists of inserted/deleted/substituted words.
+    while i > 0 or j > 0:
+        if i > 0 and j > 0 and ref_ids[i - 1] == hyp_ids[j - 1]:
+            i -= 1
+            j -= 1
+        elif j > i:
+            _walk_emit(walk, -1, hyp_ids[j - 1])
+            j -= 1
+        else:
+            _walk_emit(walk, ref_ids[i - 1], -1)
+            i -= 1
 
-    Returns (6,) float64 array: [wer, ld, m, insertions, deletions, substitutions]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _align_ops(
+    _AlignWalk* walk,
+    Py_ssize_t m,
+    Py_ssize_t n,
+    cnp.int32_t* buffer,
+) noexcept nogil:
     """
-    cdef list reference_word = reference.split()
-    cdef list hypothesis_word = hypothesis.split()
+    Align one pair and emit its edit operations into walk.
 
-    cdef Py_ssize_t m = len(reference_word)
-    cdef Py_ssize_t n = len(hypothesis_word)
-    cdef Py_ssize_t i, j
+    The common token prefix and suffix are stripped first and only the differing
+    middle sections go through the DP. Inside them every DP value, and therefore
+    every backtrace step, is the same as in the full matrix; the suffix is all
+    matches and the walk through the prefix is finished by _walk_edge.
+
+    Middle sections whose full matrix fits in _LINEAR_MEMORY_CELLS are aligned
+    over the matrix. Larger ones use the linear-memory divide and conquer, which
+    emits the same operations. buffer must hold _align_buffer_cells() cells.
+    """
+    cdef const cnp.int32_t* ref_ids = walk.ref_ids
+    cdef const cnp.int32_t* hyp_ids = walk.hyp_ids
+    cdef Py_ssize_t prefix = _trim_common(ref_ids, &m, hyp_ids, &n)
+    cdef Py_ssize_t i, j, leaf
+    cdef Py_ssize_t width = n + 1
+
+    if m == 0 or n == 0:
+        # Identical sequences, or one middle section is empty
+        _walk_edge(walk, prefix + m, prefix + n)
+        walk.distance = <int>walk.n_ops
+        return
+
+    walk.ref_ids = ref_ids + prefix
+    walk.hyp_ids = hyp_ids + prefix
+    if (m + 1) * (n + 1) <= _LINEAR_MEMORY_CELLS:
+        _fill_ld_matrix(walk.ref_ids, m, walk.hyp_ids, n, buffer)
+        j = _walk_block(walk, buffer, 0, m, n)
+    else:
+        leaf = _LINEAR_LEAF_CELLS
+        if leaf < 2 * width:
+            leaf = 2 * width
+        # Layout: leaf block, row 0 of the matrix, spare row, level rows
+        for j in range(width):
+            buffer[leaf + j] = <cnp.int32_t>j
+        j = _walk_linear(
+            walk, 0, m, n, buffer + leaf,
+            buffer + leaf + 2 * width, buffer + leaf + width, buffer, width,
+        )
+    i = walk.exit_row
+    walk.ref_ids = ref_ids
+    walk.hyp_ids = hyp_ids
+
+    _walk_edge(walk, prefix + i, prefix + j)
+    walk.distance = <int>walk.n_ops
 
-    cdef int ld, insertions, deletions, substitutions
-    cdef double wer
 
-    cdef int cost, del_cost, ins_cost, sub_cost, best
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _count_ops(
+    _AlignWalk* walk,
+    Py_ssize_t m,
+    Py_ssize_t n,
+    cnp.int32_t* rows,
+) noexcept nogil:
+    """
+    Count the edit operations of one pair without a matrix or a backtrace.
+
+    The backtrace leaves each cell (i, j) towards a predecessor chosen from the
+    two tokens, D[i-1][j-1], D[i][j-1] and D[i-1][j] only: a match, then a
+    substitution, an insertion and finally a deletion. The counts of the path
+    from (i, j) back to (0, 0) are therefore those of its predecessor plus one
+    operation, and are carried forward next to the DP values in one row.
+    The totals at (m, n) are exactly those _align_ops would report.
+
+    The common prefix and suffix are stripped first. Along the boundary of the
+    middle section the path is made of insertions on row 0 and of deletions on
+    column 0, as in _walk_edge. rows must hold _count_buffer_cells() cells.
+    """
+    cdef Py_ssize_t prefix = _trim_common(walk.ref_ids, &m, walk.hyp_ids, &n)
+    cdef const cnp.int32_t* ref_ids = walk.ref_ids + prefix
+    cdef const cnp.int32_t* hyp_ids = walk.hyp_ids + prefix
+    cdef Py_ssize_t width = n + 1
+    cdef Py_ssize_t i, j
+    cdef cnp.int32_t ref_id, best, inserted, diag_cost
+    cdef cnp.int32_t up_d, up_ins, left_d, left_ins, diag_d, diag_ins, take
 
-    # Allocate the (m+1) x (n+1) DP matrix without zero-initialization
-    cdef cnp.int32_t[:, :] ldm = np.empty((m + 1, n + 1), dtype=np.int32)
+    # One row of D and one of the number of insertions on the path, updated in
+    # place; the cells to the left and on the diagonal are kept in locals. Every
+    # path to (i, j) has j - i more insertions than deletions, so the deletions
+    # and substitutions follow from D and the insertions.
+    cdef cnp.int32_t* d = rows
+    cdef cnp.int32_t* ins = rows + width
 
-    # Initialize first column and first row (boundary conditions)
-    for i in range(m + 1):
-        ldm[i, 0] = <cnp.int32_t>i
-    for j in range(n + 1):
-        ldm[0, j] = <cnp.int32_t>j
+    for j in range(width):
+        d[j] = <cnp.int32_t>j
+        ins[j] = <cnp.int32_t>j
 
-    # Fill the Levenshtein distance matrix
     for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            cost = 0 if reference_word[i - 1] == hypothesis_word[j - 1] else 1
+        ref_id = ref_ids[i - 1]
+        diag_d = d[0]
+        diag_ins = ins[0]
+        left_d = <cnp.int32_t>i
+        left_ins = 0
+        d[0] = left_d
+        ins[0] = left_ins
+        for j in range(1, width):
+            up_d = d[j]
+            up_ins = ins[j]
+
+            # A match is a diagonal step at no cost and is always optimal, so it
+            # shares the substitution branch. Ties go to the diagonal, then to
+            # the insertion and last to the deletion, as in the backtrace.
+            # The choices are made with all-ones/all-zeros masks rather than
+            # branches, which mispredict on the frequent ties.
+            diag_cost = diag_d + (ref_id != hyp_ids[j - 1])
+            take = -<cnp.int32_t>(left_d <= up_d)
+            best = ((left_d + 1) & take) | ((up_d + 1) & ~take)
+            inserted = ((left_ins + 1) & take) | (up_ins & ~take)
+            take = -<cnp.int32_t>(diag_cost <= best)
+            best = (diag_cost & take) | (best & ~take)
+            inserted = (diag_ins & take) | (inserted & ~take)
+
+            d[j] = best
+            ins[j] = inserted
+            left_d = best
+            left_ins = inserted
+            diag_d = up_d
+            diag_ins = up_ins
+
+    walk.n_ops = d[n]
+    walk.insertions = ins[n]
+    walk.deletions = ins[n] - <int>(n - m)
+    walk.substitutions = <int>walk.n_ops - walk.insertions - walk.deletions
+    walk.distance = <int>walk.n_ops
+
+
+cdef inline Py_ssize_t _count_buffer_cells(
+    const cnp.int32_t* ref_ids,
+    Py_ssize_t m,
+    const cnp.int32_t* hyp_ids,
+    Py_ssize_t n,
+) noexcept nogil:
+    """
+    Number of int32 cells _count_ops needs for a pair: two rows of the trimmed width.
+    """
+    _trim_common(ref_ids, &m, hyp_ids, &n)
+    return 2 * (n + 1)
 
-            del_cost = ldm[i - 1, j] + 1
-            ins_cost = ldm[i, j - 1] + 1
-            sub_cost = ldm[i - 1, j - 1] + cost
 
-            best = del_cost
-            if ins_cost < best:
-                best = ins_cost
-            if sub_cost < best:
-                best = sub_cost
+cdef inline void _trim_suffix(
+    const cnp.int32_t* ref_ids,
+    Py_ssize_t* m,
+    const cnp.int32_t* hyp_ids,
+    Py_ssize_t* n,
+) noexcept nogil:
+    """
+    Strip the common token suffix of a pair by reducing m and n.
+    """
+    while m[0] > 0 and n[0] > 0 and ref_ids[m[0] - 1] == hyp_ids[n[0] - 1]:
+        m[0] -= 1
+        n[0] -= 1
+
 
-            ldm[i, j] = best
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _advance_weighted_row(
+    const cnp.int32_t* ref_ids,
+    const cnp.int32_t* hyp_ids,
+    Py_ssize_t i,
+    Py_ssize_t c,
+    const double* weights,
+    const double* above,
+    double* row,
+) noexcept nogil:
+    """
+    Compute row i (columns 0..c) of the minimum weighted cost matrix from row i - 1.
 
-    ld = ldm[m, n]
-    wer = (<double>ld) / m if m > 0 else 0.0
+    weights holds the insertion, deletion and substitution costs. A match keeps
+    the diagonal value, which is optimal for any non-negative costs. Otherwise
+    the cell takes the cheapest of a substitution, an insertion and a deletion,
+    preferring them in that order on ties. _count_weighted_ops computes every
+    value with the same operations, so both agree bit for bit.
+    """
+    cdef Py_ssize_t j
+    cdef cnp.int32_t ref_id = ref_ids[i - 1]
+    cdef double w_ins = weights[0]
+    cdef double w_del = weights[1]
+    cdef double w_sub = weights[2]
+    cdef double sub_cost, ins_cost, del_cost
+
+    row[0] = above[0] + w_del
+    for j in range(1, c + 1):
+        if ref_id == hyp_ids[j - 1]:
+            row[j] = above[j - 1]
+            continue
+        sub_cost = above[j - 1] + w_sub
+        ins_cost = row[j - 1] + w_ins
+        del_cost = above[j] + w_del
+        if sub_cost <= ins_cost and sub_cost <= del_cost:
+            row[j] = sub_cost
+        elif ins_cost <= del_cost:
+            row[j] = ins_cost
+        else:
+            row[j] = del_cost
 
-    # Backtrace to count errors (no word tracking)
-    insertions, deletions, substitutions = 0, 0, 0
-    i, j = m, n
-    while i > 0 or j > 0:
-        if i > 0 and j > 0 and reference_word[i - 1] == hypothesis_word[j - 1]:
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _walk_weighted_block(
+    _AlignWalk* walk,
+    const double* block,
+    Py_ssize_t top,
+    Py_ssize_t i,
+    Py_ssize_t j,
+    const double* weights,
+) noexcept nogil:
+    """
+    Greedy backtrace from cell (i, j) over a row-major block holding rows top..i
+    and columns 0..j of the minimum weighted cost matrix, until the walk reaches
+    row top or column 0.
+
+    At every cell a match is taken first, then a substitution, an insertion and
+    finally a deletion, as in _walk_block. Returns the column at which the walk
+    stopped and stores the row in walk.exit_row.
+    """
+    cdef Py_ssize_t width = j + 1
+    cdef const cnp.int32_t* ref_ids = walk.ref_ids
+    cdef const cnp.int32_t* hyp_ids = walk.hyp_ids
+    cdef double w_ins = weights[0]
+    cdef double w_sub = weights[2]
+    cdef double cell
+
+    while i > top and j > 0:
+        cell = block[(i - top) * width + j]
+        if ref_ids[i - 1] == hyp_ids[j - 1]:
+            i -= 1
+            j -= 1
+        elif cell == block[(i - 1 - top) * width + j - 1] + w_sub:
+            _walk_emit(walk, ref_ids[i - 1], hyp_ids[j - 1])
             i -= 1
             j -= 1
+        elif cell == block[(i - top) * width + j - 1] + w_ins:
+            _walk_emit(walk, -1, hyp_ids[j - 1])
+            j -= 1
         else:
-            if i > 0 and j > 0 and ldm[i, j] == ldm[i - 1, j - 1] + 1:
-                substitutions += 1
-                i -= 1
-                j -= 1
-            elif j > 0 and ldm[i, j] == ldm[i, j - 1] + 1:
-                insertions += 1
-                j -= 1
-            elif i > 0 and ldm[i, j] == ldm[i - 1, j] + 1:
-                deletions += 1
-                i -= 1
-
-    return np.array(
-        [wer, <double>ld, <double>m,
-         <double>insertions, <double>deletions, <double>substitutions],
-        dtype=np.float64
-    )
+            _walk_emit(walk, ref_ids[i - 1], -1)
+            i -= 1
+
+    walk.exit_row = i
+    return j
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef cnp.ndarray _metrics_batch_fast(list references, list hypotheses):
+cdef Py_ssize_t _walk_weighted_linear(
+    _AlignWalk* walk,
+    Py_ssize_t top,
+    Py_ssize_t bottom,
+    Py_ssize_t c,
+    const double* weights,
+    const double* top_row,
+    double* level_rows,
+    double* spare,
+    double* block,
+    Py_ssize_t width,
+) noexcept nogil:
     """
-    Fast batch processing without word tracking.
+    Linear-memory backtrace of the minimum weighted cost matrix.
 
-    Returns (n, 6) float64 array where each row contains:
-    [wer, ld, m, insertions, deletions, substitutions]
+    The same divide and conquer as _walk_linear, over float64 rows computed by
+    _advance_weighted_row. The rows are recomputed with the same operations as
+    a full matrix, so the walk takes exactly the same path.
     """
-    cdef Py_ssize_t n = len(references)
-    cdef Py_ssize_t idx
+    cdef Py_ssize_t rows = bottom - top + 1
+    cdef Py_ssize_t mid, i, c_mid
+    cdef double* mid_row = level_rows
+    cdef double* dst
+    cdef const double* src
+
+    if bottom == top or c == 0:
+        walk.exit_row = bottom
+        return c
+
+    if rows * (c + 1) <= _LINEAR_LEAF_CELLS or rows == 2:
+        memcpy(block, top_row, (c + 1) * sizeof(double))
+        for i in range(top + 1, bottom + 1):
+            _advance_weighted_row(
+                walk.ref_ids, walk.hyp_ids, i, c, weights,
+                block + (i - 1 - top) * (c + 1), block + (i - top) * (c + 1),
+            )
+        return _walk_weighted_block(walk, block, top, bottom, c, weights)
+
+    mid = top + (bottom - top) // 2
+    src = top_row
+    dst = mid_row if (mid - top) % 2 == 1 else spare
+    for i in range(top + 1, mid + 1):
+        _advance_weighted_row(walk.ref_ids, walk.hyp_ids, i, c, weights, src, dst)
+        src = dst
+        dst = spare if dst == mid_row else mid_row
+
+    c_mid = _walk_weighted_linear(
+        walk, mid, bottom, c, weights, mid_row, level_rows + width, spare, block, width
+    )
+    if c_mid == 0:
+        return 0
+    return _walk_weighted_linear(
+        walk, top, mid, c_mid, weights, top_row, level_rows + width, spare, block, width
+    )
+
 
-    cdef cnp.ndarray out = np.empty((n, 6), dtype=np.float64)
+cdef inline int _unit_distance(
+    const cnp.int32_t* ref_ids,
+    Py_ssize_t m,
+    const cnp.int32_t* hyp_ids,
+    Py_ssize_t n,
+    cnp.int32_t* rows,
+) noexcept nogil:
+    """
+    Levenshtein distance of a pair, from _count_ops over _count_buffer_cells()
+    cells of rows.
+    """
+    cdef _AlignWalk walk
+    _walk_init(&walk, ref_ids, hyp_ids, NULL, NULL)
+    _count_ops(&walk, m, n, rows)
+    return walk.distance
 
-    cdef cnp.ndarray r
-    for idx in range(n):
-        r = calculations_fast(references[idx], hypotheses[idx])
-        out[idx, :] = r
 
-    return out
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _align_weighted_ops(
+    _AlignWalk* walk,
+    Py_ssize_t m,
+    Py_ssize_t n,
+    const double* weights,
+    cnp.int32_t* buffer,
+) noexcept nogil:
+    """
+    Align one pair at minimum weighted cost and emit its edit operations into walk.
+
+    The greedy backtrace takes a match first, then a substitution, an insertion
+    and finally a deletion, as in _walk_block. Unlike the unit-cost alignment
+    only the common suffix can be stripped: with a zero weight the walk through
+    a common prefix is no longer fixed. Pairs whose float64 matrix fits in
+    _LINEAR_MEMORY_CELLS are aligned over the matrix and larger ones with the
+    linear-memory divide and conquer, as in _align_ops. buffer must hold
+    _weighted_align_buffer_cells() int32 cells. A pair can need up to m + n
+    operations, as a substitution costing more than an insertion and a deletion
+    is replaced by both. walk.distance is set to the Levenshtein distance,
+    computed separately.
+    """
+    cdef const cnp.int32_t* ref_ids = walk.ref_ids
+    cdef const cnp.int32_t* hyp_ids = walk.hyp_ids
+    cdef double* D = <double*>buffer
+    cdef double w_ins = weights[0]
+    cdef Py_ssize_t full_m = m
+    cdef Py_ssize_t full_n = n
+    cdef Py_ssize_t width, i, j, leaf
+    cdef bint linear
+    cdef double* top_row
+
+    _trim_suffix(ref_ids, &m, hyp_ids, &n)
+    i = m
+    j = n
+    if m > 0 and n > 0:
+        width = n + 1
+        linear = (m + 1) * width > _LINEAR_MEMORY_CELLS
+        leaf = _LINEAR_LEAF_CELLS
+        if leaf < 2 * width:
+            leaf = 2 * width
+        # Layout as in _align_ops, in float64: the full matrix, or the leaf
+        # block, row 0 of the matrix, a spare row and the level rows
+        top_row = D + leaf if linear else D
+        top_row[0] = 0.0
+        for j in range(1, width):
+            top_row[j] = top_row[j - 1] + w_ins
+        if linear:
+            j = _walk_weighted_linear(
+                walk, 0, m, n, weights, top_row,
+                top_row + 2 * width, top_row + width, D, width,
+            )
+        else:
+            for i in range(1, m + 1):
+                _advance_weighted_row(ref_ids, hyp_ids, i, n, weights, D + (i - 1) * width, D + i * width)
+            j = _walk_weighted_block(walk, D, 0, m, n, weights)
+        i = walk.exit_row
+
+    # Row 0 is all insertions and column 0 all deletions
+    while j > 0:
+        _walk_emit(walk, -1, hyp_ids[j - 1])
+        j -= 1
+    while i > 0:
+        _walk_emit(walk, ref_ids[i - 1], -1)
+        i -= 1
+
+    walk.distance = _unit_distance(ref_ids, full_m, hyp_ids, full_n, buffer)
+
+
+cdef inline Py_ssize_t _weighted_align_buffer_cells(
+    const cnp.int32_t* ref_ids,
+    Py_ssize_t m,
+    const cnp.int32_t* hyp_ids,
+    Py_ssize_t n,
+) noexcept nogil:
+    """
+    Number of int32 cells _align_weighted_ops needs for a pair: the float64
+    cells of the matrix or linear-memory scratch space over the pair without
+    its common suffix.
+    """
+    _trim_suffix(ref_ids, &m, hyp_ids, &n)
+    return 2 * _dp_buffer_cells(m, n)
 
 
-cpdef object metrics_fast(object reference, object hypothesis):
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _count_weighted_ops(
+    _AlignWalk* walk,
+    Py_ssize_t m,
+    Py_ssize_t n,
+    const double* weights,
+    cnp.int32_t* rows,
+) noexcept nogil:
     """
-    Fast metrics entry point without word tracking.
+    Count the edit operations of the minimum weighted cost alignment of one pair.
+
+    As in _count_ops, the counts of the backtrace path are carried forward next
+    to the DP values: one float64 row of D, updated in place with the same
+    operations and tie-breaking as _advance_weighted_row, and int32 rows of the
+    insertions and substitutions on the path. The totals at (m, n) are exactly
+    those _align_weighted_ops would report, and walk.distance is set to the
+    Levenshtein distance. rows must hold _weighted_count_buffer_cells() cells.
+    """
+    cdef const cnp.int32_t* ref_ids = walk.ref_ids
+    cdef const cnp.int32_t* hyp_ids = walk.hyp_ids
+    cdef double w_ins = weights[0]
+    cdef double w_del = weights[1]
+    cdef double w_sub = weights[2]
+    cdef Py_ssize_t full_m = m
+    cdef Py_ssize_t full_n = n
+    cdef Py_ssize_t width, i, j
+    cdef cnp.int32_t ref_id, inserted, substituted
+    cdef cnp.int32_t up_ins, up_sub, left_ins, left_sub, diag_ins, diag_sub
+    cdef double best, sub_cost, ins_cost, del_cost, up_d, left_d, diag_d
+
+    _trim_suffix(ref_ids, &m, hyp_ids, &n)
+    width = n + 1
+
+    # The float64 row takes the first 2 * width cells
+    cdef double* d = <double*>rows
+    cdef cnp.int32_t* ins = rows + 2 * width
+    cdef cnp.int32_t* sub = ins + width
+
+    d[0] = 0.0
+    ins[0] = 0
+    sub[0] = 0
+    for j in range(1, width):
+        d[j] = d[j - 1] + w_ins
+        ins[j] = <cnp.int32_t>j
+        sub[j] = 0
 
-    Returns:
-    - strings: (6,) float64 array [wer, ld, m, insertions, deletions, substitutions]
-    - sequences: (n, 6) float64 array, one row per pair
+    for i in range(1, m + 1):
+        ref_id = ref_ids[i - 1]
+        diag_d = d[0]
+        diag_ins = ins[0]
+        diag_sub = sub[0]
+        left_d = diag_d + w_del
+        left_ins = 0
+        left_sub = 0
+        d[0] = left_d
+        ins[0] = 0
+        sub[0] = 0
+        for j in range(1, width):
+            up_d = d[j]
+            up_ins = ins[j]
+            up_sub = sub[j]
+
+            if ref_id == hyp_ids[j - 1]:
+                best = diag_d
+                inserted = diag_ins
+                substituted = diag_sub
+            else:
+                sub_cost = diag_d + w_sub
+                ins_cost = left_d + w_ins
+                del_cost = up_d + w_del
+                if sub_cost <= ins_cost and sub_cost <= del_cost:
+                    best = sub_cost
+                    inserted = diag_ins
+                    substituted = diag_sub + 1
+                elif ins_cost <= del_cost:
+                    best = ins_cost
+                    inserted = left_ins + 1
+                    substituted = left_sub
+                else:
+                    best = del_cost
+                    inserted = up_ins
+                    substituted = up_sub
+
+            d[j] = best
+            ins[j] = inserted
+            sub[j] = substituted
+            left_d = best
+            left_ins = inserted
+            left_sub = substituted
+            diag_d = up_d
+            diag_ins = up_ins
+            diag_sub = up_sub
+
+    # Every path to (m, n) has n - m more insertions than deletions
+    walk.insertions = ins[n]
+    walk.deletions = ins[n] - <int>(n - m)
+    walk.substitutions = sub[n]
+    walk.n_ops = walk.insertions + walk.deletions + walk.substitutions
+    walk.distance = _unit_distance(ref_ids, full_m, hyp_ids, full_n, rows)
+
+
+cdef inline Py_ssize_t _weighted_count_buffer_cells(
+    const cnp.int32_t* ref_ids,
+    Py_ssize_t m,
+    const cnp.int32_t* hyp_ids,
+    Py_ssize_t n,
+) noexcept nogil:
     """
-    if isinstance(reference, (list, np.ndarray)) and isinstance(hypothesis, (list, np.ndarray)):
-        return _metrics_batch_fast(list(reference), list(hypothesis))
-    return calculations_fast(reference, hypothesis)
+    Number of int32 cells _count_weighted_ops needs for a pair: a float64 row
+    and two int32 rows over the hypothesis without the common suffix.
+    """
+    _trim_suffix(ref_ids, &m, hyp_ids, &n)
+    return 4 * (n + 1)
+
+
+cdef int _check_weights(object weights, double* out) except -1:
+    """
+    Validate the (insertions, deletions, substitutions) costs of a weighted
+    alignment and copy them to out.
+    """
+    cdef Py_ssize_t k
+    if len(weights) != 3:
+        raise ValueError("weights must hold the insertion, deletion and substitution costs.")
+    for k in range(3):
+        w = weights[k]
+        if (
+            isinstance(w, bool)
+            or not isinstance(w, (int, float, np.integer, np.floating))
+            or not 0 <= w < float("inf")
+        ):
+            raise ValueError("Weights of a weighted alignment must be finite, non-negative numbers.")
+        out[k] = <double>w
+    return 0
+
+
+cdef inline Py_ssize_t _align_pair_ops(
+    const cnp.int32_t* ref_ids,
+    Py_ssize_t m,
+    const cnp.int32_t* hyp_ids,
+    Py_ssize_t n,
+    const double* weights,
+    cnp.int32_t* buffer,
+    cnp.int32_t* op_ref,
+    cnp.int32_t* op_hyp,
+    cnp.npy_intp* distance,
+) noexcept nogil:
+    """
+    Align one pair into op_ref/op_hyp (room for max(m, n) operations, or m + n
+    with weights), store its Levenshtein distance in distance and return the
+    number of operations written. weights is NULL for the Levenshtein alignment.
+    """
+    cdef _AlignWalk walk
+    _walk_init(&walk, ref_ids, hyp_ids, op_ref, op_hyp)
+    if weights != NULL:
+        _align_weighted_ops(&walk, m, n, weights, buffer)
+    else:
+        _align_ops(&walk, m, n, buffer)
+    distance[0] = walk.distance
+    return walk.n_ops
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cpdef cnp.ndarray calculations_wer_only(object reference, object hypothesis):
+cdef class _Arena:
     """
-    WER-only fast path - 2-row DP (O(n) memory), no backtrace.
-    Returns only [wer, ld, m] without error counts or word tracking.
+    An int32 scratch buffer that grows geometrically and is kept between calls,
+    so scoring one pair at a time does not allocate a DP matrix per pair. Pairs
+    above _LINEAR_MEMORY_CELLS are aligned in linear memory, which bounds how
+    far it grows.
+    """
+    cdef cnp.int32_t* data
+    cdef Py_ssize_t capacity
+    cdef bint in_use
 
-    This is the fastest path for pure WER calculation, using space-optimized
-    Wagner-Fischer algorithm with rolling 2-row buffer instead of full matrix.
+    def __cinit__(self):
+        self.data = NULL
+        self.capacity = 0
+        self.in_use = False
 
-    Returns (3,) float64 array: [wer, ld, m]
+    def __dealloc__(self):
+        free(self.data)
+
+    cdef cnp.int32_t* reserve(self, Py_ssize_t cells) except NULL:
+        """
+        Return a buffer of at least cells int32 values. Its contents are not kept.
+        """
+        cdef Py_ssize_t capacity
+        cdef cnp.int32_t* grown
+
+        if cells > self.capacity or self.data == NULL:
+            capacity = max(cells, 2 * self.capacity, 4096)
+            grown = <cnp.int32_t*>malloc(capacity * sizeof(cnp.int32_t))
+            if grown == NULL:
+                raise MemoryError()
+            free(self.data)
+            self.data = grown
+            self.capacity = capacity
+        return self.data
+
+
+cdef _Arena _pair_arena = _Arena()
+
+
+cdef inline _Arena _acquire_pair_arena():
+    """
+    Take the shared single-pair arena, or a fresh one if a re-entrant call
+    (e.g. from a finalizer run by the garbage collector) already holds it.
+    Release it by clearing in_use.
     """
-    cdef list reference_word = reference.split()
-    cdef list hypothesis_word = hypothesis.split()
+    cdef _Arena arena = _pair_arena if not _pair_arena.in_use else _Arena()
+    arena.in_use = True
+    return arena
 
-    cdef Py_ssize_t m = len(reference_word)
-    cdef Py_ssize_t n = len(hypothesis_word)
 
-    cdef Py_ssize_t i, j
-    cdef int cost, del_cost, ins_cost, sub_cost, best, ld
-    cdef double wer
+cdef inline void _set_cell(PyObject** cell, object value):
+    """
+    Store value in a cell of an object ndarray, replacing its previous reference.
+    """
+    Py_INCREF(value)
+    Py_XDECREF(cell[0])
+    cell[0] = <PyObject*>value
 
-    cdef cnp.ndarray prev_arr = np.empty(n + 1, dtype=np.int32)
-    cdef cnp.ndarray curr_arr = np.empty(n + 1, dtype=np.int32)
 
-    cdef cnp.int32_t[:] prev = prev_arr
-    cdef cnp.int32_t[:] curr = curr_arr
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _write_alignment_row(
+    PyObject** row,
+    const cnp.int32_t* op_ref,
+    const cnp.int32_t* op_hyp,
+    Py_ssize_t n_ops,
+    Py_ssize_t ld,
+    Py_ssize_t m,
+    list vocab_words,
+):
+    """
+    Turn the recorded edit operations of one pair and its Levenshtein distance
+    ld into the 9 output fields of row, written straight into the cells of an
+    object ndarray:
+    [wer, ld, m, insertions, deletions, substitutions, inserted_words, deleted_words, substituted_words]
+    """
+    cdef Py_ssize_t k
+    cdef int insertions = 0
+    cdef int deletions = 0
+    cdef int substitutions = 0
+    cdef list inserted_words = []
+    cdef list deleted_words = []
+    cdef list substituted_words = []
+
+    # Operations are stored back to front
+    for k in range(n_ops - 1, -1, -1):
+        if op_ref[k] < 0:
+            insertions += 1
+            inserted_words.append(vocab_words[op_hyp[k]])
+        elif op_hyp[k] < 0:
+            deletions += 1
+            deleted_words.append(vocab_words[op_ref[k]])
+        else:
+            substitutions += 1
+            substituted_words.append((vocab_words[op_ref[k]], vocab_words[op_hyp[k]]))
 
-    for j in range(n + 1):
-        prev[j] = <cnp.int32_t>j
+    _set_cell(row, (<double>ld) / m if m > 0 else 0.0)
+    _set_cell(row + 1, ld)
+    _set_cell(row + 2, m)
+    _set_cell(row + 3, insertions)
+    _set_cell(row + 4, deletions)
+    _set_cell(row + 5, substitutions)
+    _set_cell(row + 6, inserted_words)
+    _set_cell(row + 7, deleted_words)
+    _set_cell(row + 8, substituted_words)
 
-    for i in range(1, m + 1):
-        curr[0] = <cnp.int32_t>i
-        for j in range(1, n + 1):
-            cost = 0 if reference_word[i - 1] == hypothesis_word[j - 1] else 1
 
-            del_cost = prev[j] + 1
-            ins_cost = curr[j - 1] + 1
-            sub_cost = prev[j - 1] + cost
+cdef inline bint _is_columnar(object texts):
+    """
+    True for a pyarrow string column or a TokenizedCorpus. Strings, lists and
+    numpy arrays are ruled out first, so the common inputs skip the class checks.
+    """
+    if isinstance(texts, (str, list, np.ndarray)):
+        return False
+    return is_arrow_string_array(texts) or is_tokenized_corpus(texts)
 
-            best = del_cost
-            if ins_cost < best:
-                best = ins_cost
-            if sub_cost < best:
-                best = sub_cost
 
-            curr[j] = best
+cdef inline bint _is_batch(object reference, object hypothesis):
+    """
+    True when both inputs are sequences of texts (lists, numpy arrays, pyarrow
+    string columns or TokenizedCorpus objects) rather than single strings.
+    """
+    return (
+        (isinstance(reference, (list, np.ndarray)) or _is_columnar(reference))
+        and (isinstance(hypothesis, (list, np.ndarray)) or _is_columnar(hypothesis))
+    )
+
+
+cdef inline object _batch_texts(object texts):
+    """
+    Batch input for _encode_batch: a list of strings, or a pyarrow string column
+    or TokenizedCorpus passed through untouched.
+    """
+    if _is_columnar(texts):
+        return texts
+    return list(texts)
 
-        prev, curr = curr, prev
 
-    ld = prev[n]
-    wer = (<double>ld) / m if m > 0 else 0.0
+cpdef int _resolve_n_jobs(object n_jobs) except -1:
+    """
+    Convert an n_jobs argument into a thread count.
 
-    return np.array([wer, <double>ld, <double>m], dtype=np.float64)
+    None and 1 run serially, a positive integer sets the thread count and a negative
+    integer counts back from the number of CPUs (-1 uses all of them).
+    """
+    cdef Py_ssize_t cpus
+    if n_jobs is None:
+        return 1
+    if isinstance(n_jobs, bool) or not isinstance(n_jobs, (int, np.integer)) or n_jobs == 0:
+        raise ValueError("n_jobs must be a non-zero integer or None.")
+    if n_jobs > INT_MAX:
+        raise ValueError(f"n_jobs must be at most {INT_MAX}.")
+    if n_jobs > 0:
+        return <int>n_jobs
+    cpus = os.cpu_count() or 1
+    return <int>max(cpus + 1 + n_jobs, 1)
+
+
+cdef struct _WerOnlyScratch:
+    # Per-batch scratch for the WER-only kernels. local_of maps a global token id
+    # to its row in peq (or -1) and is restored to all -1 after every pair.
+    cnp.int32_t* local_of
+    uint64_t* peq
+    uint64_t* vp
+    uint64_t* vn
+    # Rolling rows for the banded (thresholded) DP
+    cnp.int32_t* prev
+    cnp.int32_t* curr
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef inline void _calculations_wer_only_reuse_ptr(
-    object reference,
-    object hypothesis,
-    cnp.int32_t* prev,
-    cnp.int32_t* curr,
-    double* out3,
-) except *:
+@cython.cdivision(True)
+cdef cnp.int32_t _ld_bit_parallel(
+    const cnp.int32_t* pattern,
+    Py_ssize_t pm,
+    const cnp.int32_t* text,
+    Py_ssize_t tn,
+    _WerOnlyScratch* scratch,
+) noexcept nogil:
     """
-    Internal WER-only DP using caller-provided buffers and pointer swap (no copying).
-    Writes: out3[0]=wer, out3[1]=ld, out3[2]=m
+    Word-level Levenshtein distance using Myers' bit-vector algorithm with Hyyro's
+    block extension for patterns longer than 64 tokens.
 
-    This implementation uses true pointer swapping instead of copying values,
-    eliminating O(n) copy overhead per outer iteration.
+    The DP column over the pattern is encoded as vertical +1/-1 delta bit-vectors
+    (VP/VN), so each text token costs ceil(pm / 64) word operations instead of pm
+    cell updates. Peq only holds rows for the distinct tokens of the pattern; text
+    tokens that never occur in the pattern match nothing.
     """
-    cdef list reference_word = reference.split()
-    cdef list hypothesis_word = hypothesis.split()
+    cdef Py_ssize_t blocks = (pm + 63) >> 6
+    cdef Py_ssize_t i, j, b, sym
+    cdef Py_ssize_t n_sym = 0
+    cdef cnp.int32_t score = <cnp.int32_t>pm
+    cdef cnp.int32_t* local_of = scratch.local_of
+    cdef uint64_t* peq = scratch.peq
+    cdef uint64_t* vp = scratch.vp
+    cdef uint64_t* vn = scratch.vn
+    cdef uint64_t* eq_row
+    cdef uint64_t last = (<uint64_t>1) << ((pm - 1) & 63)
+    cdef uint64_t eq, xv, xh, ph, mh, pv, mv, hin_neg
+    cdef int hin, hout
+
+    if pm == 0:
+        return <cnp.int32_t>tn
+    if tn == 0:
+        return <cnp.int32_t>pm
+
+    # Build Peq: one bit-vector row per distinct pattern token
+    for i in range(pm):
+        sym = local_of[pattern[i]]
+        if sym < 0:
+            sym = n_sym
+            n_sym += 1
+            local_of[pattern[i]] = <cnp.int32_t>sym
+            memset(peq + sym * blocks, 0, blocks * sizeof(uint64_t))
+        peq[sym * blocks + (i >> 6)] |= (<uint64_t>1) << (i & 63)
+
+    if blocks == 1:
+        pv = ~(<uint64_t>0)
+        mv = 0
+        for j in range(tn):
+            sym = local_of[text[j]]
+            eq = peq[sym] if sym >= 0 else 0
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | ~(xh | pv)
+            mh = pv & xh
+            if ph & last:
+                score += 1
+            elif mh & last:
+                score -= 1
+            # Global alignment: the top row always increases by one
+            ph = (ph << 1) | 1
+            mh = mh << 1
+            pv = mh | ~(xv | ph)
+            mv = ph & xv
+    else:
+        for b in range(blocks):
+            vp[b] = ~(<uint64_t>0)
+            vn[b] = 0
+        for j in range(tn):
+            sym = local_of[text[j]]
+            eq_row = peq + sym * blocks if sym >= 0 else NULL
+            hin = 1
+            for b in range(blocks):
+                eq = eq_row[b] if eq_row != NULL else 0
+                pv = vp[b]
+                mv = vn[b]
+                hin_neg = 1 if hin < 0 else 0
+
+                xv = eq | mv
+                eq = eq | hin_neg
+                xh = (((eq & pv) + pv) ^ pv) | eq
+                ph = mv | ~(xh | pv)
+                mh = pv & xh
+
+                if b == blocks - 1:
+                    if ph & last:
+                        score += 1
+                    elif mh & last:
+                        score -= 1
+                else:
+                    hout = <int>(ph >> 63) - <int>(mh >> 63)
+
+                ph = (ph << 1) | (1 if hin > 0 else 0)
+                mh = (mh << 1) | hin_neg
+                vp[b] = mh | ~(xv | ph)
+                vn[b] = ph & xv
+                hin = hout
+
+    # Restore the scratch map for the next pair
+    for i in range(pm):
+        local_of[pattern[i]] = -1
+
+    return score
 
-    cdef Py_ssize_t m = len(reference_word)
-    cdef Py_ssize_t n = len(hypothesis_word)
 
-    cdef Py_ssize_t i, j
-    cdef int cost, del_cost, ins_cost, sub_cost, best, ld
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef cnp.int32_t _ld_banded(
+    const cnp.int32_t* ref_ids,
+    Py_ssize_t m,
+    const cnp.int32_t* hyp_ids,
+    Py_ssize_t n,
+    Py_ssize_t k,
+    cnp.int32_t* prev,
+    cnp.int32_t* curr,
+) noexcept nogil:
+    """
+    Ukkonen-style banded Levenshtein distance with early exit.
+
+    Only cells with |i - j| <= k are evaluated, since any cell outside that band
+    already costs more than k. Cells just outside the band hold the sentinel k + 1.
+    The DP stops as soon as a whole row exceeds k, because distances never decrease
+    along an alignment path.
+
+    Returns the distance if it is at most k, otherwise -1.
+    """
+    cdef Py_ssize_t i, j, lo, hi
+    cdef cnp.int32_t big = <cnp.int32_t>(k + 1) if k < m + n else <cnp.int32_t>(m + n + 1)
+    cdef cnp.int32_t ref_id, cost, del_cost, ins_cost, sub_cost, best, row_min
     cdef cnp.int32_t* tmp
 
-    # Initialize base row: prev[j] = j for j=0..n
-    for j in range(n + 1):
-        prev[j] = j
+    if m - n > k or n - m > k:
+        return -1
+
+    # Row 0 inside the band, followed by an out-of-band sentinel
+    hi = n if n < k else k
+    for j in range(hi + 1):
+        prev[j] = <cnp.int32_t>j
+    if hi < n:
+        prev[hi + 1] = big
 
     for i in range(1, m + 1):
-        curr[0] = i
-        for j in range(1, n + 1):
-            cost = 0 if reference_word[i - 1] == hypothesis_word[j - 1] else 1
+        lo = i - k if i - k > 1 else 1
+        hi = n if n < i + k else i + k
+        curr[lo - 1] = <cnp.int32_t>i if lo == 1 and i <= k else big
+        row_min = curr[lo - 1]
+        ref_id = ref_ids[i - 1]
+        for j in range(lo, hi + 1):
+            cost = 0 if ref_id == hyp_ids[j - 1] else 1
 
             del_cost = prev[j] + 1
             ins_cost = curr[j - 1] + 1
@@ -372,73 +1897,1574 @@ cdef inline void _calculations_wer_only_reuse_ptr(
                 best = sub_cost
 
             curr[j] = best
+            if best < row_min:
+                row_min = best
+
+        if row_min > k:
+            return -1
+        if hi < n:
+            curr[hi + 1] = big
 
-        # Swap prev and curr pointers (zero-cost operation)
         tmp = prev
         prev = curr
         curr = tmp
 
-    ld = prev[n]
+    return prev[n] if prev[n] <= k else -1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef inline void _calculations_wer_only_reuse_ptr(
+    const cnp.int32_t* ref_ids,
+    Py_ssize_t m,
+    const cnp.int32_t* hyp_ids,
+    Py_ssize_t n,
+    double max_wer,
+    _WerOnlyScratch* scratch,
+    double* out3,
+) noexcept nogil:
+    """
+    Internal WER-only kernel using caller-provided scratch buffers.
+    Writes: out3[0]=wer, out3[1]=ld, out3[2]=m
+
+    Edit distance is symmetric, so the shorter sequence is used as the bit-parallel
+    pattern to keep Peq and the number of blocks per column as small as possible.
+
+    When max_wer >= 0 the banded DP is used instead with k = floor(max_wer * m),
+    and pairs whose WER exceeds max_wer get wer = ld = inf.
+
+    The common token prefix and suffix do not change the distance and are
+    stripped before either kernel runs.
+    """
+    cdef cnp.int32_t ld
+    cdef Py_ssize_t k
+    cdef Py_ssize_t rm = m
+    cdef Py_ssize_t rn = n
+    cdef Py_ssize_t prefix = _trim_common(ref_ids, &rm, hyp_ids, &rn)
+
+    ref_ids += prefix
+    hyp_ids += prefix
+    if max_wer >= 0.0 and m > 0:
+        # Largest integer k with k / m <= max_wer, matching the float division
+        # used for the reported WER
+        k = <Py_ssize_t>(max_wer * m) if max_wer * m < m + n else m + n
+        while k < m + n and (<double>(k + 1)) / m <= max_wer:
+            k += 1
+        while k > 0 and (<double>k) / m > max_wer:
+            k -= 1
+        if rm == 0 or rn == 0:
+            ld = <cnp.int32_t>(rm + rn) if rm + rn <= k else -1
+        else:
+            ld = _ld_banded(ref_ids, rm, hyp_ids, rn, k, scratch.prev, scratch.curr)
+        if ld < 0:
+            out3[0] = INFINITY
+            out3[1] = INFINITY
+            out3[2] = <double>m
+            return
+    elif rm == 0 or rn == 0:
+        ld = <cnp.int32_t>(rm + rn)
+    elif rn < rm:
+        ld = _ld_bit_parallel(hyp_ids, rn, ref_ids, rm, scratch)
+    else:
+        ld = _ld_bit_parallel(ref_ids, rm, hyp_ids, rn, scratch)
     out3[0] = (<double>ld) / m if m > 0 else 0.0
     out3[1] = <double>ld
     out3[2] = <double>m
 
 
+cdef tuple _alloc_wer_only_scratch(
+    Py_ssize_t vocab_size,
+    Py_ssize_t max_pattern,
+    Py_ssize_t max_row,
+    int n_threads,
+    _WerOnlyScratch* scratch,
+):
+    """
+    Allocate one WER-only scratch per thread, sized for a vocabulary, the longest
+    bit-parallel pattern and the longest banded DP row (0 when no cutoff is used).
+    scratch must point to n_threads structs. Returns the owning NumPy arrays, which
+    must be kept alive while the scratch is used.
+    """
+    cdef Py_ssize_t blocks = (max_pattern + 63) // 64
+    cdef Py_ssize_t peq_size = max(max_pattern * blocks, 1)
+    cdef Py_ssize_t vec_size = max(blocks, 1)
+    cdef int t
+    cdef cnp.ndarray local_of = np.full(n_threads * (vocab_size + 1), -1, dtype=np.int32)
+    cdef cnp.ndarray peq = np.empty(n_threads * peq_size, dtype=np.uint64)
+    cdef cnp.ndarray vp = np.empty(n_threads * vec_size, dtype=np.uint64)
+    cdef cnp.ndarray vn = np.empty(n_threads * vec_size, dtype=np.uint64)
+    cdef cnp.ndarray prev = np.empty(n_threads * (max_row + 1), dtype=np.int32)
+    cdef cnp.ndarray curr = np.empty(n_threads * (max_row + 1), dtype=np.int32)
+    for t in range(n_threads):
+        scratch[t].local_of = <cnp.int32_t*>cnp.PyArray_DATA(local_of) + t * (vocab_size + 1)
+        scratch[t].peq = <uint64_t*>cnp.PyArray_DATA(peq) + t * peq_size
+        scratch[t].vp = <uint64_t*>cnp.PyArray_DATA(vp) + t * vec_size
+        scratch[t].vn = <uint64_t*>cnp.PyArray_DATA(vn) + t * vec_size
+        scratch[t].prev = <cnp.int32_t*>cnp.PyArray_DATA(prev) + t * (max_row + 1)
+        scratch[t].curr = <cnp.int32_t*>cnp.PyArray_DATA(curr) + t * (max_row + 1)
+    return (local_of, peq, vp, vn, prev, curr)
+
+
+cdef double _check_max_wer(object max_wer) except? -2.0:
+    """
+    Validate the max_wer cutoff and convert it to the C sentinel used by the kernels
+    (-1.0 means no cutoff).
+    """
+    if max_wer is None:
+        return -1.0
+    if isinstance(max_wer, bool) or not isinstance(max_wer, (int, float, np.integer, np.floating)):
+        raise ValueError("max_wer must be a non-negative number or None.")
+    if not max_wer >= 0:
+        raise ValueError("max_wer must be a non-negative number or None.")
+    return <double>max_wer
+
+
+# ---------------------------------------------------------------------------
+# Full path: metrics with word tracking
+# ---------------------------------------------------------------------------
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef cnp.ndarray _metrics_batch_wer_only(list references, list hypotheses):
+cpdef cnp.ndarray calculations(object reference, object hypothesis, bint normalize=False):
+    cdef _SpanVocab table = _SpanVocab(normalize)
+    cdef cnp.ndarray ref_ids = _encode_text(reference, table)
+    cdef cnp.ndarray hyp_ids = _encode_text(hypothesis, table)
+
+    # Use Py_ssize_t for indices and sizes
+    # Py_ssize_t matches Python's internal index type and avoids unnecessary
+    # casts or overflow risks when working with Python lists and memoryviews.
+    cdef Py_ssize_t m = cnp.PyArray_DIMS(ref_ids)[0]
+    cdef Py_ssize_t n = cnp.PyArray_DIMS(hyp_ids)[0]
+    cdef Py_ssize_t cells = _align_buffer_cells(
+        <cnp.int32_t*>cnp.PyArray_DATA(ref_ids), m,
+        <cnp.int32_t*>cnp.PyArray_DATA(hyp_ids), n,
+    )
+    cdef _AlignWalk walk
+    cdef cnp.int32_t* ldm
+    cdef cnp.int32_t* op_ref
+    cdef cnp.int32_t* op_hyp
+    cdef cnp.ndarray row = np.empty(9, dtype=object)
+
+    # The DP matrix (or linear-memory scratch space for very long pairs) and the
+    # operation buffers live in the shared arena, which only grows when a pair
+    # needs more room than any pair before it. Boundary conditions are
+    # initialized by the kernel, so the buffer is not cleared.
+    cdef _Arena arena = _acquire_pair_arena()
+    try:
+        ldm = arena.reserve(cells + 2 * max(m, n))
+        op_ref = ldm + cells
+        op_hyp = op_ref + max(m, n)
+        _walk_init(
+            &walk,
+            <cnp.int32_t*>cnp.PyArray_DATA(ref_ids),
+            <cnp.int32_t*>cnp.PyArray_DATA(hyp_ids),
+            op_ref,
+            op_hyp,
+        )
+        _align_ops(&walk, m, n, ldm)
+        _write_alignment_row(
+            <PyObject**>cnp.PyArray_DATA(row), op_ref, op_hyp, walk.n_ops, walk.distance, m, table.words()
+        )
+    finally:
+        arena.in_use = False
+    return row
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef tuple _align_batch(
+    object references,
+    object hypotheses,
+    int n_threads,
+    const double* weights=NULL,
+    bint normalize=False,
+):
     """
-    Fast batch processing for WER-only calculations with buffer reuse and pointer swapping.
+    Align every reference-hypothesis pair of a batch and record the edit operations.
+
+    All references and hypotheses are interned against one vocabulary up front.
+    The DP and backtrace then run without the GIL, partitioned across n_threads
+    with one DP buffer per thread, and record each pair's edit operations in a
+    flat buffer. Pairs too large for a full matrix are aligned in linear memory.
+    With weights, the pairs are aligned at minimum weighted cost instead. With
+    normalize, the texts are normalized as they are tokenized.
+
+    Returns (vocab_words, ref_offsets, op_ref, op_hyp, op_offsets, op_counts,
+    distances). The operations of pair idx are stored back to front at
+    op_offsets[idx] and there are op_counts[idx] of them. distances[idx] is the
+    Levenshtein distance of the pair, which differs from op_counts[idx] only
+    for a weighted alignment.
+    """
+    cdef Py_ssize_t n_pairs = len(references)
+    cdef Py_ssize_t idx, m, n, cells
+    cdef int tid
+
+    cdef _SpanVocab table = _SpanVocab(normalize)
+    cdef cnp.ndarray ref_ids, ref_offsets, hyp_ids, hyp_offsets
+    ref_ids, ref_offsets = _encode_batch(references, table)
+    hyp_ids, hyp_offsets = _encode_batch(hypotheses, table)
+
+    cdef cnp.int32_t* ref_base = <cnp.int32_t*>cnp.PyArray_DATA(ref_ids)
+    cdef cnp.int32_t* hyp_base = <cnp.int32_t*>cnp.PyArray_DATA(hyp_ids)
+    cdef cnp.npy_intp* ref_off = <cnp.npy_intp*>cnp.PyArray_DATA(ref_offsets)
+    cdef cnp.npy_intp* hyp_off = <cnp.npy_intp*>cnp.PyArray_DATA(hyp_offsets)
+
+    # Each pair needs at most max(m, n) operations (m + n when weighted); size
+    # the operation buffer and the per-thread DP matrices in one pass over the
+    # offsets
+    cdef cnp.ndarray op_offsets = np.empty(n_pairs + 1, dtype=np.intp)
+    cdef cnp.npy_intp* op_off = <cnp.npy_intp*>cnp.PyArray_DATA(op_offsets)
+    cdef Py_ssize_t max_cells = 2
+    op_off[0] = 0
+    for idx in range(n_pairs):
+        m = ref_off[idx + 1] - ref_off[idx]
+        n = hyp_off[idx + 1] - hyp_off[idx]
+        if weights != NULL:
+            op_off[idx + 1] = op_off[idx] + m + n
+            cells = _weighted_align_buffer_cells(ref_base + ref_off[idx], m, hyp_base + hyp_off[idx], n)
+        else:
+            op_off[idx + 1] = op_off[idx] + max(m, n)
+            cells = _align_buffer_cells(ref_base + ref_off[idx], m, hyp_base + hyp_off[idx], n)
+        if cells > max_cells:
+            max_cells = cells
+    # Keep every thread's buffer 8-byte aligned for the float64 matrices
+    max_cells += max_cells & 1
+
+    n_threads = <int>max(min(<Py_ssize_t>n_threads, n_pairs), 1)
+    cdef cnp.ndarray ldm_arena = np.empty(n_threads * max_cells, dtype=np.int32)
+    cdef cnp.int32_t* ldm_base = <cnp.int32_t*>cnp.PyArray_DATA(ldm_arena)
+    cdef cnp.ndarray op_ref = np.empty(op_off[n_pairs], dtype=np.int32)
+    cdef cnp.ndarray op_hyp = np.empty(op_off[n_pairs], dtype=np.int32)
+    cdef cnp.int32_t* op_ref_base = <cnp.int32_t*>cnp.PyArray_DATA(op_ref)
+    cdef cnp.int32_t* op_hyp_base = <cnp.int32_t*>cnp.PyArray_DATA(op_hyp)
+    cdef cnp.ndarray op_counts = np.empty(n_pairs, dtype=np.intp)
+    cdef cnp.npy_intp* op_count = <cnp.npy_intp*>cnp.PyArray_DATA(op_counts)
+    cdef cnp.ndarray distances = np.empty(n_pairs, dtype=np.intp)
+    cdef cnp.npy_intp* distance = <cnp.npy_intp*>cnp.PyArray_DATA(distances)
+
+    for idx in prange(n_pairs, nogil=True, num_threads=n_threads, schedule="dynamic", chunksize=16):
+        tid = threadid()
+        m = ref_off[idx + 1] - ref_off[idx]
+        n = hyp_off[idx + 1] - hyp_off[idx]
+        op_count[idx] = _align_pair_ops(
+            ref_base + ref_off[idx], m,
+            hyp_base + hyp_off[idx], n,
+            weights,
+            ldm_base + tid * max_cells,
+            op_ref_base + op_off[idx],
+            op_hyp_base + op_off[idx],
+            distance + idx,
+        )
+
+    return table.words(), ref_offsets, op_ref, op_hyp, op_offsets, op_counts, distances
 
-    Eliminates repeated buffer allocations by reusing prev/curr arrays across all pairs
-    in the batch, sized to the maximum hypothesis length. Uses true pointer swapping
-    instead of value copying for optimal performance.
 
-    Returns (n, 3) float64 array where each row contains:
-    [wer, ld, m]
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef cnp.ndarray _metrics_batch(
+    object references,
+    object hypotheses,
+    int n_threads,
+    const double* weights=NULL,
+    bint normalize=False,
+):
+    """
+    Private batch processing function. Processes multiple reference-hypothesis
+    pairs at C speed, eliminating np.vectorize overhead.
+
+    The pairs are aligned by _align_batch and the word lists are built from the
+    recorded edit operations afterwards.
+
+    Returns (n, 9) object array where each row contains:
+    [wer, ld, m, insertions, deletions, substitutions, inserted_words, deleted_words, substituted_words]
     """
     cdef Py_ssize_t n_pairs = len(references)
     cdef Py_ssize_t idx
+    cdef list vocab_words
+    cdef cnp.ndarray ref_offsets, op_ref, op_hyp, op_offsets, op_counts, distances
+    vocab_words, ref_offsets, op_ref, op_hyp, op_offsets, op_counts, distances = _align_batch(
+        references, hypotheses, n_threads, weights, normalize
+    )
+
+    cdef cnp.npy_intp* ref_off = <cnp.npy_intp*>cnp.PyArray_DATA(ref_offsets)
+    cdef cnp.int32_t* op_ref_base = <cnp.int32_t*>cnp.PyArray_DATA(op_ref)
+    cdef cnp.int32_t* op_hyp_base = <cnp.int32_t*>cnp.PyArray_DATA(op_hyp)
+    cdef cnp.npy_intp* op_off = <cnp.npy_intp*>cnp.PyArray_DATA(op_offsets)
+    cdef cnp.npy_intp* op_count = <cnp.npy_intp*>cnp.PyArray_DATA(op_counts)
+    cdef cnp.npy_intp* distance = <cnp.npy_intp*>cnp.PyArray_DATA(distances)
+
+    # Rows output, dtype=object because cols 6-8 are lists; each row is written
+    # straight into the cells of out rather than through a row view
+    cdef cnp.ndarray out = np.empty((n_pairs, 9), dtype=object)
+    cdef PyObject** cells = <PyObject**>cnp.PyArray_DATA(out)
+    for idx in range(n_pairs):
+        _write_alignment_row(
+            cells + idx * 9,
+            op_ref_base + op_off[idx],
+            op_hyp_base + op_off[idx],
+            op_count[idx],
+            distance[idx],
+            ref_off[idx + 1] - ref_off[idx],
+            vocab_words,
+        )
+
+    return out
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef dict _metrics_batch_columnar(
+    object references,
+    object hypotheses,
+    int n_threads,
+    const double* weights=NULL,
+    bint normalize=False,
+):
+    """
+    Batch processing with a columnar result and no per-row Python objects.
+
+    The pairs are aligned by _align_batch. The counts are written to contiguous
+    numeric columns and the inserted, deleted and substituted words to flat int32
+    token id arrays with CSR offsets into the vocabulary.
+
+    Returns a dict of ndarrays:
+    - wer (float64), ld, m, insertions, deletions, substitutions (int32), one entry per pair
+    - vocabulary: object array mapping token ids to words
+    - inserted_ids, deleted_ids: int32 token ids; the words of pair idx are
+      inserted_ids[inserted_offsets[idx]:inserted_offsets[idx + 1]]
+    - substituted_ref_ids, substituted_hyp_ids: int32 token id pairs, sliced by substituted_offsets
+    - inserted_offsets, deleted_offsets, substituted_offsets: intp, n + 1 entries
+    """
+    cdef Py_ssize_t n_pairs = len(references)
+    cdef Py_ssize_t idx, k, pos_ins, pos_del, pos_sub
+    cdef int insertions, deletions, substitutions
+    cdef Py_ssize_t m
+    cdef const cnp.int32_t* ops_ref
+    cdef const cnp.int32_t* ops_hyp
+    cdef list vocab_words
+    cdef cnp.ndarray ref_offsets, op_ref, op_hyp, op_offsets, op_counts, distances
+    vocab_words, ref_offsets, op_ref, op_hyp, op_offsets, op_counts, distances = _align_batch(
+        references, hypotheses, n_threads, weights, normalize
+    )
+
+    cdef cnp.npy_intp* ref_off = <cnp.npy_intp*>cnp.PyArray_DATA(ref_offsets)
+    cdef cnp.int32_t* op_ref_base = <cnp.int32_t*>cnp.PyArray_DATA(op_ref)
+    cdef cnp.int32_t* op_hyp_base = <cnp.int32_t*>cnp.PyArray_DATA(op_hyp)
+    cdef cnp.npy_intp* op_off = <cnp.npy_intp*>cnp.PyArray_DATA(op_offsets)
+    cdef cnp.npy_intp* op_count = <cnp.npy_intp*>cnp.PyArray_DATA(op_counts)
+    cdef cnp.npy_intp* distance = <cnp.npy_intp*>cnp.PyArray_DATA(distances)
+
+    cdef cnp.ndarray wer_col = np.empty(n_pairs, dtype=np.float64)
+    cdef cnp.ndarray ld_col = np.empty(n_pairs, dtype=np.int32)
+    cdef cnp.ndarray m_col = np.empty(n_pairs, dtype=np.int32)
+    cdef cnp.ndarray ins_col = np.empty(n_pairs, dtype=np.int32)
+    cdef cnp.ndarray del_col = np.empty(n_pairs, dtype=np.int32)
+    cdef cnp.ndarray sub_col = np.empty(n_pairs, dtype=np.int32)
+    cdef cnp.ndarray ins_offsets = np.empty(n_pairs + 1, dtype=np.intp)
+    cdef cnp.ndarray del_offsets = np.empty(n_pairs + 1, dtype=np.intp)
+    cdef cnp.ndarray sub_offsets = np.empty(n_pairs + 1, dtype=np.intp)
+    cdef double* wer_out = <double*>cnp.PyArray_DATA(wer_col)
+    cdef cnp.int32_t* ld_out = <cnp.int32_t*>cnp.PyArray_DATA(ld_col)
+    cdef cnp.int32_t* m_out = <cnp.int32_t*>cnp.PyArray_DATA(m_col)
+    cdef cnp.int32_t* ins_out = <cnp.int32_t*>cnp.PyArray_DATA(ins_col)
+    cdef cnp.int32_t* del_out = <cnp.int32_t*>cnp.PyArray_DATA(del_col)
+    cdef cnp.int32_t* sub_out = <cnp.int32_t*>cnp.PyArray_DATA(sub_col)
+    cdef cnp.npy_intp* ins_off = <cnp.npy_intp*>cnp.PyArray_DATA(ins_offsets)
+    cdef cnp.npy_intp* del_off = <cnp.npy_intp*>cnp.PyArray_DATA(del_offsets)
+    cdef cnp.npy_intp* sub_off = <cnp.npy_intp*>cnp.PyArray_DATA(sub_offsets)
+
+    # First pass: counts and offsets
+    with nogil:
+        ins_off[0] = 0
+        del_off[0] = 0
+        sub_off[0] = 0
+        for idx in range(n_pairs):
+            ops_ref = op_ref_base + op_off[idx]
+            ops_hyp = op_hyp_base + op_off[idx]
+            insertions = 0
+            deletions = 0
+            substitutions = 0
+            for k in range(op_count[idx]):
+                if ops_ref[k] < 0:
+                    insertions += 1
+                elif ops_hyp[k] < 0:
+                    deletions += 1
+                else:
+                    substitutions += 1
+            m = ref_off[idx + 1] - ref_off[idx]
+            wer_out[idx] = (<double>distance[idx]) / m if m > 0 else 0.0
+            ld_out[idx] = <cnp.int32_t>distance[idx]
+            m_out[idx] = <cnp.int32_t>m
+            ins_out[idx] = insertions
+            del_out[idx] = deletions
+            sub_out[idx] = substitutions
+            ins_off[idx + 1] = ins_off[idx] + insertions
+            del_off[idx + 1] = del_off[idx] + deletions
+            sub_off[idx + 1] = sub_off[idx] + substitutions
+
+    cdef cnp.ndarray ins_ids = np.empty(ins_off[n_pairs], dtype=np.int32)
+    cdef cnp.ndarray del_ids = np.empty(del_off[n_pairs], dtype=np.int32)
+    cdef cnp.ndarray sub_ref_ids = np.empty(sub_off[n_pairs], dtype=np.int32)
+    cdef cnp.ndarray sub_hyp_ids = np.empty(sub_off[n_pairs], dtype=np.int32)
+    cdef cnp.int32_t* ins_ids_out = <cnp.int32_t*>cnp.PyArray_DATA(ins_ids)
+    cdef cnp.int32_t* del_ids_out = <cnp.int32_t*>cnp.PyArray_DATA(del_ids)
+    cdef cnp.int32_t* sub_ref_out = <cnp.int32_t*>cnp.PyArray_DATA(sub_ref_ids)
+    cdef cnp.int32_t* sub_hyp_out = <cnp.int32_t*>cnp.PyArray_DATA(sub_hyp_ids)
+
+    # Second pass: token ids in alignment order (operations are stored back to front)
+    with nogil:
+        for idx in range(n_pairs):
+            ops_ref = op_ref_base + op_off[idx]
+            ops_hyp = op_hyp_base + op_off[idx]
+            pos_ins = ins_off[idx]
+            pos_del = del_off[idx]
+            pos_sub = sub_off[idx]
+            for k in range(op_count[idx] - 1, -1, -1):
+                if ops_ref[k] < 0:
+                    ins_ids_out[pos_ins] = ops_hyp[k]
+                    pos_ins += 1
+                elif ops_hyp[k] < 0:
+                    del_ids_out[pos_del] = ops_ref[k]
+                    pos_del += 1
+                else:
+                    sub_ref_out[pos_sub] = ops_ref[k]
+                    sub_hyp_out[pos_sub] = ops_hyp[k]
+                    pos_sub += 1
+
+    cdef cnp.ndarray vocabulary = np.empty(len(vocab_words), dtype=object)
+    vocabulary[:] = vocab_words
+
+    return {
+        "wer": wer_col,
+        "ld": ld_col,
+        "m": m_col,
+        "insertions": ins_col,
+        "deletions": del_col,
+        "substitutions": sub_col,
+        "vocabulary": vocabulary,
+        "inserted_ids": ins_ids,
+        "inserted_offsets": ins_offsets,
+        "deleted_ids": del_ids,
+        "deleted_offsets": del_offsets,
+        "substituted_ref_ids": sub_ref_ids,
+        "substituted_hyp_ids": sub_hyp_ids,
+        "substituted_offsets": sub_offsets,
+    }
+
+
+cpdef object metrics(
+    object reference,
+    object hypothesis,
+    object n_jobs=1,
+    bint columnar=False,
+    object weights=None,
+    bint normalize=False,
+):
+    """
+    Unified fast metrics entry point (Option A, rows contract).
+
+    n_jobs sets the number of threads used for batches (-1 uses all CPUs).
+    columnar=True returns the columnar dict of _metrics_batch_columnar instead of
+    rows, with one entry per pair (a single string pair counts as a batch of one).
+    weights=(insertions, deletions, substitutions) aligns every pair at minimum
+    weighted cost rather than minimum edit distance; the counts and words are
+    those of that alignment, while wer and ld remain the Levenshtein distance.
+    normalize=True normalizes the texts like normalize() while they are
+    tokenized, so the words are reported normalized.
+
+    Returns:
+    - strings: a single row (len 9)
+    - sequences: an (n, 9) object ndarray, one row per pair
+    """
+    cdef int n_threads = _resolve_n_jobs(n_jobs)
+    cdef double costs[3]
+    cdef const double* weight_ptr = NULL
+    if weights is not None:
+        _check_weights(weights, costs)
+        weight_ptr = costs
+    if _is_batch(reference, hypothesis):
+        if columnar:
+            return _metrics_batch_columnar(
+                _batch_texts(reference), _batch_texts(hypothesis), n_threads, weight_ptr, normalize
+            )
+        return _metrics_batch(
+            _batch_texts(reference), _batch_texts(hypothesis), n_threads, weight_ptr, normalize
+        )
+    if columnar:
+        return _metrics_batch_columnar([reference], [hypothesis], 1, weight_ptr, normalize)
+    if weight_ptr != NULL:
+        return _metrics_batch([reference], [hypothesis], 1, weight_ptr, normalize)[0]
+    return calculations(reference, hypothesis, normalize)
+
+
+# ---------------------------------------------------------------------------
+# Fast path: counts without word tracking
+# ---------------------------------------------------------------------------
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef cnp.ndarray calculations_fast(object reference, object hypothesis, bint normalize=False):
+    """
+    Fast path for WER/LD calculations without word tracking.
+    Returns only numeric metrics (WER, LD, m, insertions, deletions, substitutions).
+
+    This function is optimized for use cases that only need counts and metrics,
+    not the actual lists of inserted/deleted/substituted words. The counts are
+    carried along the DP rows by _count_ops, so it needs O(n) memory and no
+    backtrace.
+
+    Returns (6,) float64 array: [wer, ld, m, insertions, deletions, substitutions]
+    """
+    cdef _SpanVocab table = _SpanVocab(normalize)
+    cdef cnp.ndarray ref_ids = _encode_text(reference, table)
+    cdef cnp.ndarray hyp_ids = _encode_text(hypothesis, table)
+
+    cdef Py_ssize_t m = cnp.PyArray_DIMS(ref_ids)[0]
+    cdef Py_ssize_t n = cnp.PyArray_DIMS(hyp_ids)[0]
+
+    cdef cnp.ndarray out = np.empty(6, dtype=np.float64)
+
+    # Rolling DP rows from the shared arena
+    cdef _Arena arena = _acquire_pair_arena()
+    try:
+        _calculations_fast_ptr(
+            <cnp.int32_t*>cnp.PyArray_DATA(ref_ids), m,
+            <cnp.int32_t*>cnp.PyArray_DATA(hyp_ids), n,
+            arena.reserve(
+                _count_buffer_cells(
+                    <cnp.int32_t*>cnp.PyArray_DATA(ref_ids), m,
+                    <cnp.int32_t*>cnp.PyArray_DATA(hyp_ids), n,
+                )
+            ),
+            <double*>cnp.PyArray_DATA(out),
+        )
+    finally:
+        arena.in_use = False
+    return out
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline void _calculations_fast_ptr(
+    const cnp.int32_t* ref_ids,
+    Py_ssize_t m,
+    const cnp.int32_t* hyp_ids,
+    Py_ssize_t n,
+    cnp.int32_t* rows,
+    double* out6,
+    const double* weights=NULL,
+) noexcept nogil:
+    """
+    Internal counts-only kernel using a caller-provided buffer of
+    _count_buffer_cells() cells, or _weighted_count_buffer_cells() with weights.
+    Writes: out6 = [wer, ld, m, insertions, deletions, substitutions]
+    """
+    cdef _AlignWalk walk
+
+    # Counts of the backtrace path carried along the DP rows (no word tracking)
+    _walk_init(&walk, ref_ids, hyp_ids, NULL, NULL)
+    if weights != NULL:
+        _count_weighted_ops(&walk, m, n, weights, rows)
+    else:
+        _count_ops(&walk, m, n, rows)
+
+    out6[0] = (<double>walk.distance) / m if m > 0 else 0.0
+    out6[1] = <double>walk.distance
+    out6[2] = <double>m
+    out6[3] = <double>walk.insertions
+    out6[4] = <double>walk.deletions
+    out6[5] = <double>walk.substitutions
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef cnp.ndarray _metrics_batch_fast(
+    object references,
+    object hypotheses,
+    int n_threads,
+    const double* weights=NULL,
+    bint normalize=False,
+):
+    """
+    Fast batch processing without word tracking.
+
+    The counting DP runs without the GIL, partitioned across n_threads with one
+    set of rolling rows per thread, sized to the widest pair, and each pair
+    writes straight into its output row. With weights, the counts are those of
+    the minimum weighted cost alignment and the Levenshtein distance is
+    computed separately.
+
+    Returns (n, 6) float64 array where each row contains:
+    [wer, ld, m, insertions, deletions, substitutions]
+    """
+    cdef _SpanVocab table = _SpanVocab(normalize)
+    cdef cnp.ndarray ref_ids, ref_offsets, hyp_ids, hyp_offsets
+    ref_ids, ref_offsets = _encode_batch(references, table)
+    hyp_ids, hyp_offsets = _encode_batch(hypotheses, table)
+
+    return _fast_from_ids(ref_ids, ref_offsets, hyp_ids, hyp_offsets, n_threads, weights)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef cnp.ndarray _fast_from_ids(
+    cnp.ndarray ref_ids,
+    cnp.ndarray ref_offsets,
+    cnp.ndarray hyp_ids,
+    cnp.ndarray hyp_offsets,
+    int n_threads,
+    const double* weights=NULL,
+):
+    """
+    Run the counting DP over interned int32 ids with CSR offsets, as produced
+    by _encode_batch (words) or _encode_chars_batch (characters). Returns the
+    (n, 6) float64 [wer, ld, m, insertions, deletions, substitutions] array.
+    """
+    cdef Py_ssize_t n_pairs = cnp.PyArray_DIMS(ref_offsets)[0] - 1
+    cdef Py_ssize_t idx, m, n, cells
+    cdef int tid
+
+    cdef cnp.int32_t* ref_base = <cnp.int32_t*>cnp.PyArray_DATA(ref_ids)
+    cdef cnp.int32_t* hyp_base = <cnp.int32_t*>cnp.PyArray_DATA(hyp_ids)
+    cdef cnp.npy_intp* ref_off = <cnp.npy_intp*>cnp.PyArray_DATA(ref_offsets)
+    cdef cnp.npy_intp* hyp_off = <cnp.npy_intp*>cnp.PyArray_DATA(hyp_offsets)
+
+    cdef Py_ssize_t max_cells = 2
+    for idx in range(n_pairs):
+        m = ref_off[idx + 1] - ref_off[idx]
+        n = hyp_off[idx + 1] - hyp_off[idx]
+        if weights != NULL:
+            cells = _weighted_count_buffer_cells(ref_base + ref_off[idx], m, hyp_base + hyp_off[idx], n)
+        else:
+            cells = _count_buffer_cells(ref_base + ref_off[idx], m, hyp_base + hyp_off[idx], n)
+        if cells > max_cells:
+            max_cells = cells
+
+    n_threads = <int>max(min(<Py_ssize_t>n_threads, n_pairs), 1)
+    cdef cnp.ndarray rows_arena = np.empty(n_threads * max_cells, dtype=np.int32)
+    cdef cnp.int32_t* rows_base = <cnp.int32_t*>cnp.PyArray_DATA(rows_arena)
+
+    cdef cnp.ndarray out = np.empty((n_pairs, 6), dtype=np.float64)
+    cdef double* out_base = <double*>cnp.PyArray_DATA(out)
+
+    for idx in prange(n_pairs, nogil=True, num_threads=n_threads, schedule="dynamic", chunksize=16):
+        tid = threadid()
+        m = ref_off[idx + 1] - ref_off[idx]
+        n = hyp_off[idx + 1] - hyp_off[idx]
+        _calculations_fast_ptr(
+            ref_base + ref_off[idx], m,
+            hyp_base + hyp_off[idx], n,
+            rows_base + tid * max_cells,
+            out_base + idx * 6,
+            weights,
+        )
+
+    return out
+
+
+cpdef object metrics_fast(
+    object reference, object hypothesis, object n_jobs=1, object weights=None, bint normalize=False
+):
+    """
+    Fast metrics entry point without word tracking.
+
+    n_jobs sets the number of threads used for batches (-1 uses all CPUs).
+    weights=(insertions, deletions, substitutions) counts the operations of the
+    minimum weighted cost alignment rather than the minimum edit distance one;
+    wer and ld remain the Levenshtein distance. normalize=True normalizes the
+    texts like normalize() while they are tokenized.
+
+    Returns:
+    - strings: (6,) float64 array [wer, ld, m, insertions, deletions, substitutions]
+    - sequences: (n, 6) float64 array, one row per pair
+    """
+    cdef int n_threads = _resolve_n_jobs(n_jobs)
+    cdef double costs[3]
+    cdef const double* weight_ptr = NULL
+    if weights is not None:
+        _check_weights(weights, costs)
+        weight_ptr = costs
+    if _is_batch(reference, hypothesis):
+        return _metrics_batch_fast(
+            _batch_texts(reference), _batch_texts(hypothesis), n_threads, weight_ptr, normalize
+        )
+    if weight_ptr != NULL:
+        return _metrics_batch_fast([reference], [hypothesis], 1, weight_ptr, normalize)[0]
+    return calculations_fast(reference, hypothesis, normalize)
+
+
+# ---------------------------------------------------------------------------
+# WER-only path: bit-parallel edit distance, no backtrace
+# ---------------------------------------------------------------------------
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef cnp.ndarray calculations_wer_only(
+    object reference, object hypothesis, object max_wer=None, bint normalize=False
+):
+    """
+    WER-only fast path - bit-parallel DP (O(n) memory), no backtrace.
+    Returns only [wer, ld, m] without error counts or word tracking.
+
+    This is the fastest path for pure WER calculation, using Myers' bit-vector
+    edit distance which needs O(ceil(m/64) * n) word operations instead of the
+    O(m * n) cell updates of a Wagner-Fischer DP.
+
+    If max_wer is given, a banded DP limited to floor(max_wer * m) diagonals is
+    used instead, and a pair above the cutoff is reported as wer = ld = inf.
+
+    Returns (3,) float64 array: [wer, ld, m]
+    """
+    cdef double cutoff = _check_max_wer(max_wer)
+    cdef _SpanVocab table = _SpanVocab(normalize)
+    cdef cnp.ndarray ref_ids = _encode_text(reference, table)
+    cdef cnp.ndarray hyp_ids = _encode_text(hypothesis, table)
+
+    cdef Py_ssize_t m = cnp.PyArray_DIMS(ref_ids)[0]
+    cdef Py_ssize_t n = cnp.PyArray_DIMS(hyp_ids)[0]
+
+    cdef _WerOnlyScratch scratch
+    cdef tuple scratch_arrays = _alloc_wer_only_scratch(
+        table.size, min(m, n), n + 1 if cutoff >= 0.0 else 0, 1, &scratch
+    )
+    cdef cnp.ndarray out = np.empty(3, dtype=np.float64)
+
+    _calculations_wer_only_reuse_ptr(
+        <cnp.int32_t*>cnp.PyArray_DATA(ref_ids), m,
+        <cnp.int32_t*>cnp.PyArray_DATA(hyp_ids), n,
+        cutoff,
+        &scratch,
+        <double*>cnp.PyArray_DATA(out),
+    )
+    return out
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef cnp.ndarray _metrics_batch_wer_only(
+    object references,
+    object hypotheses,
+    double max_wer,
+    int n_threads,
+    bint normalize=False,
+):
+    """
+    Fast batch processing for WER-only calculations with buffer reuse.
+
+    Eliminates repeated buffer allocations by reusing the bit-parallel scratch
+    (Peq rows and VP/VN block vectors) and the banded DP rows across all pairs in
+    the batch, sized to the longest pattern and hypothesis. The token lengths come
+    from the interned offsets, so every string is split exactly once. The pairs
+    are partitioned across n_threads without the GIL, with one scratch per thread.
+
+    Returns (n, 3) float64 array where each row contains:
+    [wer, ld, m]
+    """
+    cdef _SpanVocab table = _SpanVocab(normalize)
+    cdef cnp.ndarray ref_ids, ref_offsets, hyp_ids, hyp_offsets
+    ref_ids, ref_offsets = _encode_batch(references, table)
+    hyp_ids, hyp_offsets = _encode_batch(hypotheses, table)
+
+    return _wer_only_from_ids(
+        ref_ids, ref_offsets, hyp_ids, hyp_offsets, table.size, max_wer, n_threads
+    )
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef cnp.ndarray _wer_only_from_ids(
+    cnp.ndarray ref_ids,
+    cnp.ndarray ref_offsets,
+    cnp.ndarray hyp_ids,
+    cnp.ndarray hyp_offsets,
+    Py_ssize_t vocab_size,
+    double max_wer,
+    int n_threads,
+):
+    """
+    Run the WER-only kernel over interned int32 ids with CSR offsets, as produced
+    by _encode_batch (words) or _encode_chars_batch (characters), with ids below
+    vocab_size. Returns the (n, 3) float64 [wer, ld, m] array.
+    """
+    cdef Py_ssize_t n_pairs = cnp.PyArray_DIMS(ref_offsets)[0] - 1
+    cdef Py_ssize_t idx, m, n
+    cdef int tid
+
+    cdef cnp.int32_t* ref_base = <cnp.int32_t*>cnp.PyArray_DATA(ref_ids)
+    cdef cnp.int32_t* hyp_base = <cnp.int32_t*>cnp.PyArray_DATA(hyp_ids)
+    cdef cnp.npy_intp* ref_off = <cnp.npy_intp*>cnp.PyArray_DATA(ref_offsets)
+    cdef cnp.npy_intp* hyp_off = <cnp.npy_intp*>cnp.PyArray_DATA(hyp_offsets)
 
     cdef cnp.ndarray out = np.empty((n_pairs, 3), dtype=np.float64)
+    cdef double* out_base = <double*>cnp.PyArray_DATA(out)
 
-    # Find max hypothesis token length to size buffers once
+    # Find the longest pattern (shorter side of each pair) and hypothesis to size buffers once
+    cdef Py_ssize_t max_pattern = 0
     cdef Py_ssize_t max_n = 0
-    cdef Py_ssize_t this_n
-    cdef object h
-    cdef list h_words
     for idx in range(n_pairs):
-        h = hypotheses[idx]
-        h_words = h.split()
-        this_n = len(h_words)
-        if this_n > max_n:
-            max_n = this_n
-
-    # Allocate reusable DP buffers once for the entire batch
-    cdef cnp.ndarray prev_arr = np.empty(max_n + 1, dtype=np.int32)
-    cdef cnp.ndarray curr_arr = np.empty(max_n + 1, dtype=np.int32)
-
-    # Get raw pointers for zero-cost swapping
-    cdef cnp.int32_t* prev = <cnp.int32_t*>cnp.PyArray_DATA(prev_arr)
-    cdef cnp.int32_t* curr = <cnp.int32_t*>cnp.PyArray_DATA(curr_arr)
-
-    # Process each pair using shared buffers, writing directly to output rows
-    cdef double* out_row
-    for idx in range(n_pairs):
-        out_row = <double*>cnp.PyArray_DATA(out) + (idx * 3)
-        _calculations_wer_only_reuse_ptr(references[idx], hypotheses[idx], prev, curr, out_row)
+        m = ref_off[idx + 1] - ref_off[idx]
+        n = hyp_off[idx + 1] - hyp_off[idx]
+        if min(m, n) > max_pattern:
+            max_pattern = min(m, n)
+        if n > max_n:
+            max_n = n
+
+    # Allocate reusable scratch buffers once per thread for the entire batch
+    n_threads = <int>max(min(<Py_ssize_t>n_threads, n_pairs), 1)
+    cdef cnp.ndarray scratch_structs = np.empty(n_threads * sizeof(_WerOnlyScratch), dtype=np.uint8)
+    cdef _WerOnlyScratch* scratch = <_WerOnlyScratch*>cnp.PyArray_DATA(scratch_structs)
+    cdef tuple scratch_arrays = _alloc_wer_only_scratch(
+        vocab_size, max_pattern, max_n + 1 if max_wer >= 0.0 else 0, n_threads, scratch
+    )
+
+    # Process each pair using per-thread buffers, writing directly to output rows
+    for idx in prange(n_pairs, nogil=True, num_threads=n_threads, schedule="dynamic", chunksize=64):
+        tid = threadid()
+        m = ref_off[idx + 1] - ref_off[idx]
+        n = hyp_off[idx + 1] - hyp_off[idx]
+        _calculations_wer_only_reuse_ptr(
+            ref_base + ref_off[idx], m, hyp_base + hyp_off[idx], n, max_wer,
+            scratch + tid, out_base + idx * 3,
+        )
 
     return out
 
 
-cpdef object metrics_wer_only(object reference, object hypothesis):
+cpdef object metrics_wer_only(
+    object reference, object hypothesis, object max_wer=None, object n_jobs=1, bint normalize=False
+):
     """
     WER-only metrics entry point (fastest path).
 
+    If max_wer is given, only pairs with WER <= max_wer get an exact value; pairs
+    above the cutoff are reported with wer = ld = inf. n_jobs sets the number of
+    threads used for batches (-1 uses all CPUs). normalize=True normalizes the
+    texts like normalize() while they are tokenized.
+
     Returns:
     - strings: (3,) float64 array [wer, ld, m]
     - sequences: (n, 3) float64 array, one row per pair
     """
-    if isinstance(reference, (list, np.ndarray)) and isinstance(hypothesis, (list, np.ndarray)):
-        return _metrics_batch_wer_only(list(reference), list(hypothesis))
-    return calculations_wer_only(reference, hypothesis)
+    cdef double cutoff = _check_max_wer(max_wer)
+    cdef int n_threads = _resolve_n_jobs(n_jobs)
+    if _is_batch(reference, hypothesis):
+        return _metrics_batch_wer_only(
+            _batch_texts(reference), _batch_texts(hypothesis), cutoff, n_threads, normalize
+        )
+    return calculations_wer_only(reference, hypothesis, max_wer, normalize)
+
+
+cdef class Scorer:
+    """
+    A reusable Word Error Rate scorer for one reference and hypothesis pair at a time, for latency-critical callers
+    that score many short pairs one by one, such as an online evaluation service.
+
+    Calling the scorer returns the same WER as wer(reference, hypothesis) for two strings, as a plain float. The call
+    is implemented in C and goes straight from tokenizing both strings to the WER-only kernel, reusing a token table
+    and kernel buffers that are kept in the scorer, so no NumPy array or exception handler is involved per call.
+
+    Unlike wer(), invalid input raises an exception instead of printing it and returning None. A scorer is not
+    thread-safe; use one scorer per thread.
+
+    Parameters
+    ----------
+    max_wer : float or None, optional
+        If given, pairs whose WER is above max_wer are reported as inf instead of their exact WER, which bounds the
+        work on long, noisy pairs. The default is None.
+    normalize : bool, optional
+        If True, the reference and hypothesis texts are normalized while they are split into words, with the same
+        result as calling normalize on them first. The default is False.
+
+    Raises
+    ------
+    ValueError
+        if max_wer is not a non-negative number or None.
+    AttributeError
+        (when called) if the reference or hypothesis is not a string.
+    ZeroDivisionError
+        (when called) if the reference has no words, also when it is blank only once normalized.
+
+    Examples
+    --------
+    >>> score = Scorer()
+    >>> print(score('i love cold pizza', 'i love pizza'))
+    0.25
+    """
+    cdef readonly object max_wer
+    cdef readonly bint normalize
+    cdef double cutoff
+    cdef _SpanVocab table
+    cdef _Arena ids
+    cdef _WerOnlyScratch scratch
+    cdef tuple scratch_arrays
+    cdef Py_ssize_t vocab_capacity
+    cdef Py_ssize_t pattern_capacity
+    cdef Py_ssize_t row_capacity
+
+    def __cinit__(self, object max_wer=None, bint normalize=False):
+        self.cutoff = _check_max_wer(max_wer)
+        self.max_wer = max_wer
+        self.normalize = normalize
+        self.table = _SpanVocab(normalize)
+        self.ids = _Arena()
+        self.vocab_capacity = -1
+        self.pattern_capacity = -1
+        self.row_capacity = -1
+
+    cdef int _reserve_scratch(self, Py_ssize_t vocab_size, Py_ssize_t pattern, Py_ssize_t row) except -1:
+        """
+        Make the kernel scratch large enough for a pair, growing it geometrically.
+        """
+        if vocab_size <= self.vocab_capacity and pattern <= self.pattern_capacity and row <= self.row_capacity:
+            return 0
+        if vocab_size > self.vocab_capacity:
+            self.vocab_capacity = max(vocab_size, 2 * self.vocab_capacity, 64)
+        if pattern > self.pattern_capacity:
+            self.pattern_capacity = max(pattern, 2 * self.pattern_capacity, 64)
+        if row > self.row_capacity:
+            self.row_capacity = max(row, 2 * self.row_capacity, 64)
+        self.scratch_arrays = _alloc_wer_only_scratch(
+            self.vocab_capacity, self.pattern_capacity, self.row_capacity, 1, &self.scratch
+        )
+        return 0
+
+    def __call__(self, object reference, object hypothesis):
+        cdef Py_ssize_t ref_room, m, n
+        cdef cnp.int32_t* ids
+        cdef double out3[3]
+
+        if not isinstance(reference, str) or not isinstance(hypothesis, str):
+            raise AttributeError(
+                "All text should be in a string format. Please check your input does not include any "
+                "Numeric data types."
+            )
+        ref_room = (PyUnicode_GET_LENGTH(reference) + 1) // 2
+        ids = self.ids.reserve(ref_room + (PyUnicode_GET_LENGTH(hypothesis) + 1) // 2)
+
+        self.table.clear()
+        m = _intern_str(self.table, reference, ids)
+        # A reference with no words, including one that is blank only once
+        # normalized, is rejected as in wer()
+        if m == 0:
+            raise ZeroDivisionError(
+                "Invalid input: reference must not be blank, and reference and hypothesis cannot both be empty."
+            )
+        n = _intern_str(self.table, hypothesis, ids + ref_room)
+
+        self._reserve_scratch(self.table.size, min(m, n), n + 1 if self.cutoff >= 0.0 else 0)
+        _calculations_wer_only_reuse_ptr(ids, m, ids + ref_room, n, self.cutoff, &self.scratch, out3)
+        return out3[0]
+
+
+# ---------------------------------------------------------------------------
+# Character path: CER on Unicode code points
+# ---------------------------------------------------------------------------
+
+cdef class _CharVocab:
+    """
+    Maps Unicode code points to dense int32 ids for the bit-parallel kernel.
+
+    Ids are looked up through a two-level table of 256-entry pages that are
+    allocated on first use, so mapping a character is two array reads and no
+    per-character Python object is ever created.
+    """
+    cdef cnp.int32_t page_of[0x1100]
+    cdef cnp.int32_t* pages
+    cdef Py_ssize_t n_pages
+    cdef Py_ssize_t page_capacity
+    cdef Py_ssize_t size
+
+    def __cinit__(self):
+        memset(self.page_of, 0xFF, sizeof(self.page_of))
+        self.pages = NULL
+        self.n_pages = 0
+        self.page_capacity = 0
+        self.size = 0
+
+    def __dealloc__(self):
+        free(self.pages)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef int map_ids(self, cnp.int32_t* chars, Py_ssize_t k) except -1:
+        """
+        Replace k code points in place with their ids, adding unseen characters.
+        Every code point must be at most 0x10FFFF, the range of page_of.
+        """
+        cdef Py_ssize_t i, capacity
+        cdef cnp.int32_t cp, page, token_id
+        cdef cnp.int32_t* grown
+
+        for i in range(k):
+            cp = chars[i]
+            page = self.page_of[cp >> 8]
+            if page < 0:
+                if self.n_pages == self.page_capacity:
+                    capacity = 2 * self.page_capacity if self.page_capacity else 4
+                    grown = <cnp.int32_t*>malloc(capacity * 256 * sizeof(cnp.int32_t))
+                    if grown == NULL:
+                        raise MemoryError()
+                    if self.n_pages:
+                        memcpy(grown, self.pages, self.n_pages * 256 * sizeof(cnp.int32_t))
+                    free(self.pages)
+                    self.pages = grown
+                    self.page_capacity = capacity
+                page = <cnp.int32_t>self.n_pages
+                memset(self.pages + page * 256, 0xFF, 256 * sizeof(cnp.int32_t))
+                self.page_of[cp >> 8] = page
+                self.n_pages += 1
+            token_id = self.pages[page * 256 + (cp & 0xFF)]
+            if token_id < 0:
+                token_id = <cnp.int32_t>self.size
+                self.pages[page * 256 + (cp & 0xFF)] = token_id
+                self.size += 1
+            chars[i] = token_id
+        return 0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _read_code_points(object text, cnp.int32_t* out) except -1:
+    """
+    Copy the code points of a str into out straight from its UCS1/UCS2/UCS4
+    buffer. Returns the number of code points written.
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = PyUnicode_GET_LENGTH(text)
+    cdef unsigned int kind = PyUnicode_KIND(text)
+    cdef void* data = PyUnicode_DATA(text)
+
+    if kind == PyUnicode_1BYTE_KIND:
+        for i in range(n):
+            out[i] = (<const unsigned char*>data)[i]
+    elif kind == PyUnicode_2BYTE_KIND:
+        for i in range(n):
+            out[i] = (<const unsigned short*>data)[i]
+    else:
+        memcpy(out, data, n * sizeof(cnp.int32_t))
+    return n
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _read_utf8_code_points(
+    const unsigned char* text,
+    Py_ssize_t length,
+    cnp.int32_t* out,
+) noexcept nogil:
+    """
+    Decode the UTF-8 bytes of one Arrow string into out. Returns the number of
+    code points written, or -1 if the bytes are not valid UTF-8.
+
+    Arrow does not validate the buffers of an array built with
+    pa.Array.from_buffers, so every sequence is checked before its code point is
+    used to index _CharVocab: the lead byte, the continuation bytes within
+    length, and the code point against overlong forms, surrogates and 0x10FFFF.
+    """
+    cdef Py_ssize_t pos = 0
+    cdef Py_ssize_t k = 0
+    cdef Py_ssize_t i, n_cont
+    cdef unsigned char c, b
+    cdef cnp.int32_t cp, lowest
+
+    while pos < length:
+        c = text[pos]
+        if c < 0x80:
+            out[k] = c
+            pos += 1
+            k += 1
+            continue
+        if 0xC2 <= c < 0xE0:
+            n_cont = 1
+            cp = c & 0x1F
+            lowest = 0x80
+        elif 0xE0 <= c < 0xF0:
+            n_cont = 2
+            cp = c & 0x0F
+            lowest = 0x800
+        elif 0xF0 <= c < 0xF5:
+            n_cont = 3
+            cp = c & 0x07
+            lowest = 0x10000
+        else:
+            return -1
+        if length - pos <= n_cont:
+            return -1
+        for i in range(1, n_cont + 1):
+            b = text[pos + i]
+            if (b & 0xC0) != 0x80:
+                return -1
+            cp = (cp << 6) | (b & 0x3F)
+        if cp < lowest or cp > 0x10FFFF or 0xD800 <= cp <= 0xDFFF:
+            return -1
+        out[k] = cp
+        pos += n_cont + 1
+        k += 1
+    return k
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _strip_code_points(cnp.int32_t* chars, Py_ssize_t k):
+    """
+    Drop leading and trailing whitespace (as str.strip() would) in place and
+    return the remaining length.
+    """
+    cdef Py_ssize_t lo = 0
+
+    while lo < k and Py_UNICODE_ISSPACE(<Py_UCS4>chars[lo]):
+        lo += 1
+    while k > lo and Py_UNICODE_ISSPACE(<Py_UCS4>chars[k - 1]):
+        k -= 1
+    if lo:
+        memmove(chars, chars + lo, (k - lo) * sizeof(cnp.int32_t))
+    return k - lo
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef tuple _encode_chars_batch(object texts, _CharVocab chars):
+    """
+    Convert a batch of texts into a flat int32 array of character ids with
+    CSR-style offsets, in the same layout as _encode_batch.
+
+    Leading and trailing whitespace is stripped and every other character,
+    including inner spaces, is kept. str inputs are read from their PyUnicode
+    buffers and pyarrow string columns from their UTF-8 buffers in place.
+    """
+    cdef Py_ssize_t n_texts = len(texts)
+    cdef Py_ssize_t idx = 0
+    cdef Py_ssize_t k, n_chars, n_rows, first, start, end
+    cdef Py_ssize_t total = 0
+    cdef Py_ssize_t capacity = 0
+    cdef bint large
+    cdef const unsigned char* data
+    cdef const char* text_off
+    cdef cnp.int32_t* base
+    cdef object text, buffers
+    cdef list chunks
+    cdef cnp.ndarray data_view, offsets_view
+
+    cdef cnp.ndarray offsets = np.empty(n_texts + 1, dtype=np.intp)
+    cdef cnp.npy_intp* off = <cnp.npy_intp*>cnp.PyArray_DATA(offsets)
+    cdef cnp.ndarray ids
+
+    off[0] = 0
+    if isinstance(texts, list):
+        for text in <list>texts:
+            if not isinstance(text, str):
+                raise AttributeError(
+                    "All text should be in a string format. Please check your input does not include any "
+                    "Numeric data types."
+                )
+            capacity += PyUnicode_GET_LENGTH(text)
+        ids = np.empty(capacity, dtype=np.int32)
+        base = <cnp.int32_t*>cnp.PyArray_DATA(ids)
+        for idx in range(n_texts):
+            k = _read_code_points((<list>texts)[idx], base + total)
+            k = _strip_code_points(base + total, k)
+            chars.map_ids(base + total, k)
+            total += k
+            off[idx + 1] = total
+        return ids[:total], offsets
+
+    chunks = list(texts.chunks) if hasattr(texts, "chunks") else [texts]
+    for chunk in chunks:
+        if chunk.null_count:
+            raise AttributeError(
+                "All text should be in a string format. Please check your input does not include any "
+                "missing values."
+            )
+        capacity += chunk.nbytes
+    ids = np.empty(capacity, dtype=np.int32)
+    base = <cnp.int32_t*>cnp.PyArray_DATA(ids)
+
+    for chunk in chunks:
+        n_rows = len(chunk)
+        if n_rows == 0:
+            continue
+        large = str(chunk.type) == "large_string"
+        buffers = chunk.buffers()
+        offsets_view = np.frombuffer(buffers[1], dtype=np.uint8)
+        data_view = np.frombuffer(buffers[2], dtype=np.uint8) if buffers[2] is not None else np.empty(0, np.uint8)
+        text_off = <const char*>cnp.PyArray_DATA(offsets_view)
+        data = <const unsigned char*>cnp.PyArray_DATA(data_view)
+        first = chunk.offset
+
+        for k in range(n_rows):
+            if large:
+                start = (<const long long*>text_off)[first + k]
+                end = (<const long long*>text_off)[first + k + 1]
+            else:
+                start = (<const cnp.int32_t*>text_off)[first + k]
+                end = (<const cnp.int32_t*>text_off)[first + k + 1]
+            n_chars = _read_utf8_code_points(data + start, end - start, base + total)
+            if n_chars < 0:
+                raise ValueError("The pyarrow string column holds invalid UTF-8 data.")
+            n_chars = _strip_code_points(base + total, n_chars)
+            chars.map_ids(base + total, n_chars)
+            total += n_chars
+            off[idx + 1] = total
+            idx += 1
+
+    return ids[:total], offsets
+
+
+cdef cnp.ndarray _metrics_batch_cer(object references, object hypotheses, int n_threads, bint counts=False):
+    """
+    Batch CER: characters are mapped to ids by _encode_chars_batch and scored by
+    the WER-only kernel, with the same per-thread scratch reuse, or with counts
+    by the counting DP of _metrics_batch_fast.
+
+    Returns (n, 3) float64 array where each row contains:
+    [cer, ld, m] with m the number of reference characters
+    or, with counts, (n, 6) with insertions, deletions and substitutions added.
+    """
+    cdef _CharVocab chars = _CharVocab()
+    cdef cnp.ndarray ref_ids, ref_offsets, hyp_ids, hyp_offsets
+    ref_ids, ref_offsets = _encode_chars_batch(references, chars)
+    hyp_ids, hyp_offsets = _encode_chars_batch(hypotheses, chars)
+
+    if counts:
+        return _fast_from_ids(ref_ids, ref_offsets, hyp_ids, hyp_offsets, n_threads)
+    return _wer_only_from_ids(
+        ref_ids, ref_offsets, hyp_ids, hyp_offsets, chars.size, -1.0, n_threads
+    )
+
+
+cpdef object metrics_cer(object reference, object hypothesis, object n_jobs=1, bint counts=False):
+    """
+    Character error rate entry point.
+
+    The edit distance is computed over the characters of each text after
+    stripping leading and trailing whitespace; inner spaces count as characters.
+    n_jobs sets the number of threads used for batches (-1 uses all CPUs).
+    counts=True also counts the character insertions, deletions and
+    substitutions, as metrics_fast() does for words.
+
+    Returns:
+    - strings: (3,) float64 array [cer, ld, m], or (6,) with counts
+    - sequences: (n, 3) float64 array, one row per pair, or (n, 6) with counts
+    """
+    cdef int n_threads = _resolve_n_jobs(n_jobs)
+    if (_is_columnar(reference) and is_tokenized_corpus(reference)) or (
+        _is_columnar(hypothesis) and is_tokenized_corpus(hypothesis)
+    ):
+        raise AttributeError("A TokenizedCorpus holds words and cannot be scored at the character level.")
+    if _is_batch(reference, hypothesis):
+        return _metrics_batch_cer(_batch_texts(reference), _batch_texts(hypothesis), n_threads, counts)
+    return _metrics_batch_cer([reference], [hypothesis], 1, counts)[0]
+
+
+# ---------------------------------------------------------------------------
+# Normalization: punctuation, case and whitespace in one pass
+# ---------------------------------------------------------------------------
+
+cdef extern from "Python.h":
+    object PyUnicode_FromKindAndData(int kind, const void* buffer, Py_ssize_t size)
+
+
+# Classes of the code points below 128: kept (and lowercased), dropped
+# (string.punctuation and NUL) or whitespace. Built once at import.
+cdef enum:
+    _CHAR_KEEP = 0
+    _CHAR_DROP = 1
+    _CHAR_SPACE = 2
+
+cdef unsigned char _ascii_class[128]
+cdef unsigned char _ascii_lower[128]
+
+# Legacy translation of punctuation bytes to NUL, for the strings the one-pass
+# normalizer hands back to str.lower() on the whole text
+cdef bytes _PUNCTUATION_TO_NUL = bytes(
+    [0 if c in string.punctuation.encode() else c for c in range(256)]
+)
+
+
+cdef void _init_ascii_class():
+    cdef int c
+    cdef bytes punctuation = string.punctuation.encode()
+    for c in range(128):
+        _ascii_lower[c] = c + 32 if 65 <= c <= 90 else c
+        if c == 0 or c in punctuation:
+            _ascii_class[c] = _CHAR_DROP
+        elif Py_UNICODE_ISSPACE(c):
+            _ascii_class[c] = _CHAR_SPACE
+        else:
+            _ascii_class[c] = _CHAR_KEEP
+
+
+_init_ascii_class()
+
+
+# Unicode punctuation (general categories Pc, Pd, Ps, Pe, Pi, Pf and Po) as a
+# two-level table: a block index per 256 code points, pointing at a 32-byte
+# bitmap shared by every block with the same punctuation. The Unicode database
+# only assigns punctuation in planes 0 and 1, so code points from
+# _PUNCTUATION_LIMIT up are never punctuation. Built from unicodedata on first
+# use, so it follows the Unicode version of str.casefold().
+cdef enum:
+    _PUNCTUATION_LIMIT = 0x20000
+
+cdef unsigned short _punctuation_blocks[_PUNCTUATION_LIMIT >> 8]
+cdef bytes _punctuation_bitmaps = None
+cdef const unsigned char* _punctuation_bits = NULL
+
+
+cdef void _init_unicode_punctuation():
+    global _punctuation_bitmaps, _punctuation_bits
+
+    cdef int block, offset
+    cdef bytearray bitmap
+    cdef dict seen = {bytes(32): 0}
+    cdef list bitmaps = [bytes(32)]
+
+    for block in range(_PUNCTUATION_LIMIT >> 8):
+        bitmap = bytearray(32)
+        for offset in range(256):
+            if unicodedata.category(chr((block << 8) | offset))[0] == "P":
+                bitmap[offset >> 3] |= 1 << (offset & 7)
+        key = bytes(bitmap)
+        if key not in seen:
+            seen[key] = len(bitmaps)
+            bitmaps.append(key)
+        _punctuation_blocks[block] = seen[key]
+    _punctuation_bitmaps = b"".join(bitmaps)
+    _punctuation_bits = _punctuation_bitmaps
+
+
+cdef inline bint _is_unicode_punctuation(unsigned int cp) noexcept nogil:
+    if cp >= _PUNCTUATION_LIMIT:
+        return False
+    return (_punctuation_bits[(_punctuation_blocks[cp >> 8] << 5) | ((cp >> 3) & 31)] >> (cp & 7)) & 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _normalize_ascii(
+    const unsigned char* text, Py_ssize_t length, unsigned char* out
+) noexcept nogil:
+    """
+    Normalize one ASCII text into out (room for length bytes) and return the
+    number of bytes written. Punctuation is removed without splitting the word
+    around it, letters are lowercased and every run of whitespace becomes one
+    space, with none at either end.
+    """
+    cdef Py_ssize_t pos = 0
+    cdef Py_ssize_t k = 0
+    cdef unsigned char c, char_class, keep, spaced
+    cdef unsigned char space = 0
+
+    # Skip to the first kept character, so that a pending space is never
+    # written before it
+    while pos < length and _ascii_class[text[pos]] != _CHAR_KEEP:
+        pos += 1
+
+    # Branch-free: the space and the character are always stored and k only
+    # advances past the ones that belong to the output, as word boundaries are
+    # unpredictable. k never exceeds pos, so the stores stay within out.
+    while pos < length:
+        c = text[pos]
+        char_class = _ascii_class[c]
+        keep = char_class == _CHAR_KEEP
+        spaced = keep & space
+        out[k] = 32
+        out[k + spaced] = _ascii_lower[c]
+        k += keep + spaced
+        space = (space | (char_class == _CHAR_SPACE)) & (keep ^ 1)
+        pos += 1
+    return k
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _normalize_code_points(
+    int kind, const void* data, Py_ssize_t length, Py_UCS4* out, bint* needs_lower_all,
+    bint unicode=False
+) noexcept nogil:
+    """
+    _normalize_ascii over the code points of a non-ASCII string. Only ASCII
+    letters are lowercased here; the caller applies str.lower() to the result
+    for the full Unicode case mapping. With unicode, Unicode punctuation is
+    removed as well, using the table of _init_unicode_punctuation().
+
+    That is the same as lowercasing before the punctuation is removed, except
+    for a capital sigma, whose lowercase form depends on its neighbours.
+    needs_lower_all is set when the text has one and punctuation was dropped.
+    """
+    cdef Py_ssize_t pos
+    cdef Py_ssize_t k = 0
+    cdef unsigned int cp
+    cdef unsigned char char_class
+    cdef bint space = False
+    cdef bint dropped = False
+    cdef bint sigma = False
+
+    for pos in range(length):
+        cp = <unsigned int>_read_code_point(kind, data, pos)
+        if cp < 128:
+            char_class = _ascii_class[cp]
+        elif _is_space_code_point(cp):
+            char_class = _CHAR_SPACE
+        elif unicode and _is_unicode_punctuation(cp):
+            char_class = _CHAR_DROP
+        else:
+            char_class = _CHAR_KEEP
+            if cp == 0x3A3:
+                sigma = True
+        if char_class == _CHAR_KEEP:
+            if space and k > 0:
+                out[k] = 32
+                k += 1
+            space = False
+            out[k] = <Py_UCS4>(cp + 32 if 65 <= cp <= 90 else cp)
+            k += 1
+        elif char_class == _CHAR_SPACE:
+            space = True
+        else:
+            dropped = True
+    needs_lower_all[0] = sigma and dropped
+    return k
+
+
+cdef object _normalize_unicode(object text, Py_UCS4* scratch, bint unicode=False):
+    """
+    Normalize one non-ASCII string with _normalize_code_points and str.lower(),
+    using scratch (room for len(text) code points). Returns a new str.
+
+    With unicode, Unicode punctuation is removed too and the result is case
+    folded with str.casefold(), which maps every sigma alike.
+    """
+    cdef bint needs_lower_all
+    cdef Py_ssize_t length = _normalize_code_points(
+        PyUnicode_KIND(text), PyUnicode_DATA(text), PyUnicode_GET_LENGTH(text), scratch, &needs_lower_all,
+        unicode
+    )
+    return _finish_unicode(text, scratch, length, needs_lower_all, unicode)
+
+
+cdef object _finish_unicode(
+    object text, const Py_UCS4* normalized, Py_ssize_t length, bint needs_lower_all, bint unicode
+):
+    """
+    Build the str for the output of _normalize_code_points over text and apply
+    the full Unicode case mapping to it.
+    """
+    if unicode:
+        return PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, normalized, length).casefold()
+    if needs_lower_all:
+        text = str(text).encode().translate(_PUNCTUATION_TO_NUL).decode().lower()
+        return " ".join(text.replace("\x00", "").split())
+    return PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, normalized, length).lower()
+
+
+cdef inline Py_ssize_t _normalize_slot(
+    Py_ssize_t idx, const cnp.npy_intp* src, const int* kind,
+    const cnp.npy_intp* off, const cnp.npy_intp* wide_off,
+    unsigned char* out, Py_UCS4* wide_out, int* lower_all, bint unicode
+) noexcept nogil:
+    """
+    Normalize text idx of a normalize_batch() call into its output slot.
+    """
+    if kind[idx] == 0:
+        return _normalize_ascii(<const unsigned char*>src[idx], off[idx + 1] - off[idx], out + off[idx])
+    return _normalize_code_points(
+        kind[idx], <const void*>src[idx], wide_off[idx + 1] - wide_off[idx],
+        wide_out + wide_off[idx], <bint*>&lower_all[idx], unicode
+    )
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef list normalize_batch(object texts, bint unicode=False, bint nfkc=False, object n_jobs=1):
+    """
+    Normalize a sequence of strings: remove the ASCII punctuation in
+    string.punctuation, lowercase and collapse whitespace.
+
+    With unicode, every Unicode punctuation character is removed as well and
+    the texts are case folded rather than lowercased. With nfkc, the texts are
+    first brought to Unicode normalization form NFKC.
+
+    Every string is normalized in a single pass without the GIL, ASCII strings
+    into one shared byte buffer and others, code point by code point, into one
+    shared UCS4 buffer. n_jobs sets the number of threads for that pass (-1
+    uses all CPUs); the output order is the input order. The strs are then
+    built from the buffers, and the non-ASCII ones are lowercased with
+    str.lower(). The result is the same as the original translate, lower,
+    split and join pipeline.
+
+    Raises TypeError if an element is not a string and ValueError if n_jobs
+    is invalid.
+    """
+    cdef int n_threads = _resolve_n_jobs(n_jobs)
+    cdef list items = texts if type(texts) is list and not nfkc else list(texts)
+    cdef Py_ssize_t n_texts = len(items)
+    cdef Py_ssize_t idx, length
+    cdef bint any_wide = False
+    cdef object text
+
+    # Per-text pointers, offsets and lengths, and kinds and sigma flags, each
+    # carved from one array
+    cdef cnp.ndarray slots = np.empty(4 * n_texts + 2, dtype=np.intp)
+    cdef cnp.ndarray flags = np.zeros(2 * n_texts, dtype=np.intc)
+    cdef cnp.npy_intp* src = <cnp.npy_intp*>cnp.PyArray_DATA(slots)
+    cdef cnp.npy_intp* off = src + n_texts
+    cdef cnp.npy_intp* wide_off = off + n_texts + 1
+    cdef cnp.npy_intp* out_len = wide_off + n_texts + 1
+    cdef int* kind = <int*>cnp.PyArray_DATA(flags)
+    cdef int* lower_all = kind + n_texts
+
+    # Validate and size: every string gets its slot in one of the two output
+    # buffers and a pointer to its characters, which stay valid while items
+    # holds them. kind is 0 for ASCII strings.
+    off[0] = 0
+    wide_off[0] = 0
+    for idx in range(n_texts):
+        text = items[idx]
+        if not isinstance(text, str):
+            raise TypeError(
+                "Input must be String, List, Tuple, or NumPy Array. "
+                "All data types should be flat, have a depth of 1 and "
+                "contain no nested elements."
+            )
+        if nfkc and not PyUnicode_IS_ASCII(text):
+            text = items[idx] = unicodedata.normalize("NFKC", text)
+        length = PyUnicode_GET_LENGTH(text)
+        src[idx] = <cnp.npy_intp>PyUnicode_DATA(text)
+        if PyUnicode_IS_ASCII(text):
+            kind[idx] = 0
+            off[idx + 1] = off[idx] + length
+            wide_off[idx + 1] = wide_off[idx]
+        else:
+            kind[idx] = PyUnicode_KIND(text)
+            off[idx + 1] = off[idx]
+            wide_off[idx + 1] = wide_off[idx] + length
+            any_wide = True
+
+    if unicode and any_wide and _punctuation_bits == NULL:
+        _init_unicode_punctuation()
+
+    cdef cnp.ndarray buffer = np.empty(max(off[n_texts], 1), dtype=np.uint8)
+    cdef cnp.ndarray code_points = np.empty(max(wide_off[n_texts], 1), dtype=np.uint32)
+    cdef unsigned char* out = <unsigned char*>cnp.PyArray_DATA(buffer)
+    cdef Py_UCS4* wide_out = <Py_UCS4*>cnp.PyArray_DATA(code_points)
+
+    # A single thread skips the OpenMP region, which dominates for one string
+    n_threads = <int>max(min(<Py_ssize_t>n_threads, n_texts), 1)
+    if n_threads == 1:
+        with nogil:
+            for idx in range(n_texts):
+                out_len[idx] = _normalize_slot(idx, src, kind, off, wide_off, out, wide_out, lower_all, unicode)
+    else:
+        for idx in prange(n_texts, nogil=True, num_threads=n_threads, schedule="dynamic", chunksize=256):
+            out_len[idx] = _normalize_slot(idx, src, kind, off, wide_off, out, wide_out, lower_all, unicode)
+
+    cdef list result = [None] * n_texts
+    for idx in range(n_texts):
+        if kind[idx] == 0:
+            result[idx] = PyUnicode_FromKindAndData(PyUnicode_1BYTE_KIND, out + off[idx], out_len[idx])
+        else:
+            result[idx] = _finish_unicode(
+                items[idx], wide_out + wide_off[idx], out_len[idx], lower_all[idx], unicode
+            )
+    return result
@@ -7,25 +7,39 @@ The normalize module provides preprocessing methods for normalizing text input t
 whitespace such as leading/trailing spaces and multiple in-text spaces. 
 
 This module defines the following function:
-    - normalize(text)
+    - normalize(text, unicode=False, nfkc=False, n_jobs=1)
 """
 
-import string
+from .metrics import normalize_batch
 
 
-def normalize(text):
+def normalize(text, unicode=False, nfkc=False, n_jobs=1):
     """
     This function serves as a versatile text preprocessing tool, designed to transform
     text data into an optimal format for a variety of natural language processing tasks,
     such as calculating the Word Error Rate (WER).
 
     Its core functionalities encompass removing punctuation, converting text to
-    lowercase, and eliminating unnecessary whitespace.
+    lowercase, and eliminating unnecessary whitespace. Each sentence is normalized
+    in a single compiled pass without holding the GIL, and batches can be split
+    across threads with n_jobs.
 
     Parameters
     ----------
     text : str, list, tuple or numpy array
         The input text to be normalized.
+    unicode : bool, optional
+        If True, all Unicode punctuation (general categories Pc, Pd, Ps, Pe, Pi, Pf
+        and Po, such as curly quotes, dashes and CJK punctuation) is removed in
+        addition to the ASCII punctuation, and the text is case folded with
+        str.casefold() rather than lowercased. Default is False.
+    nfkc : bool, optional
+        If True, the text is first brought to Unicode normalization form NFKC, so
+        that compatibility characters such as full-width letters and ligatures are
+        replaced by their standard equivalents. Default is False.
+    n_jobs : int or None, optional
+        The number of threads used to normalize a batch of texts. The default of 1 runs
+        serially, and -1 uses all available CPUs. The output keeps the order of the input.
 
     Raises
     ------
@@ -33,6 +47,8 @@ def normalize(text):
         If the input is not a valid data type such as (int, float, bool, range, dict,
         bytes, bytearray, complex) or if the input contains nested data (e.g., a list of
         lists), the function raises a TypeError.
+    ValueError
+        If n_jobs is not a non-zero integer or None.
 
     Returns
     -------
@@ -55,33 +71,17 @@ def normalize(text):
     ['its very popular in antarctica', 'the sugar bear character']
     >>> reference
     ['its very popular in antarctica', 'the sugar bear character']
+
+    >>> normalize("“Straße” — Ｗｉｆｉ。", unicode=True, nfkc=True)
+    'strasse wifi'
     """
     if isinstance(text, (int, float, bool, range, dict, bytes, bytearray, complex)):
         raise TypeError("Input must be String, List, Tuple, or NumPy Array.")
 
+    # Punctuation removal, lowercasing and whitespace collapsing run in one
+    # compiled pass per sentence, using a character class table built once.
+    # Unicode punctuation is looked up in a code point table built on first use
     if isinstance(text, str):
-        is_string_flag = True
-        text = [text]
-    else:
-        is_string_flag = False
-
-    normalized_text = []
-    translate_table = [0 if c in string.punctuation.encode() else c for c in range(256)]
-    translate_bytes = bytes(translate_table)
-
-    for sentence in text:
-        if not isinstance(sentence, str):
-            raise TypeError(
-                "Input must be String, List, Tuple, or NumPy Array. "
-                "All data types should be flat, have a depth of 1 and "
-                "contain no nested elements."
-            )
-        cleaned_sentence = sentence.encode().translate(translate_bytes).decode().lower()
-        cleaned_sentence = cleaned_sentence.rstrip("\x00").replace("\x00", "")
-        cleaned_sentence = " ".join(cleaned_sentence.split())
-        normalized_text.append(cleaned_sentence)
-
-    if is_string_flag:
-        return normalized_text[0]
+        return normalize_batch([text], unicode, nfkc)[0]
 
-    return normalized_text
+    return normalize_batch(text, unicode, nfkc, n_jobs)
@@ -0,0 +1,15 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This module provides a reusable Word Error Rate scorer for latency-critical callers that score one reference and
+hypothesis pair at a time. The scorer is implemented in the compiled metrics module, so that calling it goes straight
+to the WER kernel without any Python level validation or result conversion.
+
+This module defines the following class:
+    - Scorer(): A preconfigured scorer that returns the WER of a single pair as a float.
+"""
+
+from .metrics import Scorer
+
+__all__ = ["Scorer"]
@@ -6,31 +6,56 @@ This module provides a summary function to display a complete breakdown of the c
 DataFrame.
 
 This module defines the following function:
-    - summary(reference, hypothesis)
+    - summary(reference, hypothesis, n_jobs=1, columnar=False, normalize=False, return_type="dataframe")
 """
 
+import importlib
+from typing import TYPE_CHECKING
 import numpy as np
-import pandas as pd
-from .errorhandler import error_handler
-from .metrics import metrics
+from .errorhandler import check_reference_words, check_return_type, error_handler
+from .metrics import metrics, metrics_fast
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-def summary(reference, hypothesis) -> pd.DataFrame | None:
+# One record per sequence over the (n, 6) float64 rows of metrics_fast
+_COUNTS_DTYPE = np.dtype(
+    [(name, np.float64) for name in ("wer", "ld", "m", "insertions", "deletions", "substitutions")]
+)
+
+
+def summary(
+    reference, hypothesis, n_jobs=1, columnar=False, normalize=False, return_type="dataframe"
+) -> "pd.DataFrame | dict | np.ndarray | None":
     """
     This function provides a comprehensive breakdown of the calculated results including the WER, Levenshtein
     Distance and all the insertion, deletion and substitution errors.
 
     Parameters
     ----------
-    reference : str, list or numpy array
+    reference : str, list, numpy array, pyarrow string array or TokenizedCorpus
         The ground truth transcription of a recorded speech or the expected output of a live speech.
-    hypothesis : str, list or numpy array
+    hypothesis : str, list, numpy array, pyarrow string array or TokenizedCorpus
         The text generated by a speech-to-text algorithm/system which will be compared to the reference text.
+    n_jobs : int or None, optional
+        The number of threads used to score a batch of reference and hypothesis texts. The default of 1 runs
+        serially, and -1 uses all available CPUs. Single strings are always scored on the calling thread.
+    columnar : bool, optional
+        If True, return the results as a dictionary of numpy arrays instead of a DataFrame, without creating any
+        per-row Python objects. The default is False.
+    normalize : bool, optional
+        If True, the reference and hypothesis texts are normalized while they are split into words, with the same
+        result as calling normalize on them first but without creating the normalized strings. The default is False.
+    return_type : {"dataframe", "numpy"}, optional
+        The type of the result. The default "dataframe" returns a DataFrame (or a dictionary with columnar). "numpy"
+        returns a NumPy structured array of the error counts, one record per sequence, which is a view of the
+        computed results rather than a copy. It cannot be combined with columnar.
 
     Raises
     ------
     ValueError
-        if the two input parameters do not contain the same amount of elements.
+        if the two input parameters do not contain the same amount of elements, if n_jobs is invalid, or if
+        return_type is not "dataframe" or "numpy" or is "numpy" with columnar.
     AttributeError
         if input text is not a string, list or np.ndarray data type.
     ZeroDivisionError
@@ -50,14 +75,41 @@ def summary(reference, hypothesis) -> pd.DataFrame | None:
             deleted_words - list of deleted words
             substituted_words - list of substitutions. Each substitution will be shown as a tuple with the reference
             word and the hypothesis word. For example: [(cited, sighted), (abnormally, normally)]
+    dict
+        If columnar is True, returns a dictionary of numpy arrays with one entry per sequence:
+            wer (float64), ld, m, insertions, deletions, substitutions (int32) - as above
+            vocabulary - array of the distinct words, indexed by token id
+            inserted_ids, deleted_ids - token ids of the inserted and deleted words of all sequences
+            substituted_ref_ids, substituted_hyp_ids - token ids of the reference and hypothesis word of each
+            substitution
+            inserted_offsets, deleted_offsets, substituted_offsets - the words of sequence i are stored between
+            offsets[i] and offsets[i + 1]
+    numpy.ndarray
+        If return_type is "numpy", returns a structured array with one record per sequence and the float64 fields
+        wer, ld, m, insertions, deletions and substitutions, as above. The word lists are not computed.
     """
     try:
+        check_return_type(return_type, ("dataframe", "numpy"))
         error_handler(reference, hypothesis)
-        result = metrics(reference, hypothesis)
+        if return_type == "numpy":
+            if columnar:
+                raise ValueError('return_type "numpy" cannot be combined with columnar.')
+            # The counts-only path gives the same counts without tracking the words
+            result = metrics_fast(reference, hypothesis, n_jobs=n_jobs, normalize=normalize)
+        else:
+            result = metrics(reference, hypothesis, n_jobs=n_jobs, columnar=columnar, normalize=normalize)
+        if normalize:
+            check_reference_words(reference, result)
     except (ValueError, AttributeError, ZeroDivisionError) as err:
         print(f"{type(err).__name__}: {str(err)}")
         return None
 
+    if return_type == "numpy":
+        return np.atleast_2d(result).view(_COUNTS_DTYPE)[:, 0]
+
+    if columnar:
+        return result
+
     # Batch rows (n, 9)
     if isinstance(result, np.ndarray) and result.ndim == 2:
         word_error_rate_breakdown = result.tolist()
@@ -78,5 +130,7 @@ def summary(reference, hypothesis) -> pd.DataFrame | None:
         "deleted_words",
         "substituted_words",
     ]
-    df = pd.DataFrame(word_error_rate_breakdown, columns=columns)
+    # pandas is slow to import, so it is only loaded when the first DataFrame is built
+    pandas = importlib.import_module("pandas")
+    df = pandas.DataFrame(word_error_rate_breakdown, columns=columns)
     return df
@@ -10,9 +10,9 @@ This module defines the following function:
     - summaryp(reference, hypothesis)
 """
 
+import importlib
 import numpy as np
-import pandas as pd
-from .errorhandler import error_handler
+from .errorhandler import check_reference_words, error_handler
 from .metrics import metrics
 
 
@@ -22,6 +22,9 @@ def summaryp(
     insertions_weight=1,
     deletions_weight=1,
     substitutions_weight=1,
+    n_jobs=1,
+    weighted_alignment=False,
+    normalize=False,
 ):
     """
     This function provides a comprehensive breakdown of the calculated results including the WER, weighted
@@ -29,9 +32,9 @@ def summaryp(
 
     Parameters
     ----------
-    reference : str, list or numpy array
+    reference : str, list, numpy array, pyarrow string array or TokenizedCorpus
         The ground truth transcription of a recorded speech or the expected output of a live speech.
-    hypothesis : str, list or numpy array
+    hypothesis : str, list, numpy array, pyarrow string array or TokenizedCorpus
         The text generated by a speech-to-text algorithm/system which will be compared to the reference text.
     insertions_weight: int or float, optional
         The weight multiplier for an insertion error
@@ -39,11 +42,23 @@ def summaryp(
         The weight multiplier for a deletion error
     substitutions_weight: int or float, optional
         The weight multiplier for a substitution error
+    n_jobs : int or None, optional
+        The number of threads used to score a batch of reference and hypothesis texts. The default of 1 runs
+        serially, and -1 uses all available CPUs. Single strings are always scored on the calling thread.
+    weighted_alignment : bool, optional
+        If True, the words are aligned so that the weighted cost of the errors is as small as possible, rather than
+        the number of errors. The default of False weights the errors of the standard (minimum edit distance)
+        alignment. A weighted alignment requires non-negative weights. It changes the insertions, deletions,
+        substitutions, word lists and werp columns, while wer and ld remain the Levenshtein distance.
+    normalize : bool, optional
+        If True, the reference and hypothesis texts are normalized while they are split into words, with the same
+        result as calling normalize on them first but without creating the normalized strings. The default is False.
 
     Raises
     ------
     ValueError
-        if the two input parameters do not contain the same amount of elements.
+        if the two input parameters do not contain the same amount of elements, if n_jobs is invalid, or if a weight
+        is negative with weighted_alignment.
     AttributeError
         if input text is not a string, list or np.ndarray data type.
     ZeroDivisionError
@@ -67,7 +82,15 @@ def summaryp(
     """
     try:
         error_handler(reference, hypothesis)
-        result = metrics(reference, hypothesis)
+        result = metrics(
+            reference,
+            hypothesis,
+            n_jobs=n_jobs,
+            weights=(insertions_weight, deletions_weight, substitutions_weight) if weighted_alignment else None,
+            normalize=normalize,
+        )
+        if normalize:
+            check_reference_words(reference, result)
     except (ValueError, AttributeError, ZeroDivisionError) as err:
         print(f"{type(err).__name__}: {str(err)}")
         return None
@@ -104,7 +127,9 @@ def summaryp(
         "deleted_words",
         "substituted_words",
     ]
-    df = pd.DataFrame(word_error_rate_breakdown, columns=columns)
+    # pandas is slow to import, so it is only loaded when the first DataFrame is built
+    pandas = importlib.import_module("pandas")
+    df = pandas.DataFrame(word_error_rate_breakdown, columns=columns)
     df["werp"] = werps_result
     df = df[
         [
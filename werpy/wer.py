@@ -7,30 +7,37 @@ text. The WER is calculated as the number of edits (insertions, deletions, and s
 the hypothesis text into the reference text, divided by the number of words in the reference text.
 
 This module defines the following function:
-    - wer(reference, hypothesis): Calculate the WER between a reference text and a hypothesis text.
+    - wer(reference, hypothesis, n_jobs=1, normalize=False): Calculate the WER between a reference text and a
+      hypothesis text.
 """
 
 import numpy as np
-from .errorhandler import error_handler
+from .errorhandler import check_reference_words, error_handler
 from .metrics import metrics_wer_only
 
 
-def wer(reference, hypothesis) -> float | np.float64 | None:
+def wer(reference, hypothesis, n_jobs=1, normalize=False) -> float | np.float64 | None:
     """
     This function will calculate the overall Word Error Rate for the entire reference and hypothesis texts 
     (i.e., the full corpus).
 
     Parameters
     ----------
-    reference : str, list or numpy array
+    reference : str, list, numpy array, pyarrow string array or TokenizedCorpus
         The ground truth transcription of a recorded speech or the expected output of a live speech.
-    hypothesis : str, list or numpy array
+    hypothesis : str, list, numpy array, pyarrow string array or TokenizedCorpus
         The text generated by a speech-to-text algorithm/system which will be compared to the reference text.
+    n_jobs : int or None, optional
+        The number of threads used to score a batch of reference and hypothesis texts. The default of 1 runs
+        serially, and -1 uses all available CPUs. Single strings are always scored on the calling thread.
+    normalize : bool, optional
+        If True, the reference and hypothesis texts are normalized while they are split into words, with the same
+        result as calling normalize on them first but without creating the normalized strings. The default is False.
 
     Raises
     ------
     ValueError
-        if the two input parameters do not contain the same amount of elements.
+        if the two input parameters do not contain the same amount of elements, or if n_jobs is invalid.
     AttributeError
         if input text is not a string, list or np.ndarray data type.
     ZeroDivisionError
@@ -57,7 +64,9 @@ def wer(reference, hypothesis) -> float | np.float64 | None:
     """
     try:
         error_handler(reference, hypothesis)
-        result = metrics_wer_only(reference, hypothesis)
+        result = metrics_wer_only(reference, hypothesis, n_jobs=n_jobs, normalize=normalize)
+        if normalize:
+            check_reference_words(reference, result)
     except (ValueError, AttributeError, ZeroDivisionError) as err:
         print(f"{type(err).__name__}: {str(err)}")
         return None
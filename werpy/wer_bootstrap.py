@@ -0,0 +1,138 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This module provides bootstrap confidence intervals for the corpus-level Word Error Rate (WER), for example to decide
+whether the difference between two models is larger than the sampling noise of the test set.
+
+This module defines the following function:
+    - wer_bootstrap(reference, hypothesis, n_resamples=1000, confidence_level=0.95, seed=None)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from .errorhandler import check_reference_words, error_handler
+from .metrics import _resolve_n_jobs, metrics_wer_only
+
+# Upper bound on the multinomial counts drawn at once, which sets how many replicates share a chunk
+_CHUNK_CELLS = 1 << 22
+
+
+def wer_bootstrap(
+    reference, hypothesis, n_resamples=1000, confidence_level=0.95, seed=None, n_jobs=1, normalize=False
+):
+    """
+    This function calculates a bootstrap confidence interval for the Word Error Rate of the entire reference and
+    hypothesis texts. The pairs of texts are resampled with replacement n_resamples times and the corpus WER of each
+    resample is calculated, without scoring any text more than once.
+
+    Parameters
+    ----------
+    reference : list, numpy array, pyarrow string array or TokenizedCorpus
+        The ground truth transcriptions of recorded speech or the expected outputs of live speech.
+    hypothesis : list, numpy array, pyarrow string array or TokenizedCorpus
+        The texts generated by a speech-to-text algorithm/system which will be compared to the reference texts.
+    n_resamples : int, optional
+        The number of bootstrap resamples. The default is 1000.
+    confidence_level : float, optional
+        The confidence level of the interval, between 0 and 1. The default is 0.95.
+    seed : int, numpy.random.SeedSequence or None, optional
+        The seed of the random resampling. The same seed gives the same result, whatever the value of n_jobs. The
+        default of None draws a fresh seed.
+    n_jobs : int or None, optional
+        The number of threads used to score the texts and to draw the resamples. The default of 1 runs serially, and
+        -1 uses all available CPUs.
+    normalize : bool, optional
+        If True, the reference and hypothesis texts are normalized while they are split into words, with the same
+        result as calling normalize on them first but without creating the normalized strings. The default is False.
+
+    Raises
+    ------
+    ValueError
+        if the two input parameters do not contain the same amount of elements, if n_resamples is not a positive
+        integer, if confidence_level is not between 0 and 1, or if n_jobs is invalid.
+    AttributeError
+        if input text is not a string, list or np.ndarray data type.
+    ZeroDivisionError
+        if input in reference is blank or both reference and hypothesis are empty.
+
+    Returns
+    -------
+    dict
+        A dictionary with the following entries:
+            wer - the Word Error Rate of the texts, as returned by wer()
+            low, high - the bounds of the percentile bootstrap confidence interval
+            standard_error - the standard deviation of the bootstrap Word Error Rates
+            replicates - a numpy array of the n_resamples bootstrap Word Error Rates
+
+    Notes
+    -----
+    The WER of a resample only depends on how many times each distinct pair of Levenshtein distance and reference
+    length is drawn. Each resample is therefore drawn as a single multinomial sample over those distinct pairs, which
+    has exactly the distribution of drawing the texts with replacement, but costs time in the number of distinct
+    pairs rather than in the number of texts.
+
+    Examples
+    --------
+    >>> ref = ['i love cold pizza', 'the sugar bear character was popular', 'it blocked sight lines of central park']
+    >>> hyp = ['i love pizza', 'the sugar bare character was popular', 'it blocked sightlines of central park']
+    >>> result = wer_bootstrap(ref, hyp, n_resamples=2000, seed=0)
+    >>> print(round(result['wer'], 4), result['low'] <= result['wer'] <= result['high'])
+    0.2353 True
+    """
+    try:
+        error_handler(reference, hypothesis)
+        if isinstance(n_resamples, bool) or not isinstance(n_resamples, (int, np.integer)) or n_resamples < 1:
+            raise ValueError("n_resamples must be a positive integer.")
+        if not 0 < confidence_level < 1:
+            raise ValueError("confidence_level must be between 0 and 1.")
+        n_threads = _resolve_n_jobs(n_jobs)
+        result = np.atleast_2d(metrics_wer_only(reference, hypothesis, n_jobs=n_jobs, normalize=normalize))
+        if normalize:
+            check_reference_words(reference, result)
+        if len(result) == 0:
+            raise ValueError("At least one reference and hypothesis text is required.")
+
+        # Distinct (ld, m) pairs and how often each occurs, from one integer key per text
+        ld = result[:, 1].astype(np.int64)
+        m = result[:, 2].astype(np.int64)
+        base = int(m.max()) + 1
+        keys, occurrences = np.unique(ld * base + m, return_counts=True)
+        pairs = np.column_stack((keys // base, keys % base)).astype(np.float64)
+        probabilities = occurrences / len(result)
+
+        # Fixed chunks of replicates, each with its own random stream, so the result does not depend on n_threads
+        chunk = int(min(max(_CHUNK_CELLS // len(keys), 1), n_resamples))
+        starts = range(0, n_resamples, chunk)
+        streams = np.random.SeedSequence(seed).spawn(len(starts))
+        replicates = np.empty(n_resamples, dtype=np.float64)
+
+        def draw(i):
+            stop = min(starts[i] + chunk, n_resamples)
+            counts = np.random.default_rng(streams[i]).multinomial(len(result), probabilities, size=stop - starts[i])
+            totals = counts @ pairs
+            out = replicates[starts[i] : stop]
+            out[:] = 0.0
+            np.divide(totals[:, 0], totals[:, 1], out=out, where=totals[:, 1] != 0)
+
+        if n_threads == 1 or len(starts) == 1:
+            for i in range(len(starts)):
+                draw(i)
+        else:
+            with ThreadPoolExecutor(max_workers=min(n_threads, len(starts))) as executor:
+                list(executor.map(draw, range(len(starts))))
+
+        den = np.sum(result[:, 2])
+        alpha = 1.0 - confidence_level
+        low, high = np.quantile(replicates, [alpha / 2, 1.0 - alpha / 2])
+        return {
+            "wer": float(np.sum(result[:, 1]) / den) if den else 0.0,
+            "low": float(low),
+            "high": float(high),
+            "standard_error": float(np.std(replicates, ddof=1)) if n_resamples > 1 else 0.0,
+            "replicates": replicates,
+        }
+    except (ValueError, TypeError, AttributeError, ZeroDivisionError) as err:
+        print(f"{type(err).__name__}: {str(err)}")
+        return None
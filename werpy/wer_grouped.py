@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This module provides a function for calculating the corpus-level Word Error Rate of every group of a batch of
+reference and hypothesis texts, for example per speaker, per accent or per dataset split, from a single scoring pass.
+
+This module defines the following function:
+    - wer_grouped(reference, hypothesis, group_by)
+"""
+
+import numpy as np
+from .errorhandler import check_reference_words, error_handler
+from .metrics import metrics_fast
+
+# Columns of the (n, 6) metrics_fast rows that are summed per group
+_TOTALS = (("ld", 1), ("m", 2), ("insertions", 3), ("deletions", 4), ("substitutions", 5))
+
+
+def wer_grouped(
+    reference,
+    hypothesis,
+    group_by,
+    insertions_weight=1,
+    deletions_weight=1,
+    substitutions_weight=1,
+    n_jobs=1,
+    normalize=False,
+):
+    """
+    This function calculates the Word Error Rate and the weighted Word Error Rate of each group of reference and
+    hypothesis texts, where the group of each pair is given by a key. All the texts are scored once, and the error
+    counts are then summed per group, so a result covering thousands of groups costs little more than wer().
+
+    Parameters
+    ----------
+    reference : list, numpy array, pyarrow string array or TokenizedCorpus
+        The ground truth transcriptions of recorded speech or the expected outputs of live speech.
+    hypothesis : list, numpy array, pyarrow string array or TokenizedCorpus
+        The texts generated by a speech-to-text algorithm/system which will be compared to the reference texts.
+    group_by : list or numpy array
+        One key per reference and hypothesis text, such as integer ids or string labels.
+    insertions_weight: int or float, optional
+        The weight multiplier for an insertion error in the weighted Word Error Rate
+    deletions_weight: int or float, optional
+        The weight multiplier for a deletion error in the weighted Word Error Rate
+    substitutions_weight: int or float, optional
+        The weight multiplier for a substitution error in the weighted Word Error Rate
+    n_jobs : int or None, optional
+        The number of threads used to score a batch of reference and hypothesis texts. The default of 1 runs
+        serially, and -1 uses all available CPUs.
+    normalize : bool, optional
+        If True, the reference and hypothesis texts are normalized while they are split into words, with the same
+        result as calling normalize on them first but without creating the normalized strings. The default is False.
+
+    Raises
+    ------
+    ValueError
+        if the two input parameters do not contain the same amount of elements, if group_by does not hold one key
+        per text, or if n_jobs is invalid.
+    AttributeError
+        if input text is not a string, list or np.ndarray data type.
+    ZeroDivisionError
+        if input in reference is blank or both reference and hypothesis are empty.
+
+    Returns
+    -------
+    dict
+        A dictionary of numpy arrays with one entry per group, in sorted key order:
+            groups - the distinct keys of group_by
+            wer - the Word Error Rate of the group, as returned by wer() for its texts
+            werp - the weighted Word Error Rate of the group, as returned by werp() for its texts
+            ld - the sum of the Levenshtein distances
+            m - the number of words in the references
+            insertions, deletions, substitutions - the number of errors of each type
+            count - the number of reference and hypothesis texts
+
+    Examples
+    --------
+    >>> ref = ['i love cold pizza', 'the sugar bear character was popular', 'it blocked sight lines of central park']
+    >>> hyp = ['i love pizza', 'the sugar bare character was popular', 'it blocked sightlines of central park']
+    >>> result = wer_grouped(ref, hyp, ['alice', 'bob', 'alice'])
+    >>> print(result['groups'], result['wer'])
+    ['alice' 'bob'] [0.27272727 0.16666667]
+    """
+    try:
+        error_handler(reference, hypothesis)
+        keys = np.asarray(group_by)
+        result = np.atleast_2d(metrics_fast(reference, hypothesis, n_jobs=n_jobs, normalize=normalize))
+        if normalize:
+            check_reference_words(reference, result)
+        if keys.ndim != 1 or len(keys) != len(result):
+            raise ValueError("group_by must hold one key per reference and hypothesis text.")
+
+        # Non-negative integer keys are used as bins directly, without sorting; other keys are numbered by
+        # np.unique, which raises a TypeError for keys that cannot be ordered, such as a mix of str and None
+        if keys.dtype.kind in "iu" and len(keys) and keys.min() >= 0 and keys.max() <= 2 * len(keys):
+            count = np.bincount(keys)
+            groups = np.flatnonzero(count)
+            inverse = keys
+        else:
+            groups, inverse = np.unique(keys, return_inverse=True)
+            count = np.bincount(inverse, minlength=len(groups))
+    except (ValueError, TypeError, AttributeError, ZeroDivisionError) as err:
+        print(f"{type(err).__name__}: {str(err)}")
+        return None
+    n_bins = len(count)
+
+    out = {"groups": groups}
+    totals = {
+        name: np.bincount(inverse, weights=result[:, column], minlength=n_bins) for name, column in _TOTALS
+    }
+    weighted_errors = (
+        totals["insertions"] * insertions_weight
+        + totals["deletions"] * deletions_weight
+        + totals["substitutions"] * substitutions_weight
+    )
+    m = totals["m"]
+    mask = m != 0
+    out["wer"] = np.zeros(n_bins, dtype=np.float64)
+    out["wer"][mask] = totals["ld"][mask] / m[mask]
+    out["werp"] = np.zeros(n_bins, dtype=np.float64)
+    out["werp"][mask] = weighted_errors[mask] / m[mask]
+    for name, _ in _TOTALS:
+        out[name] = totals[name].astype(np.int64)
+    out["count"] = count
+
+    # Drop the empty bins of integer keys
+    if len(groups) != n_bins:
+        for name in out:
+            if name != "groups":
+                out[name] = out[name][groups]
+    return out
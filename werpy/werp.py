@@ -10,7 +10,7 @@ This module defines the following function:
 """
 
 import numpy as np
-from .errorhandler import error_handler
+from .errorhandler import check_reference_words, error_handler
 from .metrics import metrics_fast
 
 
@@ -20,6 +20,9 @@ def werp(
     insertions_weight=1,
     deletions_weight=1,
     substitutions_weight=1,
+    n_jobs=1,
+    weighted_alignment=False,
+    normalize=False,
 ):
     """
     This function calculates a weighted Word Error Rate for the entire reference and hypothesis texts. It allows the
@@ -27,9 +30,9 @@ def werp(
 
     Parameters
     ----------
-    reference : str, list or numpy array
+    reference : str, list, numpy array, pyarrow string array or TokenizedCorpus
         The ground truth transcription of a recorded speech or the expected output of a live speech.
-    hypothesis : str, list or numpy array
+    hypothesis : str, list, numpy array, pyarrow string array or TokenizedCorpus
         The text generated by a speech-to-text algorithm/system which will be compared to the reference text.
     insertions_weight: int or float, optional
         The weight multiplier for an insertion error
@@ -37,11 +40,22 @@ def werp(
         The weight multiplier for a deletion error
     substitutions_weight: int or float, optional
         The weight multiplier for a substitution error
+    n_jobs : int or None, optional
+        The number of threads used to score a batch of reference and hypothesis texts. The default of 1 runs
+        serially, and -1 uses all available CPUs. Single strings are always scored on the calling thread.
+    weighted_alignment : bool, optional
+        If True, the words are aligned so that the weighted cost of the errors is as small as possible, rather than
+        the number of errors. The default of False weights the errors of the standard (minimum edit distance)
+        alignment. A weighted alignment requires non-negative weights.
+    normalize : bool, optional
+        If True, the reference and hypothesis texts are normalized while they are split into words, with the same
+        result as calling normalize on them first but without creating the normalized strings. The default is False.
 
     Raises
     ------
     ValueError
-        if the two input parameters do not contain the same amount of elements.
+        if the two input parameters do not contain the same amount of elements, if n_jobs is invalid, or if a weight
+        is negative with weighted_alignment.
     AttributeError
         if input text is not a string, list or np.ndarray data type.
     ZeroDivisionError
@@ -72,10 +86,22 @@ def werp(
     >>> werp_example_4 = werp(ref, hyp, 0.5, 0.5, 1)
     >>> print(werp_example_4)
     0.25
+
+    >>> werp_example_5 = werp(ref, hyp, substitutions_weight=3, weighted_alignment=True)
+    >>> print(werp_example_5)
+    0.5
     """
     try:
         error_handler(reference, hypothesis)
-        result = metrics_fast(reference, hypothesis)
+        result = metrics_fast(
+            reference,
+            hypothesis,
+            n_jobs=n_jobs,
+            weights=(insertions_weight, deletions_weight, substitutions_weight) if weighted_alignment else None,
+            normalize=normalize,
+        )
+        if normalize:
+            check_reference_words(reference, result)
     except (ValueError, AttributeError, ZeroDivisionError) as err:
         print(f"{type(err).__name__}: {str(err)}")
         return None
@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2023 Analytics in Motion <https://www.analyticsinmotion.com>
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This module provides a function for calculating weighted Word Error Rates for many weight configurations at once,
+for example to tune the weights of werp or werps with a grid search.
+
+This module defines the following function:
+    - werp_sweep(reference, hypothesis, weights)
+"""
+
+import numpy as np
+from .errorhandler import check_reference_words, error_handler
+from .metrics import metrics_fast
+
+
+def werp_sweep(reference, hypothesis, weights, per_sequence=False, n_jobs=1, normalize=False):
+    """
+    This function calculates the weighted Word Error Rate for each row of a matrix of insertion, deletion and
+    substitution weights. The reference and hypothesis texts are aligned only once, and all the weight
+    configurations are then applied to the error counts with a single matrix product.
+
+    Parameters
+    ----------
+    reference : str, list, numpy array, pyarrow string array or TokenizedCorpus
+        The ground truth transcription of a recorded speech or the expected output of a live speech.
+    hypothesis : str, list, numpy array, pyarrow string array or TokenizedCorpus
+        The text generated by a speech-to-text algorithm/system which will be compared to the reference text.
+    weights : array_like of shape (k, 3)
+        One weight configuration per row, holding the insertion, deletion and substitution weights in that order.
+    per_sequence : bool, optional
+        If True, return the weighted Word Error Rate of each reference and hypothesis text instead of the weighted
+        Word Error Rate for the entire texts.
+    n_jobs : int or None, optional
+        The number of threads used to score a batch of reference and hypothesis texts. The default of 1 runs
+        serially, and -1 uses all available CPUs. Single strings are always scored on the calling thread.
+    normalize : bool, optional
+        If True, the reference and hypothesis texts are normalized while they are split into words, with the same
+        result as calling normalize on them first but without creating the normalized strings. The default is False.
+
+    Raises
+    ------
+    ValueError
+        if the two input parameters do not contain the same amount of elements, if n_jobs is invalid, or if weights
+        is not a (k, 3) matrix of numbers.
+    AttributeError
+        if input text is not a string, list or np.ndarray data type.
+    ZeroDivisionError
+        if input in reference is blank or both reference and hypothesis are empty.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of k weighted Word Error Rates, one per row of weights, matching the result of werp with those
+        weights. With per_sequence=True, an (n, k) array whose rows are the results of werps for each of the n
+        reference and hypothesis texts (a single pair of strings gives one row).
+
+    Notes
+    -----
+    The weights are applied to the errors of the standard alignment, as in werp and werps with the default
+    weighted_alignment=False. A weighted alignment depends on the weights, so it cannot be shared across them.
+
+    Examples
+    --------
+    >>> ref = ['it blocked sight lines of central park', 'her father was an alderman in the city government']
+    >>> hyp = ['it blocked sightlines of central park', 'our father was an elder man in the city government']
+    >>> weights = [[1, 1, 1], [0.5, 0.5, 1]]
+
+    >>> werp_sweep_example_1 = werp_sweep(ref, hyp, weights)
+    >>> print(werp_sweep_example_1)
+    [0.3125  0.25  ]
+
+    >>> werp_sweep_example_2 = werp_sweep(ref, hyp, weights, per_sequence=True)
+    >>> print(werp_sweep_example_2)
+    [[0.28571429 0.21428571]
+     [0.33333333 0.27777778]]
+    """
+    try:
+        error_handler(reference, hypothesis)
+        weight_matrix = np.asarray(weights, dtype=np.float64)
+        if weight_matrix.ndim != 2 or weight_matrix.shape[1] != 3:
+            raise ValueError("weights must be a (k, 3) matrix of insertion, deletion and substitution weights.")
+        result = np.atleast_2d(metrics_fast(reference, hypothesis, n_jobs=n_jobs, normalize=normalize))
+        if normalize:
+            check_reference_words(reference, result)
+    except (ValueError, TypeError, AttributeError, ZeroDivisionError) as err:
+        print(f"{type(err).__name__}: {str(err)}")
+        return None
+
+    # (n, 3) counts of insertions, deletions and substitutions, then (n, k) weighted errors
+    counts = result[:, 3:6]
+    m = result[:, 2]
+    if not per_sequence:
+        den = np.sum(m)
+        if not den:
+            return np.zeros(len(weight_matrix), dtype=np.float64)
+        return (np.sum(counts, axis=0) @ weight_matrix.T) / den
+
+    weighted_errors = counts @ weight_matrix.T
+    out = np.zeros_like(weighted_errors)
+    mask = m != 0
+    out[mask] = weighted_errors[mask] / m[mask, None]
+    return out
@@ -10,7 +10,7 @@ This module defines the following function:
 """
 
 import numpy as np
-from .errorhandler import error_handler
+from .errorhandler import check_reference_words, check_return_type, error_handler
 from .metrics import metrics_fast
 
 
@@ -20,6 +20,10 @@ def werps(
     insertions_weight=1,
     deletions_weight=1,
     substitutions_weight=1,
+    n_jobs=1,
+    weighted_alignment=False,
+    normalize=False,
+    return_type="list",
 ):
     """
     This function calculates a list of weighted Word Error Rates for each of the reference and hypothesis texts. It
@@ -27,9 +31,9 @@ def werps(
 
     Parameters
     ----------
-    reference : str, list or numpy array
+    reference : str, list, numpy array, pyarrow string array or TokenizedCorpus
         The ground truth transcription of a recorded speech or the expected output of a live speech.
-    hypothesis : str, list or numpy array
+    hypothesis : str, list, numpy array, pyarrow string array or TokenizedCorpus
         The text generated by a speech-to-text algorithm/system which will be compared to the reference text.
     insertions_weight: int or float, optional
         The weight multiplier for an insertion error
@@ -37,11 +41,25 @@ def werps(
         The weight multiplier for a deletion error
     substitutions_weight: int or float, optional
         The weight multiplier for a substitution error
+    n_jobs : int or None, optional
+        The number of threads used to score a batch of reference and hypothesis texts. The default of 1 runs
+        serially, and -1 uses all available CPUs. Single strings are always scored on the calling thread.
+    weighted_alignment : bool, optional
+        If True, the words are aligned so that the weighted cost of the errors is as small as possible, rather than
+        the number of errors. The default of False weights the errors of the standard (minimum edit distance)
+        alignment. A weighted alignment requires non-negative weights.
+    normalize : bool, optional
+        If True, the reference and hypothesis texts are normalized while they are split into words, with the same
+        result as calling normalize on them first but without creating the normalized strings. The default is False.
+    return_type : {"list", "numpy"}, optional
+        The type of the result for a batch. The default "list" returns a list of floats. "numpy" returns a float64
+        NumPy array instead, namely the array the weighted rates are computed in, with no conversion to a list.
 
     Raises
     ------
     ValueError
-        if the two input parameters do not contain the same amount of elements.
+        if the two input parameters do not contain the same amount of elements, if n_jobs is invalid, if a weight
+        is negative with weighted_alignment, or if return_type is not "list" or "numpy".
     AttributeError
         if input text is not a string, list or np.ndarray data type.
     ZeroDivisionError
@@ -49,10 +67,10 @@ def werps(
 
     Returns
     -------
-    float or list
+    float, list or numpy array
         This function will return either a single weighted Word Error Rate (if the input is a pair of strings) or a
         list of weighted Word Error Rates (if the input is a pair of lists) for each of the reference and hypothesis
-        texts.
+        texts, or a NumPy array of them if return_type is "numpy".
 
     Examples
     --------
@@ -68,8 +86,17 @@ def werps(
     [0.21428571428571427, 0.2777777777777778]
     """
     try:
+        check_return_type(return_type)
         error_handler(reference, hypothesis)
-        result = metrics_fast(reference, hypothesis)
+        result = metrics_fast(
+            reference,
+            hypothesis,
+            n_jobs=n_jobs,
+            weights=(insertions_weight, deletions_weight, substitutions_weight) if weighted_alignment else None,
+            normalize=normalize,
+        )
+        if normalize:
+            check_reference_words(reference, result)
     except (ValueError, AttributeError, ZeroDivisionError) as err:
         print(f"{type(err).__name__}: {str(err)}")
         return None
@@ -84,7 +111,7 @@ def werps(
         out = np.zeros_like(weighted_errors, dtype=np.float64)
         mask = m != 0
         out[mask] = weighted_errors[mask] / m[mask]
-        return out.tolist()
+        return out if return_type == "numpy" else out.tolist()
 
     # Single: (6,) float64
     if isinstance(result, np.ndarray) and getattr(result, "ndim", 0) == 0:
@@ -6,29 +6,43 @@ This module provides a function for calculating a list of the Word Error Rates f
 hypothesis texts.
 
 This module defines the following function:
-    - wers(reference, hypothesis)
+    - wers(reference, hypothesis, max_wer=None, n_jobs=1, normalize=False, return_type="list")
 """
 
 import numpy as np
-from .errorhandler import error_handler
+from .errorhandler import check_reference_words, check_return_type, error_handler
 from .metrics import metrics_wer_only
 
 
-def wers(reference, hypothesis):
+def wers(reference, hypothesis, max_wer=None, n_jobs=1, normalize=False, return_type="list"):
     """
     This function calculates a list of the Word Error Rates for each of the reference and hypothesis texts.
 
     Parameters
     ----------
-    reference : str, list or numpy array
+    reference : str, list, numpy array, pyarrow string array or TokenizedCorpus
         The ground truth transcription of a recorded speech or the expected output of a live speech.
-    hypothesis : str, list or numpy array
+    hypothesis : str, list, numpy array, pyarrow string array or TokenizedCorpus
         The text generated by a speech-to-text algorithm/system which will be compared to the reference text.
+    max_wer : int or float, optional
+        An optional Word Error Rate cutoff. When set, each pair is only scored exactly if its WER is at or below
+        the cutoff. Pairs above the cutoff stop early and are reported as ``inf``. This is useful for filtering
+        data, as a banded calculation limited to ``floor(max_wer * m)`` edits is much cheaper on long, noisy pairs.
+    n_jobs : int or None, optional
+        The number of threads used to score a batch of reference and hypothesis texts. The default of 1 runs
+        serially, and -1 uses all available CPUs. Single strings are always scored on the calling thread.
+    normalize : bool, optional
+        If True, the reference and hypothesis texts are normalized while they are split into words, with the same
+        result as calling normalize on them first but without creating the normalized strings. The default is False.
+    return_type : {"list", "numpy"}, optional
+        The type of the result for a batch. The default "list" returns a list of floats. "numpy" returns a float64
+        NumPy array instead: the WER column of the batch results as a strided view, with no per-sequence floats.
 
     Raises
     ------
     ValueError
-        if the two input parameters do not contain the same amount of elements.
+        if the two input parameters do not contain the same amount of elements, if max_wer is negative, if n_jobs is
+        invalid, or if return_type is not "list" or "numpy".
     AttributeError
         if input text is not a string, list or np.ndarray data type.
     ZeroDivisionError
@@ -36,9 +50,11 @@ def wers(reference, hypothesis):
 
     Returns
     -------
-    float or list
+    float, list or numpy array
         This function will return either a single Word Error Rate (if the input is a pair of strings) or a list of Word
-        Error Rates (if the input is a pair of lists) for each of the reference and hypothesis texts.
+        Error Rates (if the input is a pair of lists) for each of the reference and hypothesis texts, or a NumPy array
+        of them if return_type is "numpy". If max_wer is set, any Word Error Rate above the cutoff is returned as
+        ``inf``.
 
     Example
     --------
@@ -47,17 +63,29 @@ def wers(reference, hypothesis):
     >>> wers_example_1 = wers(ref, hyp)
     >>> print(wers_example_1)
     [0.0, 0.2]
+
+    >>> wers_example_2 = wers(ref, hyp, max_wer=0.1)
+    >>> print(wers_example_2)
+    [0.0, inf]
+
+    >>> wers_example_3 = wers(ref, hyp, return_type="numpy")
+    >>> print(wers_example_3)
+    [0.  0.2]
     """
     try:
+        check_return_type(return_type)
         error_handler(reference, hypothesis)
-        result = metrics_wer_only(reference, hypothesis)
+        result = metrics_wer_only(reference, hypothesis, max_wer, n_jobs, normalize=normalize)
+        if normalize:
+            check_reference_words(reference, result)
     except (ValueError, AttributeError, ZeroDivisionError) as err:
         print(f"{type(err).__name__}: {str(err)}")
         return None
 
     # Batch: (n, 3) float64, columns [wer, ld, m]
     if isinstance(result, np.ndarray) and result.ndim == 2:
-        return result[:, 0].tolist()  # Return wer column
+        # Return wer column, as a strided view of the results for numpy
+        return result[:, 0] if return_type == "numpy" else result[:, 0].tolist()
 
     # Single: (3,) float64, WER is at index 0
     if isinstance(result, np.ndarray) and getattr(result, "ndim", 0) == 0: